@@ -9,8 +9,14 @@ Animation stops at four cardinal points of oscillation on mouse clicks.
 
 import numpy as np
 import matplotlib.pyplot as plt
-import matplotlib.animation as animation
 import argparse
+import sys
+import os
+
+# Make shared phy315 package importable
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from phy315.animation import Player
+from phy315.trace import Trace
 
 # Set physical parameters:
 #   k   - spring constant (newton/meter)
@@ -29,24 +35,11 @@ A   = 2
 w = np.sqrt(k/m)
  
 # Set simulation parameters:
-#   counter - current time
-#   tt      - time array
-#   xx      - coordinate of center of mass array
-#   vv      - velocity of center of mass array
-#   aa      - acceleration of center of mass array
-
-counter =  0
-tt      = [0]
-xx      = [0]
-vv      = [0]
-aa      = [0]
+#   dt   - time step (second)
+#   tmax - time window of velocity and acceleration plots (second)
 
-# Setup plotting space
-fig = plt.figure(figsize=(7,7))
-ax1 = fig.add_subplot(1,1,1)
-ax2 = fig.add_subplot(2,1,1)
-ax3 = fig.add_subplot(3,1,1)
-fig.subplots_adjust(hspace=.45)
+dt   = 0.075
+tmax = 15.
 
 # Function to return coordinate of center of mass
 def fun(t):
@@ -77,106 +70,102 @@ def position(x):
     
     return [p1, p2, p3, p4]
 
-# Function to capture mouse clicks
-#   pause = 0 - run simulation
-#   pause = 1 - w*t-phi = 0
-#   pause = 2 - w*t-phi = pi/2
-#   pause = 3 - w*t-phi = pi
-#   pause = 4 - w*t-phi = 3*pi/2
+# Setup plotting space
+fig = plt.figure(figsize=(7,7))
+fig.subplots_adjust(hspace=.45)
 
-pause = 0
-def onClick(event):
-    global pause
-
-    if pause < 4:
-        pause += 1
-    else:
-        pause = 0
-
-# Animation function
-def animate(i):
-    global counter, tt, xx, A, vv, aa, pause
-    ax3.clear()
-
-    #
-    # Generate mass-spring animation plot
-    #
-    plt.subplot(311)
-    plt.xlim(-3.5, 3.5)
-    plt.ylim(-2, 2)
-    plt.xlabel("Displacement (m)")
-    plt.title("m = 20 kg  k = 100 N/m  a = 2 m  phi = pi/3")
-    cur_axes = plt.gca()
-    cur_axes.axes.get_yaxis().set_visible(False)
+#
+# Generate mass-spring animation plot
+#
+ax1 = plt.subplot(311)
+plt.xlim(-3.5, 3.5)
+plt.ylim(-2, 2)
+plt.xlabel("Displacement (m)")
+plt.title("m = 20 kg  k = 100 N/m  a = 2 m  phi = pi/3")
+ax1.get_yaxis().set_visible(False)
+
+mass,   = plt.plot([], [], lw=5, color="blue")
+spring, = plt.plot([], [], color="red", ls=":", lw=5)
+center, = plt.plot([], [], 'o', color="black")
+
+#
+# Generate velocity plot
+#
+ax2 = plt.subplot(312)
+plt.ylabel("Velocity (m/s)")
+plt.xlabel("Time (s)")
+plt.ylim(-A*w-0.5, A*w+0.5)
+plt.axhline(y=0., lw=0.5, color="black")
+
+velocity, = plt.plot([], [], lw=1, color="green")
+vv = Trace(ax2, tmax, dt)
+
+#
+# Generate acceleration plot
+#
+ax3 = plt.subplot(313)
+plt.ylabel("Acceleration (m/s^2)")
+plt.xlabel("Time (s)")
+plt.ylim(-A*w**2-0.5, A*w**2+0.5)
+plt.axhline(y=0., lw=0.5, color="black")
+
+accel, = plt.plot([], [], lw=1, color="green")
+aa = Trace(ax3, tmax, dt)
+
+# Function to return mass, spring, center of mass, velocity and
+# acceleration plots at time t
+def state(t):
+    global vv, aa
 
     # Get coordinates of mass corners
-    p1 = [position(fun(counter))[0][0], position(fun(counter))[0][1]]
-    p2 = [position(fun(counter))[1][0], position(fun(counter))[1][1]]
-    p3 = [position(fun(counter))[2][0], position(fun(counter))[2][1]]
-    p4 = [position(fun(counter))[3][0], position(fun(counter))[3][1]]
+    p1, p2, p3, p4 = position(fun(t))
 
     x     = [p1[0], p2[0], p3[0], p4[0], p1[0]]
     y     = [p1[1], p2[1], p3[1], p4[1], p1[1]]
     linex = [-4, p1[0]]
     liney = [0, 0]
 
-    # Plot mass
-    plt.plot(x, y, lw=5, color="blue")
-
-    # Plot spring
-    plt.plot(linex, liney, color="red", ls=":", lw=5)
-
-    # Plot center of mass
-    data_x = [fun(counter)]
-    data_y = [0.]
-    plt.plot(data_x, data_y, 'o', color="black")
-
-    #
-    # Generate velocity plot
-    #
-    plt.subplot(312)
-    tt.append(counter)
-    vv.append(vel(counter))
-    plt.ylabel("Velocity (m/s)")
-    plt.xlabel("Time (s)")
-    plt.xlim(0,15)
-    plt.ylim(-A*w-0.5, A*w+0.5)
-    plt.plot(tt, vv, lw=1, color="green")
-    plt.plot([0,15], [0,0], lw=0.5, color="black")
-
-    #
-    # Generate acceleration plot
-    #
-    plt.subplot(313)
-    aa.append(acceleration(counter))
-    plt.ylabel("Acceleration (m/s^2)")
-    plt.xlabel("Time (s)")
-    plt.xlim(0, 15)
-    plt.ylim(-A*w**2-0.5, A*w**2+0.5)
-    plt.plot(tt, aa, lw=1, color="green")
-    plt.plot([0,15], [0,0], lw=0.5, color="black")
-
-    #
-    # Stop at cardinal points of osciilation on mouse clicks
-    #
-    dt = 0.075
-    if pause == 1:
-        if fun(counter)/A < 0.99:
-            counter += dt
-    elif pause == 2:
-        if fun(counter)*fun(counter-dt) > 0.:
-            counter += dt
-    elif pause == 3:
-        if fun(counter)/A > -0.99:
-            counter += dt
-    elif pause == 4:
-        if fun(counter)*fun(counter-dt) > 0.:
-            counter += dt
-    else: 
-        counter += dt
-        
-fig.canvas.mpl_connect('button_press_event', onClick)
-ani = animation.FuncAnimation(fig, animate, interval=2)
-plt.show()
+    # Record velocity and acceleration
+    vv.append(t, vel(t))
+    aa.append(t, acceleration(t))
 
+    return [(x, y), (linex, liney), ([fun(t)], [0.]), vv.data(), aa.data()]
+
+# Animation which stops at cardinal points of oscillation on mouse clicks
+#   pause = 0 - run simulation
+#   pause = 1 - w*t-phi = 0
+#   pause = 2 - w*t-phi = pi/2
+#   pause = 3 - w*t-phi = pi
+#   pause = 4 - w*t-phi = 3*pi/2
 
+class CardinalPlayer(Player):
+
+    # Function to capture mouse clicks
+    def onClick(self, event):
+        if self.pause < 4:
+            self.pause += 1
+        else:
+            self.pause = 0
+
+    # Function to return time of next frame
+    def advance(self, t):
+        dt = self.dt
+        if self.pause == 1:
+            if fun(t)/A < 0.99:
+                t += dt
+        elif self.pause == 2:
+            if fun(t)*fun(t-dt) > 0.:
+                t += dt
+        elif self.pause == 3:
+            if fun(t)/A > -0.99:
+                t += dt
+        elif self.pause == 4:
+            if fun(t)*fun(t-dt) > 0.:
+                t += dt
+        else: 
+            t += dt
+        return t
+
+ani = CardinalPlayer(fig, [mass, spring, center, velocity, accel], state, dt,
+                     traces=[vv, aa])
+plt.show()
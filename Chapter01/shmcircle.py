@@ -9,95 +9,70 @@ Animation freezes on mouse clicks.
 
 import numpy as np
 import matplotlib.pyplot as plt
-import matplotlib.animation as animation
-import argparse
- 
+import sys
+import os
+
+# Make shared phy315 package importable
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from phy315.animation import Player
+from phy315.trace import Trace
+
 # Set simulation parameters:
-#   counter - current time
-#   tt      - time array
-#   xx      - coordinate of center of mass array
+#   dt   - time step
+#   tmax - time window of x plot
 
-counter =  0
-tt      = [0]
-xx      = [0]
+dt   = 0.02
+tmax = 5.
 
 # Setup plotting space
 fig = plt.figure(figsize=(14.,6.))
-ax1 = fig.add_subplot(1,1,1)
-ax2 = fig.add_subplot(1,2,1)
 fig.subplots_adjust(hspace=.45)
 
-# Function to capture mouse clicks
-pause = 0
-def onClick(event):
-    global pause
+#
+# Generate circular motion plot
+#
+ax1 = plt.subplot(121)
+plt.xlim(-1.2, 1.2)
+plt.ylim(-1.2, 1.2)
+plt.xlabel("$x/a$", size="large")
+plt.ylabel("$y/a$", size="large")
+plt.title(R"Polar coordinates: $r=a$, $\theta=\omega\,t-\phi$", size="large")
 
-    if pause == 0:
-        pause = 1
-    else:
-        pause = 0
+# Plot circle
+th = np.arange(0.,2.*np.pi,0.01)
+plt.plot(np.cos(th), np.sin(th), color="blue", lw=2, ls="dotted")
+plt.axhline(y=0., lw=1, color='black', ls='dotted')
+plt.axvline(x=0., lw=1, color='black', ls='dotted')
 
-# Animation function
-def animate(i):
-    global counter, tt, xx, A, pause
-    ax2.clear()
+# Mass, radius, projected mass, and projection
+mass,       = plt.plot([], [], 'o', color="black", markersize=10)
+radius,     = plt.plot([], [], color="blue", lw=2, ls="solid")
+projected,  = plt.plot([], [], 'o', color="red", markersize=10, fillstyle='none')
+projection, = plt.plot([], [], color="red", lw=2, ls="dotted")
 
-    #
-    # Generate circular motion plot
-    #
-    plt.subplot(121)
-    plt.xlim(-1.2, 1.2)
-    plt.ylim(-1.2, 1.2)
-    plt.xlabel("$x/a$", size="large")
-    plt.ylabel("$y/a$", size="large")
-    plt.title(R"Polar coordinates: $r=a$, $\theta=\omega\,t-\phi$", size="large")
+#
+# Generate x plot
+#
+ax2 = plt.subplot(122)
+plt.ylabel("$x/a$", size="large")
+plt.xlabel("$t/T$", size="large")
+plt.title("Cartesian coordinates: $x = a\,\cos(\omega\,t-\phi)$, $y = a\,\cos(\omega\,t-\phi)$")
+plt.ylim(-1.2, 1.2)
+plt.axhline(y=0.,  lw=1, color='black', ls='dotted')
+plt.axhline(y=-1., lw=1, color='black', ls='dotted')
 
-    # Plot circle
-    th = np.arange(0.,2.*np.pi,0.01)
-    xc = np.cos(th)
-    yc = np.sin(th)
-    plt.plot(xc, yc, color="blue", lw=2, ls="dotted")
-    
-    # Plot mass
-    data_x = [np.cos(counter*2.*np.pi)]
-    data_y = [np.sin(counter*2.*np.pi)]
-    o_x = [0.]
-    o_y = [0.]
-    plt.plot(data_x, data_y, 'o', color="black", markersize='10')
-    plt.plot([o_x,data_x], [o_y,data_y], color="blue", lw=2, ls="solid")
-    plt.axhline(y=0., lw=1, color='black', ls='dotted')
-    plt.axvline(x=0., lw=1, color='black', ls='dotted')
+history, = plt.plot([], [], lw=1, color="red")
+xx = Trace(ax2, tmax, dt)
 
-    # Plot projected mass
-    data_xx = data_x
-    data_yy = [0.]
-    plt.plot(data_xx, data_yy, 'o', color="red", markersize='10', fillstyle='none')
-    plt.plot([data_x,data_xx], [data_y,data_yy], color="red", lw=2, ls="dotted")
+# Function to return mass, radius, projected mass, projection, and x plot
+# at time t
+def state(t):
+    x = np.cos(t*2.*np.pi)
+    y = np.sin(t*2.*np.pi)
+    xx.append(t, x)
+    return [([x], [y]), ([0., x], [0., y]), ([x], [0.]), ([x, x], [y, 0.]), xx.data()]
 
-    #
-    # Generate x plot
-    #
-    plt.subplot(122)
-    tt.append(counter)
-    xx.append(np.cos(counter*2.*np.pi))
-    plt.ylabel("$x/a$", size="large")
-    plt.xlabel("$t/T$", size="large")
-    plt.title("Cartesian coordinates: $x = a\,\cos(\omega\,t-\phi)$, $y = a\,\cos(\omega\,t-\phi)$")
-    plt.xlim(0,5)
-    plt.ylim(-1.2, 1.2)
-    plt.plot(tt, xx,   lw=1, color="red")
-    plt.axhline(y=0.,  lw=1, color='black', ls='dotted')
-    plt.axhline(y=-1., lw=1, color='black', ls='dotted')
-   
-    #
-    # Freeze animation on mouse clicks
-    #
-    dt = 0.02
-    if not pause:
-        counter += dt
-        
-fig.canvas.mpl_connect('button_press_event', onClick)
-ani = animation.FuncAnimation(fig, animate, interval=2)
+# Produce animation
+ani = Player(fig, [mass, radius, projected, projection, history], state, dt,
+             traces=[xx])
 plt.show()
-
-
@@ -9,8 +9,14 @@ Pauses on mouse click.
 
 import numpy as np
 import matplotlib.pyplot as plt
-import matplotlib.animation as animation
 import argparse
+import sys
+import os
+
+# Make shared phy315 package importable
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from phy315.animation import Player
+from phy315.trace import Trace
 
 # Set physical parameters:
 #   k   - spring constant (newton/meter)
@@ -31,26 +37,11 @@ A   = 2
 w = np.sqrt(k/m)
  
 # Set simulation parameters:
-#   counter - current time
-#   tt      - time array
-#   xx      - coordinate of center of mass array
-#   uu      - potential energy
-#   kk      - kinetic energy
-#   ee      - total energy
-
-counter =  0.
-tt      = [0]
-xx      = [0]
-uu      = [0]
-kk      = [0]
-ee      = [0]
+#   dt   - time step (second)
+#   tmax - time window of energy plots (second)
 
-# Setup plotting space
-fig = plt.figure(figsize=(7,7))
-ax1 = fig.add_subplot(1,1,1)
-ax2 = fig.add_subplot(2,1,1)
-ax3 = fig.add_subplot(3,1,1)
-fig.subplots_adjust(hspace=.45)
+dt   = 0.075
+tmax = 15.
 
 # Function to return coordinate of center of mass
 def fun(t):
@@ -90,92 +81,70 @@ def position(x):
     
     return [p1, p2, p3, p4]
 
-# Function to capture mouse clicks
-pause = 0
-def onClick(event):
-    global pause
-
-    if pause == 0:
-        pause = 1
-    else:
-        pause = 0
-
-# Animation function
-def animate(i):
-    global counter, tt, xx, A, uu, kk, ee, pause
-    ax3.clear()
-
-    #
-    # Generate mass-spring animation plot
-    #
-    plt.subplot(311)
-    plt.xlim(-3.5, 3.5)
-    plt.ylim(-2, 2)
-    plt.xlabel("Displacement (m)")
-    plt.title("m = 20 kg  k = 100 N/m  a = 2 m  nu  =  0.1 rad/s  phi = pi/3")
-    cur_axes = plt.gca()
-    cur_axes.axes.get_yaxis().set_visible(False)
+# Setup plotting space
+fig = plt.figure(figsize=(7,7))
+fig.subplots_adjust(hspace=.45)
+
+#
+# Generate mass-spring animation plot
+#
+ax1 = plt.subplot(311)
+plt.xlim(-3.5, 3.5)
+plt.ylim(-2, 2)
+plt.xlabel("Displacement (m)")
+plt.title("m = 20 kg  k = 100 N/m  a = 2 m  nu  =  0.1 rad/s  phi = pi/3")
+ax1.get_yaxis().set_visible(False)
+
+mass,   = plt.plot([], [], lw=5, color="blue")
+spring, = plt.plot([], [], color="red", ls=":", lw=5)
+center, = plt.plot([], [], 'o', color="black")
+
+#
+# Generate kinetic and potential energy plots
+#
+ax2 = plt.subplot(312)
+plt.ylabel("Energy (J)")
+plt.xlabel("Time (s)")
+plt.ylim(0., 250.)
+plt.axhline(y=0., lw=0.5, color="black")
+
+pot, = plt.plot([], [], lw=1, color="green", label="U")
+kin, = plt.plot([], [], lw=1, color="blue",  label="K")
+plt.legend(loc="upper right")
+uk = Trace(ax2, tmax, dt, 2)
+
+#
+# Generate total energy plot
+#
+ax3 = plt.subplot(313)
+plt.ylabel("Total Energy (J)")
+plt.xlabel("Time (s)")
+plt.ylim(0., 250.)
+plt.axhline(y=0., lw=0.5, color="black")
+
+tot, = plt.plot([], [], lw=1, color="red")
+ee = Trace(ax3, tmax, dt)
+
+# Function to return mass, spring, center of mass, and energy plots at time t
+def state(t):
+    global uk, ee
 
     # Get coordinates of mass corners
-    p1 = [position(fun(counter))[0][0], position(fun(counter))[0][1]]
-    p2 = [position(fun(counter))[1][0], position(fun(counter))[1][1]]
-    p3 = [position(fun(counter))[2][0], position(fun(counter))[2][1]]
-    p4 = [position(fun(counter))[3][0], position(fun(counter))[3][1]]
+    p1, p2, p3, p4 = position(fun(t))
 
     x     = [p1[0], p2[0], p3[0], p4[0], p1[0]]
     y     = [p1[1], p2[1], p3[1], p4[1], p1[1]]
     linex = [-4, p1[0]]
     liney = [0, 0]
 
-    # Plot mass
-    plt.plot(x, y, lw=5, color="blue")
-
-    # Plot spring
-    plt.plot(linex, liney, color="red", ls=":", lw=5)
-
-    # Plot center of mass
-    data_x = [fun(counter)]
-    data_y = [0.]
-    plt.plot(data_x, data_y, 'o', color="black")
-
-    #
-    # Generate kinetic and potential energy plots
-    #
-    plt.subplot(312)
-    tt.append(counter)
-    uu.append(potential(counter))
-    kk.append(kinetic(counter))
-    plt.ylabel("Energy (J)")
-    plt.xlabel("Time (s)")
-    plt.xlim(0,15)
-    plt.ylim(0., 250.)
-    plt.plot(tt, uu, lw=1, color="green", label="U")
-    plt.plot(tt, kk, lw=1, color="blue",  label="K")
-    plt.plot([0,15], [0,0], lw=0.5, color="black")
-    if counter == 0.:
-        plt.legend(loc="upper right")
-
-    #
-    # Generate total energy plot
-    #
-    plt.subplot(313)
-    ee.append(total(counter))
-    plt.ylabel("Total Energy (J)")
-    plt.xlabel("Time (s)")
-    plt.xlim(0, 15)
-    plt.ylim(0., 250.)
-    plt.plot(tt, ee, lw=1, color="red")
-    plt.plot([0,15], [0,0], lw=0.5, color="black")
-
-    #
-    # Pause on mouse click
-    #
-    dt = 0.075
-    if pause == 0:
-        counter += dt
-        
-fig.canvas.mpl_connect('button_press_event', onClick)
-ani = animation.FuncAnimation(fig, animate, interval=2)
-plt.show()
+    # Record energies
+    uk.append(t, potential(t), kinetic(t))
+    ee.append(t, total(t))
 
+    return [(x, y), (linex, liney), ([fun(t)], [0.]),
+            uk.data(0), uk.data(1), ee.data()]
 
+# Produce animation, which pauses on mouse click
+ani = Player(fig, [mass, spring, center, pot, kin, tot], state, dt,
+             traces=[uk, ee])
+plt.show()
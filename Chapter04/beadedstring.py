@@ -12,13 +12,21 @@ n - number of beads
 k - mode number
 a - amplitude
 t - time step
+d - relative spread of (randomly chosen) bead masses
+r - replay stored period
 """
 
 import numpy as np
 import matplotlib.pyplot as plt
-import matplotlib.animation as animation
 import argparse
 import sys
+import os
+
+# Make shared phy315 package importable
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from phy315.animation import PeriodicPlayer
+from phy315.framestore import cache_key
+from phy315.oscillators import chain_modes
 
 # Set up command line options
 parser = argparse.ArgumentParser()
@@ -26,6 +34,8 @@ parser.add_argument('-n', type=int,    default=8,    help='number of beads')
 parser.add_argument('-k', type=int,    default=1,    help='mode number')
 parser.add_argument('-a', type=float,  default=0.75, help='amplitude')
 parser.add_argument('-t', type=float,  default=0.05, help='time step')
+parser.add_argument('-d', type=float,  default=0.,   help='spread of bead masses')
+parser.add_argument('-r', action='store_true',       help='replay stored period')
 
 # Read command line options
 args = parser.parse_args()
@@ -33,6 +43,8 @@ N  = args.n
 n  = args.k
 A  = args.a
 dt = args.t
+dm = args.d
+replay = args.r
 
 # Test input
 if N < 0:
@@ -47,100 +59,76 @@ if A <= 0.:
 if dt <= 0.:
     print 'Error: t must be positive'
     sys.exit(1)
+if dm < 0. or dm >= 1.:
+    print 'Error: d must lie between 0 and 1'
+    sys.exit(1)
 
 # Set physical parameters
 #   k - spring constant (newton/meter)
-#   m -  mass (kg)
+#   m - mean mass (kg)
 
 k   = 100 
 m   = 20
 
-# Function to return normal frequency
-def omega():
-    global k, m, n, N
-    return 2.*np.sqrt(k/m)*np.sin(0.5*np.pi*n/(1.+N))
+# Bead masses mb spread uniformly over m(1-dm) to m(1+dm), the same on
+# every run
+mb = m*(1. + dm*(2.*np.random.RandomState(0).rand(N) - 1.))
 
 # Set derived parameters
-#   w - normal frequency (rad/s)
+#   w     - normal frequency (rad/s)
+#   shape - mode shape, sin(pi n i/(N+1)) at bead i if masses are equal
 
-w = omega()
+w, shape = chain_modes(mb, k*np.ones(N+1), n, n)
+w, shape = w[0], shape[:, 0]
 
 # Function to return x-coordinates of masses
 def X(t):
     global N
     
-    x = np.zeros(N)
-    for i in range(N):
-        x[i] = 1.*i+1.
-
-    return x    
+    return np.arange(1., N+1.)
 
 # Function to return y-coordinates of masses
 def Y(t):
     global N, A, n, w
     
-    y = np.zeros(N)
-    for i in range(N):
-        y[i] = A*np.sin(np.pi*n*(1.+i)/(1.+N))*np.cos(w*t)
-
-    return y    
-
-# Function to capture mouse clicks
-
-pause = 0
-def onClick(event):
-    global pause
-
-    if pause == 0:
-        pause = 1
-    else:
-        pause = 0
+    return A*shape*np.cos(w*t)
 
 # Setup plotting space
 fig = plt.figure(figsize=(7,7))
 ax1 = fig.add_subplot(1,1,1)
 
-# Produce animation
-counter = 0
-
-def animate(i):
-    global counter, N, A, n, w, pause
-    ax1.clear()
-
-    # Generate animation plot
-    plt.xlim(0., 1.+N)
-    plt.ylim(-A-0.25, A+0.25)
-    plt.xlabel("$x/a$", size='large')
-    plt.ylabel("$y$", size='large')
+# Generate animation plot
+plt.xlim(0., 1.+N)
+plt.ylim(-A-0.25, A+0.25)
+plt.xlabel("$x/a$", size='large')
+plt.ylabel("$y$", size='large')
+plt.axhline(y=0., lw=2, color='red', ls='dotted')
 
-    # Get x-coordinates of masses
-    x_data = X(counter)
+envelope, = plt.plot([], [], color="green", ls="dotted", lw=1)
+strings,  = plt.plot([], [], lw=4, ls='dotted', color="blue")
+masses,   = plt.plot([], [], 'o', color="black", markersize=10)
 
-    # Get y-coordinates of masses
-    y_data = Y(counter)
+# Function to return envelope (of equal masses only), strings, and masses
+# at time t
+xe = np.linspace(0., 1.+N, 1000)
+ye = A*np.sin(np.pi*n*xe/(1.+N))
 
-    xx_data = np.append ([0.],x_data)
-    yy_data = np.append ([0.],y_data)
-    xx_data = np.append (xx_data,[1.+N])
-    yy_data = np.append (yy_data,[0.])
+def state(t):
+    global N
 
-    # Plot envelope
-    x = np.linspace(0., 1.+N, 1000)
-    y = A*np.sin(np.pi*n*x/(1.+N))*np.cos(w*counter)
-    plt.plot(x, y, color="green", ls="dotted", lw=1)
+    # Get coordinates of masses
+    x_data = X(t)
+    y_data = Y(t)
 
-    # Plot strings
-    plt.plot(xx_data, yy_data, lw='4', ls='dotted', color="blue")
+    xx_data = np.concatenate(([0.], x_data, [1.+N]))
+    yy_data = np.concatenate(([0.], y_data, [0.]))
 
-    # Plot masses
-    plt.plot(x_data, y_data, 'o', color="black", markersize='10')
-    plt.axhline(y=0., lw=2, color='red', ls='dotted')
+    if dm == 0.:
+        return [(xe, ye*np.cos(w*t)), (xx_data, yy_data), (x_data, y_data)]
+    return [None, (xx_data, yy_data), (x_data, y_data)]
 
-    if not pause:
-        counter += dt
-        
-fig.canvas.mpl_connect('button_press_event', onClick)
-ani = animation.FuncAnimation(fig,animate,interval=2)
+# Produce animation
+ani = PeriodicPlayer(fig, [envelope, strings, masses], state, dt, 2.*np.pi/w,
+                     replay=replay, key=cache_key(__file__, vars(args)))
 
 plt.show()
-
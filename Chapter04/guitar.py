@@ -15,9 +15,14 @@ n  - damping rate
 
 import numpy as np
 import matplotlib.pyplot as plt
-import matplotlib.animation as animation
 import argparse
 import sys
+import os
+
+# Make shared phy315 package importable
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from phy315.animation import Player
+from phy315.modes import ModalSum
 
 # Set up command line options
 parser = argparse.ArgumentParser()
@@ -42,52 +47,33 @@ if nu < 0.:
     print 'Error: n must be non-negative'
     sys.exit(1)
 
-# Function to capture mouse clicks
-pause = 0
-def onClick(event):
-    global pause
+# Set up normal modes: mode k has wavenumber (2k-1) pi and angular
+# frequency 2 pi (2k-1)
+x  = np.linspace(0., 1., 1000)
+kk = np.arange(1., K+1.)
+nn = 2.*kk - 1.
 
-    if pause == 0:
-        pause = 1
-    else:
-        pause = 0
+string = ModalSum(np.sin(np.pi*np.outer(nn, x)),
+                  -2.*np.cos(kk*np.pi)/(kk-0.5)/(kk-0.5)/np.pi/np.pi,
+                  2.*np.pi*nn, damping=nn*nu)
 
 # Setup plotting space
 fig = plt.figure(figsize=(7,7))
 ax1 = fig.add_subplot(1,1,1)
 
+plt.xlim(0., 1.)
+plt.ylim(-1.25, 1.25)
+plt.xlabel("$x/l$", size='large')
+plt.ylabel("$y/A$",   size='large')
+
+line, = plt.plot([], [], color="blue", lw=3)
+axis  = plt.axhline(y=0., lw=2, color='red', ls='dotted')
+
+# Function to return string at time t
+def state(t):
+    return [(x, string(t)), None]
+
 # Produce animation
-counter = 0
-
-def animate(i):
-    global counter, N, A, n, w, pause
-    ax1.clear()
-
-    # Generate animation plot
-    plt.xlim(0., 1.)
-    plt.ylim(-1.25, 1.25)
-    plt.xlabel("$x/l$", size='large')
-    plt.ylabel("$y/A$",   size='large')
-
-    # Plot string 
-    x = np.linspace(0., 1., 1000)
-    y = np.zeros_like(x)
-
-    for k in range(K):
-        kk = k+1
-        y += -2.*np.cos(kk*np.pi)/(kk-0.5)/(kk-0.5)/np.pi/np.pi\
-             *np.sin((2.*kk-1.)*np.pi*x)\
-             *np.cos(2.*np.pi*(2.*kk-1.)*counter)\
-             *np.exp(-(2.*kk-1.)*nu*counter)
-
-    plt.plot(x, y, color="blue", lw=3)
-    plt.axhline(y=0., lw=2, color='red', ls='dotted')
-
-    if not pause:
-        counter += dt
-        
-fig.canvas.mpl_connect('button_press_event', onClick)
-ani = animation.FuncAnimation(fig,animate,interval=2)
+ani = Player(fig, [line, axis], state, dt)
 
 plt.show()
-
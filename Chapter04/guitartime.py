@@ -15,9 +15,13 @@ n  - damping rate
 
 import numpy as np
 import matplotlib.pyplot as plt
-import matplotlib.animation as animation
 import argparse
 import sys
+import os
+
+# Make shared phy315 package importable
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from phy315.modes import ModalSum
 
 # Set up command line options
 parser = argparse.ArgumentParser()
@@ -51,15 +55,17 @@ plt.ylim(-1.25, 1.25)
 plt.xlabel(r"$t/\tau$", size='large')
 plt.ylabel(r"$y(x=l/2)/A$", size='large')
 
+# Normal modes of string, as in guitar.py, evaluated at midpoint
+kk = np.arange(1., K+1.)
+nn = 2.*kk - 1.
+
+string = ModalSum(np.sin(np.pi*np.outer(nn, [0.5])),
+                  -2.*np.cos(kk*np.pi)/(kk-0.5)/(kk-0.5)/np.pi/np.pi,
+                  2.*np.pi*nn, damping=nn*nu)
+
 t = np.linspace(0., T, 1000)
-y = np.zeros_like(t)
-
-for k in range(K):
-    kk = k+1
-    y += 2./(kk-0.5)/(kk-0.5)/np.pi/np.pi\
-         *np.cos(2.*np.pi*(2.*kk-1.)*t)\
-         *np.exp(-(2.*kk-1.)*nu*t)
-    
+y = string.history(t)[:, 0]
+
 plt.plot(t, y, color="blue", lw=3)
 plt.axhline(y=0., lw=2, color='red', ls='dotted')
 
@@ -11,25 +11,33 @@ Input parameters:
 k - mode number
 a - amplitude
 t - time step
+r - replay stored period
 """
 
 import numpy as np
 import matplotlib.pyplot as plt
-import matplotlib.animation as animation
 import argparse
 import sys
+import os
+
+# Make shared phy315 package importable
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from phy315.animation import PeriodicPlayer
+from phy315.framestore import cache_key
 
 # Set up command line options
 parser = argparse.ArgumentParser()
 parser.add_argument('-k', type=int,    default=1,    help='mode number')
 parser.add_argument('-a', type=float,  default=0.75, help='amplitude')
 parser.add_argument('-t', type=float,  default=0.05, help='time step')
+parser.add_argument('-r', action='store_true',       help='replay stored period')
 
 # Read command line options
 args = parser.parse_args()
 n  = args.k
 A  = args.a
 dt = args.t
+replay = args.r
 
 # Test input
 if n < 1:
@@ -47,45 +55,30 @@ if dt <= 0.:
 
 w = 1.*n
 
-# Function to capture mouse clicks
-
-pause = 0
-def onClick(event):
-    global pause
-
-    if pause == 0:
-        pause = 1
-    else:
-        pause = 0
-
 # Setup plotting space
 fig = plt.figure(figsize=(7,7))
 ax1 = fig.add_subplot(1,1,1)
 
+# Generate animation plot
+plt.xlim(0., 1.)
+plt.ylim(-A-0.25, A+0.25)
+plt.xlabel("$x/l$", size='large')
+plt.ylabel("$y$",   size='large')
+plt.axhline(y=0., lw=2, color='red', ls='dotted')
+
+string, = plt.plot([], [], color="blue", lw=3)
+
+# Function to return string at time t
+x = np.linspace(0., 1., 1000)
+y = A*np.sin(np.pi*n*x)
+
+def state(t):
+    global w
+
+    return [(x, y*np.cos(w*t))]
+
 # Produce animation
-counter = 0
-
-def animate(i):
-    global counter, N, A, n, w, pause
-    ax1.clear()
-
-    # Generate animation plot
-    plt.xlim(0., 1.)
-    plt.ylim(-A-0.25, A+0.25)
-    plt.xlabel("$x/l$", size='large')
-    plt.ylabel("$y$",   size='large')
-
-    # Plot string 
-    x = np.linspace(0., 1., 1000)
-    y = A*np.sin(np.pi*n*x)*np.cos(w*counter)
-    plt.plot(x, y, color="blue", lw=3)
-    plt.axhline(y=0., lw=2, color='red', ls='dotted')
-
-    if not pause:
-        counter += dt
-        
-fig.canvas.mpl_connect('button_press_event', onClick)
-ani = animation.FuncAnimation(fig,animate,interval=2)
+ani = PeriodicPlayer(fig, [string], state, dt, 2.*np.pi/w,
+                     replay=replay, key=cache_key(__file__, vars(args)))
 
 plt.show()
-
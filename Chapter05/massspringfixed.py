@@ -12,13 +12,20 @@ n - number of masses
 k - mode number
 a - relative amplitude
 t - time step
+r - replay stored period
 """
 
 import numpy as np
 import matplotlib.pyplot as plt
-import matplotlib.animation as animation
 import argparse
 import sys
+import os
+
+# Make shared phy315 package importable
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from phy315.animation import PeriodicPlayer
+from phy315.chain import MassChain
+from phy315.framestore import cache_key
 
 # Set up command line options
 parser = argparse.ArgumentParser()
@@ -26,6 +33,7 @@ parser.add_argument('-n', type=int,    default=8,    help='number of masses')
 parser.add_argument('-k', type=int,    default=1,    help='mode number')
 parser.add_argument('-a', type=float,  default=0.5,  help='amplitude')
 parser.add_argument('-t', type=float,  default=0.3,  help='time step')
+parser.add_argument('-r', action='store_true',       help='replay stored period')
 
 # Read command line options
 args = parser.parse_args()
@@ -33,6 +41,7 @@ N  = args.n
 n  = args.k
 A  = args.a
 dt = args.t
+replay = args.r
 
 # Test input
 if N < 0:
@@ -63,91 +72,26 @@ def X(t, i):
     global w, A
     return i + A*np.sin(np.pi*i*n/(N+1.))*np.cos(w*t)
 
-# Function to return coordinates of mass corners
-def position(x):
-    x1 = x - 0.15
-    x2 = x + 0.15
-    y1 = 0.25 
-    y2 = -0.25
-
-    p1 = [x1, y2]
-    p2 = [x2, y2]
-    p3 = [x2, y1]
-    p4 = [x1, y1]
-    
-    return [p1, p2, p3, p4]
-
-# Function to capture mouse clicks
-pause = 0
-def onClick(event):
-    global pause
-
-    if pause == 0:
-        pause = 1
-    else:
-        pause = 0
-
 # Setup plotting space
 fig = plt.figure(figsize=(7,7))
 ax1 = fig.add_subplot(1,1,1)
 
+# Generate animation plot
+plt.xlim(0., 1.+N)
+plt.ylim(-N/2, N/2)
+plt.xlabel("$x/a$", size='large')
+plt.ylabel("$y$", size='large')
+
+chain = MassChain(ax1, N, left=0., right=1.+N)
+
+# Function to return outlines of masses, and springs, at time t
+ii = np.arange(1., N+1.)
+
+def state(t):
+    return chain(X(t, ii))
+
 # Produce animation
-counter = 0
-
-def animate(i):
-    global counter, pause, N
-    ax1.clear()
-
-    # Generate animation plot
-    plt.xlim(0., 1.+N)
-    plt.ylim(-N/2, N/2)
-    plt.xlabel("$x/a$", size='large')
-    plt.ylabel("$y$", size='large')
-
-    # Get coordinates of mass corners
-    xx = np.zeros((4,N))
-    yy = np.zeros((4,N))
-    for i in range(N):
-        ii = i+1
-
-        # Plot masses
-        xx[0,i] = position(X(counter,ii))[0][0]
-        xx[1,i] = position(X(counter,ii))[1][0]
-        xx[2,i] = position(X(counter,ii))[2][0]
-        xx[3,i] = position(X(counter,ii))[3][0]
-
-        yy[0,i] = position(X(counter,ii))[0][1]
-        yy[1,i] = position(X(counter,ii))[1][1]
-        yy[2,i] = position(X(counter,ii))[2][1]
-        yy[3,i] = position(X(counter,ii))[3][1]
-
-    # Plot masses
-    for i in range(N):
-
-        x = [xx[0,i], xx[1,i], xx[2,i], xx[3,i], xx[0,i]]
-        y = [yy[0,i], yy[1,i], yy[2,i], yy[3,i], yy[0,i]]
-
-        plt.plot(x, y, lw=3, color="blue")
-
-    # Plot springs     
-    for i in range(N-1):
-       
-        linex = [xx[1,i], xx[0,i+1]]
-        liney = [0, 0]
-        plt.plot(linex, liney, color="red", ls=":", lw=5)
-
-    linex = [0., xx[0][0]]
-    liney = [0, 0]
-    plt.plot(linex, liney, color="red", ls=":", lw=5)
-
-    linex = [xx[1][N-1], 1.+N]
-    liney = [0, 0]
-    plt.plot(linex, liney, color="red", ls=":", lw=5)
-
-    if not pause:
-        counter += dt
-
-fig.canvas.mpl_connect('button_press_event', onClick)        
-ani = animation.FuncAnimation(fig,animate,interval=2)
+ani = PeriodicPlayer(fig, chain.artists, state, dt, 2.*np.pi/w,
+                     replay=replay, key=cache_key(__file__, vars(args)))
 
 plt.show()
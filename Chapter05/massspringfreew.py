@@ -9,48 +9,49 @@ right end fixed.
 Input parameters:
 
 n - number of masses
+d - relative spread of (randomly chosen) masses
 """
 
 import numpy as np
 import matplotlib.pyplot as plt
-import matplotlib.animation as animation
 import argparse
 import sys
+import os
+
+# Make shared phy315 package importable
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from phy315.oscillators import chain_modes
 
 # Set up command line options
 parser = argparse.ArgumentParser()
 parser.add_argument('-n', type=int,    default=8,    help='number of masses')
+parser.add_argument('-d', type=float,  default=0.,   help='spread of masses')
 
 # Read command line options
 args = parser.parse_args()
 N  = args.n
+dm = args.d
 
 # Test input
-if N < 0:
+if N < 1:
     print 'Error: n must be positive integer'
     sys.exit(1)
+if dm < 0. or dm >= 1.:
+    print 'Error: d must lie between 0 and 1'
+    sys.exit(1)
+
+# Masses spread uniformly over 1-dm to 1+dm, the same on every run
+mm = 1. + dm*(2.*np.random.RandomState(0).rand(N) - 1.)
 
 # Function to return normal frequencies
 def omega():
     global N
-
-    w = np.zeros(N)
-    
-    for i in range(N):
-        w[i] = 2.*np.sin(0.5*np.pi*(i+0.5)/(N+0.5))
-        
-    return w
+    return chain_modes(mm, np.concatenate(([0.], np.ones(N))), vectors=False)
 
 # Function to return normal wavenumbers
 def wave():
     global N
-
-    k = np.zeros(N)
-    
-    for i in range(N):
-        k[i] = np.pi*(i+0.5)/(N+0.5)
-        
-    return k    
+    return np.pi*(np.arange(N)+0.5)/(N+0.5)
 
 # Produce plot
 fig = plt.figure(figsize=(7,7))
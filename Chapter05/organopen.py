@@ -6,106 +6,70 @@
 Animation to illustrate first three normal modes of organ pipe open at one end.
 Plots pressure. Anti-nodes indicated as dashed lines. Nodes indicated as dotted lines.
 Animation freezes on mouse clicks.
+
+Input parameters:
+
+c - draw filled contours while animation is frozen
 """
 
 import numpy as np
 import matplotlib.pyplot as plt
-import matplotlib.animation as animation
 from matplotlib import colors, cm
+import argparse
+import sys
+import os
+
+# Make shared phy315 package importable
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from phy315.fields import Field, FieldPlayer, SeparableField
+
+# Set up command line options
+parser = argparse.ArgumentParser()
+parser.add_argument('-c', action='store_true',       help='contours when frozen')
+
+# Read command line options
+args = parser.parse_args()
+contours = args.c
 
 # Setup plotting space
 fig = plt.figure(figsize=(14.,6.))
-ax1 = plt.subplot2grid((9,9),(0,1),rowspan=9)
-ax2 = plt.subplot2grid((9,9),(0,4),colspan=9)
-ax3 = plt.subplot2grid((9,9),(0,7),colspan=9)
-
-# Function to capture mouse clicks
-pause = 0
-def onClick(event):
-    global pause
-
-    if pause == 0:
-        pause = 1
-    else:
-        pause = 0
-
-# Animation function
-dt = 0.1
-counter = 0.
-def animate(i):
-    global counter, pause
-    ax2.clear()
-
-    #
-    # First mode
-    #
-    plt.subplot2grid((9,9),(0,1), rowspan=9)
-    plt.title (r"n = 1", size='large')
-    cur_axes = plt.gca()
-    cur_axes.axes.get_yaxis().set_visible(False)
-    cur_axes.axes.get_xaxis().set_visible(False)
-    
-    N = 500
-    x = np.linspace(0., 1., N)
-    y = np.linspace(0., 1., N)
-     
-    X, Y = np.meshgrid(x, y)
 
-    n = 1.
-    F = np.cos((n-0.5)*np.pi*Y)*np.cos((n-0.5)*counter)
+N = 500
+x = np.linspace(0., 1., N)
+y = np.linspace(0., 1., N)
 
-    levels = np.arange(-1.1,1.1,0.1)
+X, Y = np.meshgrid(x, y)
 
-    plt.contourf(X, Y, F, levels, cmap=cm.bwr)
+levels = np.arange(-1.1,1.1,0.1)
 
-    plt.plot((0,0,1,1),(1,0,0,1), color="black", lw=10)
-
-    #
-    # Second mode
-    #
-    plt.subplot2grid((9,9),(0,4),rowspan=9)
-    plt.title (r"n = 2", size='large')
+# Generate plots of first three modes
+fields = []
+modes  = []
+for n, col in zip((1., 2., 3.), (1, 4, 7)):
+    plt.subplot2grid((9,9),(0,col), rowspan=9)
+    plt.title (r"n = %d" % n, size='large')
     cur_axes = plt.gca()
     cur_axes.axes.get_yaxis().set_visible(False)
     cur_axes.axes.get_xaxis().set_visible(False)
 
-    n = 2.
-    F = np.cos((n-0.5)*np.pi*Y)*np.cos((n-0.5)*counter)
-
-    plt.contourf(X, Y, F, levels, cmap=cm.bwr)
-    plt.axhline(y=1./3., lw=3, color='black', ls='dotted')
-    plt.axhline(y=2./3., lw=2, color='black', ls='dashed')
+    fields.append(Field(cur_axes, x, y, levels, cm.bwr))
+    modes.append(SeparableField([np.cos((n-0.5)*np.pi*Y)], [n-0.5]))
 
     plt.plot((0,0,1,1),(1,0,0,1), color="black", lw=10)
 
-    #
-    # Third mode
-    #
-    plt.subplot2grid((9,9),(0,7),rowspan=9)
-    plt.title (r"n = 3", size='large')
-    cur_axes = plt.gca()
-    cur_axes.axes.get_yaxis().set_visible(False)
-    cur_axes.axes.get_xaxis().set_visible(False)
+    # Nodes (dotted) alternate with anti-nodes (dashed)
+    for k in range(1, int(2*n-1)):
+        if k%2:
+            plt.axhline(y=k/(2*n-1), lw=3, color='black', ls='dotted')
+        else:
+            plt.axhline(y=k/(2*n-1), lw=2, color='black', ls='dashed')
 
-    n = 3.
-    F = np.cos((n-0.5)*np.pi*Y)*np.cos((n-0.5)*counter)
+# Function to return pressure in first three modes at time t
+def state(t):
+    return [mode(t) for mode in modes]
 
-    plt.contourf(X, Y, F, levels, cmap=cm.bwr)
-    plt.axhline(y=1./5., lw=3, color='black', ls='dotted')
-    plt.axhline(y=2./5., lw=2, color='black', ls='dashed')
-    plt.axhline(y=3./5., lw=3, color='black', ls='dotted')
-    plt.axhline(y=4./5., lw=2, color='black', ls='dashed')
+# Produce animation
+dt  = 0.1
+ani = FieldPlayer(fig, fields, state, dt, contours=contours)
 
-    plt.plot((0,0,1,1),(1,0,0,1), color="black", lw=10)
-    
-    #
-    # Freeze animation on mouse clicks
-    #
-    if not pause:
-        counter += dt
-        
-fig.canvas.mpl_connect('button_press_event', onClick)
-ani = animation.FuncAnimation(fig, animate, interval=2)
 plt.show()
-
-
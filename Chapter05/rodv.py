@@ -18,9 +18,14 @@ t  - time step
 
 import numpy as np
 import matplotlib.pyplot as plt
-import matplotlib.animation as animation
 import argparse
 import sys
+import os
+
+# Make shared phy315 package importable
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from phy315.animation import Player
+from phy315.modes import ModalSum
 
 # Set up command line options
 parser = argparse.ArgumentParser()
@@ -40,55 +45,37 @@ if K < 1:
     sys.exit(1)
 if a <= 0. or a >= 1.:
     print 'Error: a must lie between 0 and 1'
+    sys.exit(1)
 if dt <= 0.:
     print 'Error: t must be positive'
     sys.exit(1)
 
-# Function to capture mouse clicks
-pause = 0
-def onClick(event):
-    global pause
+# Set up normal modes: mode k has wavenumber and angular frequency
+# (k-1/2) pi
+x  = np.linspace(0., 1., 1000)
+nn = np.arange(1., K+1.) - 0.5
 
-    if pause == 0:
-        pause = 1
-    else:
-        pause = 0
+rod = ModalSum(np.cos(np.pi*np.outer(nn, x)),
+               (2./np.pi)*np.sin(np.pi*nn*a)/nn/nn/np.pi/a*np.pi*nn*a,
+               np.pi*nn)
 
 # Setup plotting space
 fig = plt.figure(figsize=(7,7))
 ax1 = fig.add_subplot(1,1,1)
 
-# Produce animation
-counter = 0
-
-def animate(i):
-    global counter, N, A, n, w, pause
-    ax1.clear()
+plt.xlim(0., 1.)
+plt.ylim(-1.25, 1.25)
+plt.xlabel("$x/l$", size='large')
+plt.ylabel(r"$(d\hat{\psi}/dt)/V_0$",   size='large')
 
-    # Generate animation plot
-    plt.xlim(0., 1.)
-    plt.ylim(-1.25, 1.25)
-    plt.xlabel("$x/l$", size='large')
-    plt.ylabel(r"$(d\hat{\psi}/dt)/V_0$",   size='large')
+line, = plt.plot([], [], color="blue", lw=3)
+axis  = plt.axhline(y=0., lw=2, color='red', ls='dotted')
 
-    # Plot string 
-    x = np.linspace(0., 1., 1000)
-    y = np.zeros_like(x)
+# Function to return rod velocity at time t
+def state(t):
+    return [(x, rod(t)), None]
 
-    for k in range(K):
-        kk = k+1
-        y += (2./np.pi)*np.sin(np.pi*(kk-0.5)*a)/(kk-0.5)/(kk-0.5)/np.pi/a\
-             *np.cos(np.pi*(kk-0.5)*x)\
-             *np.cos(np.pi*(kk-0.5)*counter)*np.pi*(kk-0.5)*a
-
-    plt.plot(x, y, color="blue", lw=3)
-    plt.axhline(y=0., lw=2, color='red', ls='dotted')
-
-    if not pause:
-        counter += dt
-        
-fig.canvas.mpl_connect('button_press_event', onClick)
-ani = animation.FuncAnimation(fig,animate,interval=2)
+# Produce animation
+ani = Player(fig, [line, axis], state, dt)
 
 plt.show()
-
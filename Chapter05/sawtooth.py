@@ -5,22 +5,43 @@
 """
 Widget to illustrate how Fourier reconstruction of sawtooth waveform
 depends on number terms included in series.
+
+Input parameters:
+
+n - maximum number of terms
 """
 
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.widgets import Slider, Button
+import argparse
+import sys
+import os
 
-t = np.arange(0.0, 4.0, 0.001)
+# Make shared phy315 package importable
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from phy315.series import PartialSums
+
+# Set up command line options
+parser = argparse.ArgumentParser()
+parser.add_argument('-n', type=int, default=64, help='maximum number of terms')
 
-def gety(N):
+# Read command line options
+args = parser.parse_args()
+Nmax = args.n
+
+# Test input
+if Nmax < 4:
+    print 'Error: n must be at least 4'
+    sys.exit(1)
+
+t = np.arange(0.0, 4.0, 0.001)
 
-   y = np.zeros_like(t)
-   for n in range(N):
-       nn = n+1
-       y += -(2./np.pi)*np.sin(2.*np.pi*nn*t)/(1.*nn)
+# Function to return nth term of Fourier series at times t
+def term(n, t):
+    return -(2./np.pi)*np.sin(2.*np.pi*n*t)/(1.*n)
 
-   return y    
+gety = PartialSums(t, term)
 
 # Generate initial plot
 N0  = 4.
@@ -40,7 +61,7 @@ plt.ylabel('$y/A$', size='large')
 # Generate slider
 axcolor = 'lightgoldenrodyellow'
 axn     = plt.axes([0.20, 0.15, 0.65, 0.03], axisbg=axcolor)
-sn      = Slider(axn, r'$N$', 1., 64., valinit=N0, valfmt='%1.0f')
+sn      = Slider(axn, r'$N$', 1., Nmax, valinit=N0, valfmt='%1.0f')
 
 # Update plot using slider data
 def update(val):
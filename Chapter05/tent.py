@@ -5,25 +5,44 @@
 """
 Widget to illustrate how Fourier reconstruction of tent waveform
 depends on number terms included in series.
+
+Input parameters:
+
+n - maximum number of terms
 """
 
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.widgets import Slider, Button
+import argparse
+import sys
+import os
 
-t = np.arange(0.0, 4.0, 0.001)
+# Make shared phy315 package importable
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from phy315.series import PartialSums
+
+# Set up command line options
+parser = argparse.ArgumentParser()
+parser.add_argument('-n', type=int, default=64, help='maximum number of terms')
 
-def gety(N):
+# Read command line options
+args = parser.parse_args()
+Nmax = args.n
+
+# Test input
+if Nmax < 4:
+    print 'Error: n must be at least 4'
+    sys.exit(1)
+
+t = np.arange(0.0, 4.0, 0.001)
 
-   y = np.zeros_like(t)
-   y += 0.5
-   
-   for n in range(N):
-       nn = n+1
-       y += -np.sin(0.5*np.pi*nn)*np.sin(0.5*np.pi*nn)/(0.5*np.pi*nn)/(0.5*np.pi*nn)\
-            *np.cos(2.*np.pi*nn*t)
+# Function to return nth term of Fourier series at times t
+def term(n, t):
+    return -np.sin(0.5*np.pi*n)*np.sin(0.5*np.pi*n)/(0.5*np.pi*n)/(0.5*np.pi*n)\
+           *np.cos(2.*np.pi*n*t)
 
-   return y    
+gety = PartialSums(t, term, 0.5)
 
 # Generate initial plot
 N0  = 4.
@@ -41,7 +60,7 @@ plt.ylabel('$y/A$', size='large')
 # Generate slider
 axcolor = 'lightgoldenrodyellow'
 axn     = plt.axes([0.20, 0.15, 0.65, 0.03], axisbg=axcolor)
-sn      = Slider(axn, r'$N$', 1., 64., valinit=N0, valfmt='%1.0f')
+sn      = Slider(axn, r'$N$', 1., Nmax, valinit=N0, valfmt='%1.0f')
 
 # Update plot using slider data
 def update(val):
@@ -8,19 +8,25 @@ Pauses on mouse click.
 
 Input parameters:
 
-z - impedance of transformer
+z - impedances of quarter-wave layers
 t - time step
 """
 
 import numpy as np
 import matplotlib.pyplot as plt
-import matplotlib.animation as animation
 import argparse
 import sys
+import os
+
+# Make shared phy315 package importable
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from phy315.animation import Player
+from phy315.fields import SeparableField
+from phy315.transmission import TransmissionLine
 
 # Set up command line options
 parser = argparse.ArgumentParser()
-parser.add_argument('-z', type=float,  default=2.,   help='Z3')
+parser.add_argument('-z', type=float,  default=[2.], nargs='+', help='Z3 (one per layer)')
 parser.add_argument('-t', type=float,  default=0.1, help='time step')
 
 # Read command line options
@@ -31,90 +37,56 @@ Z3 = args.z
 dt = args.t
 
 # Test input
-if Z3 <= 0.:
+if min(Z3) <= 0.:
     print 'Error: z must be positive'
     sys.exit(1)
 if dt <= 0.:
     print 'Error: t must be positive'
     sys.exit(1)
 
-# Forward propagating sinusoidal pulse
-def Sinf(x, t):
-    
-    tt = t*np.ones_like(x)
-    xx = tt - x
-
-    return np.sin(xx)
-
-# Backward propagating Gaussian pulse
-def Sinb(x, t):
-    
-    tt = t*np.ones_like(x)
-    xx = tt + x
-
-    return np.sin(xx)
-    
-# Function to capture mouse clicks
-pause = 0
-def onClick(event):
-    global pause
-
-    if pause == 0:
-        pause = 1
-    else:
-        pause = 0
-        
+# Line with quarter-wave layers, of impedances Z3, between x = 0 and
+# x = N pi/2 (wavenumber is unity)
+N    = len(Z3)
+line = TransmissionLine([Z1] + Z3 + [Z2], [np.pi/2.]*N)
+R, T = line.power(1.)
+xmax = max(16., N*np.pi/2. + 8.)
+
+# Points in each section, and voltage and current phasors at them
+xx = [np.arange(-16., 0., 0.01)]
+for a, b in zip(line.edges[:-1], line.edges[1:]):
+    xx.append(np.arange(a, b, 0.01))
+xx.append(np.arange(line.edges[-1], xmax, 0.01))
+xx = np.concatenate(xx)
+V, I = line.phasors(xx)
+
+# Current at time t is Im[I exp(i t)]
+curr = SeparableField([I.imag, I.real], [1., 1.], [0., np.pi/2.])
+
 # Setup plotting space
 fig = plt.figure(figsize=(7,7))
 ax1 = fig.add_subplot(1,1,1)
 
+# Generate animation plot
+plt.xlim(-16., xmax)
+plt.ylim(-3, 3)
+plt.xlabel("$x$",    size='large')
+plt.ylabel(r"${\cal I}$", size='large')
+if N == 1:
+    plt.title(r"$Z_1$ = %3.1f  $Z_3$ = %3.1f  $Z_2$ = %3.1f  $R$ = %4.2f  $T$ = %4.2f" %(Z1, Z3[0], Z2, R, T), size='large')
+else:
+    plt.title(r"$Z_1$ = %3.1f  $Z_2$ = %3.1f  $N$ = %d  $R$ = %4.2f  $T$ = %4.2f" %(Z1, Z2, N, R, T), size='large')
+
+# Current, and interfaces
+line1, = plt.plot([], [], color="blue", ls="solid", lw=2)
+axis   = plt.axhline(y=0., lw=2, color='black', ls='dotted')
+edges  = plt.vlines(line.edges, -3., 3., lw=2, color='black')
+
+# Function to return current at time t (other artists are animated, but
+# unchanged, so that they are drawn over it)
+def state(t):
+    return [(xx, curr(t)), None, None]
+
 # Produce animation
-counter = -10.
-
-def animate(i):
-    global counter, pause, N
-    ax1.clear()
-
-    # Calculate reflection and transmission coefficients
-    r = (Z3*Z3-Z2)/(Z3*Z3+Z2)
-    t = 2.*Z3*Z2/(Z3*Z3+Z2)
-    a = Z3*(Z3+Z2)/(Z3*Z3+Z2)
-    b = Z3*(Z3-Z2)/(Z3*Z3+Z2)
-    R = r*r
-    T = t*t/Z2
-    
-    # Generate animation plot
-    plt.xlim(-16., 16.)
-    plt.ylim(-3, 3)
-    plt.xlabel("$x$",    size='large')
-    plt.ylabel(r"${\cal I}$", size='large')
-    plt.title(r"$Z_1$ = %3.1f  $Z_3$ = %3.1f  $Z_2$ = %3.1f  $R$ = %4.2f  $T$ = %4.2f" %(Z1, Z3, Z2, R, T), size='large')
-
-    xl = np.arange(-16., 0., 0.01)
-    xm = np.arange(0., np.pi/2., 0.01)
-    xr = np.arange(np.pi/2., 16., 0.01)
-
-    vl = Sinf(xl, counter) + r*Sinb(xl, counter)
-    il = Sinf(xl, counter) - r*Sinb(xl, counter)
-    vm = a*Sinf(xm, counter)    + b*Sinb(xm, counter)
-    im = a*Sinf(xm, counter)/Z3 - b*Sinb(xm, counter)/Z3
-    vr = t*Sinf(xr, counter)
-    ir = t*Sinf(xr, counter)/Z2
-    el = il*vl
-    em = im*vm
-    er = ir*vr
-
-    plt.plot(xl, il, color="blue", ls="solid", lw=2)
-    plt.plot(xm, im, color="blue", ls="solid", lw=2)
-    plt.plot(xr, ir, color="blue", ls="solid", lw=2)
-    plt.axhline(y=0., lw=2, color='black', ls='dotted')
-    plt.axvline(x=0., lw=2, color='black')
-    plt.axvline(x=np.pi/2., lw=2, color='black')
-
-    if not pause:
-        counter += dt
-
-fig.canvas.mpl_connect('button_press_event', onClick)        
-ani = animation.FuncAnimation(fig,animate,interval=2)
+ani = Player(fig, [line1, axis, edges], state, dt, t0=-10.)
 
 plt.show()
@@ -16,9 +16,13 @@ t - time step
 
 import numpy as np
 import matplotlib.pyplot as plt
-import matplotlib.animation as animation
 import argparse
 import sys
+import os
+
+# Make shared phy315 package importable
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from phy315.animation import Player
 
 # Set up command line options
 parser = argparse.ArgumentParser()
@@ -62,59 +66,44 @@ def Gaussianb(x, t):
 
     return np.exp(-xx*xx/s/s)
     
-# Function to capture mouse clicks
-pause = 0
-def onClick(event):
-    global pause
-
-    if pause == 0:
-        pause = 1
-    else:
-        pause = 0
+# Calculate reflection and transmission coefficients
+t = 2.*Z2/(Z2+1.)
+r = (Z2-1.)/(Z2+1.)
+R = r*r
+T = t*t/Z2
 
 # Setup plotting space
 fig = plt.figure(figsize=(7,7))
 ax1 = fig.add_subplot(1,1,1)
 
-# Produce animation
-counter = -10.
-
-def animate(i):
-    global counter, pause, N
-    ax1.clear()
-
-    # Calculate reflection and transmission coefficients
-    t = 2.*Z2/(Z2+1.)
-    r = (Z2-1.)/(Z2+1.)
-    R = r*r
-    T = t*t/Z2
-    
-    # Generate animation plot
-    plt.xlim(-8., 8.)
-    plt.ylim(-1.25, 1.25)
-    plt.xlabel("$x$", size='large')
-    plt.ylabel(r"${\cal I}$", size='large')
-    plt.title(r"$Z_1$ = %3.1f  $Z_2$ = %3.1f  $R$ = %4.2f  $T$ = %4.2f" %(Z1, Z2, R, T), size='large')
-  
-    xl = np.arange(-8., 0., 0.01)
-    xr = np.arange(0.,  8., 0.01)
-
-    vl = Gaussianf(xl, counter) + r*Gaussianb(xl, counter)
-    il = Gaussianf(xl, counter) - r*Gaussianb(xl, counter)
-    vr = t*Gaussianf(xr, counter)
-    ir = t*Gaussianf(xr, counter)/Z2
+# Generate animation plot
+plt.xlim(-8., 8.)
+plt.ylim(-1.25, 1.25)
+plt.xlabel("$x$", size='large')
+plt.ylabel(r"${\cal I}$", size='large')
+plt.title(r"$Z_1$ = %3.1f  $Z_2$ = %3.1f  $R$ = %4.2f  $T$ = %4.2f" %(Z1, Z2, R, T), size='large')
+plt.axhline(y=0., lw=2, color='black', ls='dotted')
+plt.axvline(x=0., lw=4, color='black')
+
+left,  = plt.plot([], [], color="blue", ls="solid", lw=2)
+right, = plt.plot([], [], color="blue", ls="solid", lw=2)
+artists = [left, right]
+
+xl = np.arange(-8., 0., 0.01)
+xr = np.arange(0.,  8., 0.01)
+
+# Function to return curves at time tc
+def state(tc):
+    vl = Gaussianf(xl, tc) + r*Gaussianb(xl, tc)
+    il = Gaussianf(xl, tc) - r*Gaussianb(xl, tc)
+    vr = t*Gaussianf(xr, tc)
+    ir = t*Gaussianf(xr, tc)/Z2
     el = il*vl
     er = ir*vr
 
-    plt.plot(xl, el, color="blue", ls="solid", lw=2)
-    plt.plot(xr, er, color="blue", ls="solid", lw=2)
-    plt.axhline(y=0., lw=2, color='black', ls='dotted')
-    plt.axvline(x=0., lw=4, color='black')
+    return [(xl, el), (xr, er)]
 
-    if not pause:
-        counter += dt
-
-fig.canvas.mpl_connect('button_press_event', onClick)        
-ani = animation.FuncAnimation(fig,animate,interval=2)
+# Produce animation
+ani = Player(fig, artists, state, dt, t0=-10.)
 
 plt.show()
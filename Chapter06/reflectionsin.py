@@ -15,9 +15,13 @@ t - time step
 
 import numpy as np
 import matplotlib.pyplot as plt
-import matplotlib.animation as animation
 import argparse
 import sys
+import os
+
+# Make shared phy315 package importable
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from phy315.animation import Player
 
 # Set up command line options
 parser = argparse.ArgumentParser()
@@ -54,63 +58,48 @@ def Sinb(x, t):
 
     return np.sin(xx)
     
-# Function to capture mouse clicks
-pause = 0
-def onClick(event):
-    global pause
-
-    if pause == 0:
-        pause = 1
-    else:
-        pause = 0
-        
+# Calculate reflection and transmission coefficients
+t = 2.*Z2/(Z2+1.)
+r = (Z2-1.)/(Z2+1.)
+R = r*r
+T = t*t/Z2
+
 # Setup plotting space
 fig = plt.figure(figsize=(7,7))
 ax1 = fig.add_subplot(1,1,1)
 
-# Produce animation
-counter = 0.
-
-def animate(i):
-    global counter, pause
-    ax1.clear()
-
-    # Calculate reflection and transmission coefficients
-    t = 2.*Z2/(Z2+1.)
-    r = (Z2-1.)/(Z2+1.)
-    R = r*r
-    T = t*t/Z2
-
-    # Generate animation plot
-    plt.xlim(-16., 16.)
-    plt.ylim(-2.25, 2.25)
-    plt.xlabel("$x$",    size='large')
-    plt.ylabel(r"${\cal I}/{\cal I}_i$", size='large')
-    plt.title(r"$Z_1$ = %3.1f  $Z_2$ = %3.1f  $R$ = %4.2f  $T$ = %4.2f" %(Z1, Z2, R, T), size='large')
-    
-    xl = np.arange(-16., 0., 0.01)
-    xr = np.arange(0.,  16., 0.01)
-
-    vl = Sinf(xl, counter) + r*Sinb(xl, counter)
-    il = Sinf(xl, counter) - r*Sinb(xl, counter)
-    vr = t*Sinf(xr, counter)
-    ir = t*Sinf(xr, counter)/Z2
+# Generate animation plot
+plt.xlim(-16., 16.)
+plt.ylim(-2.25, 2.25)
+plt.xlabel("$x$", size='large')
+plt.ylabel(r"${\cal I}/{\cal I}_i$", size='large')
+plt.title(r"$Z_1$ = %3.1f  $Z_2$ = %3.1f  $R$ = %4.2f  $T$ = %4.2f" %(Z1, Z2, R, T), size='large')
+plt.axhline(y=0., lw=2, color='black', ls='dotted')
+plt.axvline(x=0., lw=4, color='black')
+
+left,  = plt.plot([], [], color="blue", ls="solid", lw=2)
+right, = plt.plot([], [], color="blue", ls="solid", lw=2)
+artists = [left, right]
+
+# Plot mean energy fluxes
+plt.plot((-16., 0.), (1.-r*r, 1.-r*r), color="red", ls="dashed", lw=2)
+plt.plot((0., 16.), (t*t/Z2, t*t/Z2), color="red", ls="dashed", lw=2)
+
+xl = np.arange(-16., 0., 0.01)
+xr = np.arange(0.,  16., 0.01)
+
+# Function to return curves at time tc
+def state(tc):
+    vl = Sinf(xl, tc) + r*Sinb(xl, tc)
+    il = Sinf(xl, tc) - r*Sinb(xl, tc)
+    vr = t*Sinf(xr, tc)
+    ir = t*Sinf(xr, tc)/Z2
     el = 2.*il*vl
     er = 2.*ir*vr
-    el0 = (1.-r*r)*np.ones_like(xl)
-    er0 = (t*t/Z2)*np.ones_like(xr)
-
-    plt.plot(xl, el, color="blue", ls="solid", lw=2)
-    plt.plot(xr, er, color="blue", ls="solid", lw=2)
-    plt.plot(xl, el0, color="red", ls="dashed", lw=2)
-    plt.plot(xr, er0, color="red", ls="dashed", lw=2)
-    plt.axhline(y=0., lw=2, color='black', ls='dotted')
-    plt.axvline(x=0., lw=4, color='black')
 
-    if not pause:
-        counter += dt
+    return [(xl, el), (xr, er)]
 
-fig.canvas.mpl_connect('button_press_event', onClick)        
-ani = animation.FuncAnimation(fig,animate,interval=2)
+# Produce animation
+ani = Player(fig, artists, state, dt)
 
 plt.show()
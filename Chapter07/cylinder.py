@@ -10,71 +10,102 @@ Pauses on mouse click.
 Input parameters:
 
 t - time step
+m - draw wave as colour map instead of wavefronts
+s - number of coherent sources (drawn as colour map if more than one)
+d - spacing of sources (wavelengths)
+p - phase difference of neighbouring sources (degrees)
+g - number of grid points in each direction of colour map
 """
 
 import numpy as np
 import matplotlib.pyplot as plt
-import matplotlib.animation as animation
+from matplotlib import cm
 import argparse
 import sys
+import os
+
+# Make shared phy315 package importable
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from phy315.animation import Player
+from phy315.fields import Field, FieldPlayer
+from phy315.wavefronts import CircularWavefronts, radial_wave
+from phy315.interference import SourceField, line_array
 
 # Set up command line options
 parser = argparse.ArgumentParser()
 parser.add_argument('-t', type=float,  default=0.1, help='time step')
+parser.add_argument('-m', action='store_true',      help='colour map of wave')
+parser.add_argument('-s', type=int,    default=1,   help='number of sources')
+parser.add_argument('-d', type=float,  default=0.5, help='spacing of sources (wavelengths)')
+parser.add_argument('-p', type=float,  default=0.,  help='phase difference of sources (degrees)')
+parser.add_argument('-g', type=int,    default=500, help='number of grid points')
 
 # Read command line options
 args = parser.parse_args()
-dt = args.t
+dt   = args.t
+cmap = args.m or args.s > 1
+M    = args.s
+d    = args.d
+dphi = args.p
+N    = args.g
 
 # Test input
 if dt <= 0.:
     print 'Error: t must be positive'
     sys.exit(1)
+if M < 1:
+    print 'Error: s must be positive'
+    sys.exit(1)
+if d <= 0.:
+    print 'Error: d must be positive'
+    sys.exit(1)
+if N < 2:
+    print 'Error: g must be at least 2'
+    sys.exit(1)
 
-# Function to capture mouse clicks
-pause = 0
-def onClick(event):
-    global pause
+# Amplitude of wave at radius r
+def amplitude(r):
+    return 1./np.sqrt(r)
 
-    if pause == 0:
-        pause = 1
-    else:
-        pause = 0
-        
 # Setup plotting space
 fig = plt.figure(figsize=(7,7))
 ax1 = fig.add_subplot(1,1,1)
 
+# Generate animation plot
+A = 8.
+plt.xlim(-A, A)
+plt.ylim(-A, A)
+plt.xlabel(r"$x/\lambda$", size='large')
+plt.ylabel(r"$y/\lambda$", size='large')
+
+# Sources equally spaced along y-axis, of same total strength as one
+xm = line_array(M, d)
+
+if cmap:
+    # Wave on grid, saturating within unit distance of single source
+    x = np.linspace(-A, A, N)
+    field = Field(ax1, x, x, np.arange(-1.1,1.1,0.1), cm.bwr)
+    if M == 1:
+        wave = radial_wave(x, x, amplitude)
+    else:
+        wave = SourceField(x, x, xm, 1./M, dphi*np.pi/180.*np.arange(M), kind='line')
+else:
+    # Wavefronts, of width proportional to amplitude
+    fronts = CircularWavefronts(ax1, lambda r: 6.*amplitude(r), colors="blue")
+
+source, = plt.plot(xm[:, 0], xm[:, 1], 'o', color="black", markersize=10 if M == 1 else 5)
+
+# Function to return wave, or wavefronts, at time t (source is animated,
+# but unchanged, so that it is drawn over wave or wavefronts)
+def state(t):
+    if cmap:
+        return [wave(t), None]
+    return [fronts(t), None]
+
 # Produce animation
-counter = 0.
-
-def animate(i):
-    global counter, pause
-    ax1.clear()
-
-    # Generate animation plot
-    A = 8.
-    plt.xlim(-A, A)
-    plt.ylim(-A, A)
-    plt.xlabel(r"$x/\lambda$", size='large')
-    plt.ylabel(r"$y/\lambda$", size='large')
-
-    for i in range(40):
-        n = i - 20
-        r = n + counter
-
-        if (r > 0.4):
-            theta = np.arange(0.,2.*np.pi,0.01)
-            x     = r*np.cos(theta)
-            y     = r*np.sin(theta)
-            plt.plot(x, y, color="blue", lw=6./np.sqrt(r))
-
-    plt.plot(0., 0., 'o', color="black", markersize='10')
-            
-    if not pause:
-        counter += dt
-
-fig.canvas.mpl_connect('button_press_event', onClick)        
-ani = animation.FuncAnimation(fig,animate,interval=2)
+if cmap:
+    ani = FieldPlayer(fig, [field], state, dt, artists=[source])
+else:
+    ani = Player(fig, [fronts.artist, source], state, dt)
 
 plt.show()
@@ -8,94 +8,85 @@ Pauses on mouse click.
 
 Input parameters:
 
-m - mode number
+m - radial mode number
+n - angular mode number
+g - number of grid points in each direction
 t - time step
+r - replay stored period
 """
 
 import numpy as np
 import matplotlib.pyplot as plt
-import matplotlib.animation as animation
-import scipy.special as sp
 from matplotlib import colors, cm
 import argparse
 import sys
+import os
+
+# Make shared phy315 package importable
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from phy315.membrane import circular_mode
+from phy315.animation import PeriodicPlayer
+from phy315.framestore import cache_key
 
 # Set up command line options
 parser = argparse.ArgumentParser()
-parser.add_argument('-m', type=int,    default=1,    help='mode number')
+parser.add_argument('-m', type=int,    default=1,    help='radial mode number')
+parser.add_argument('-n', type=int,    default=0,    help='angular mode number')
+parser.add_argument('-g', type=int,    default=200,  help='grid points')
 parser.add_argument('-t', type=float,  default=0.2,  help='time step')
+parser.add_argument('-r', action='store_true',       help='replay stored period')
 
 # Read command line options
 args = parser.parse_args()
 m  = args.m
+n  = args.n
+N  = args.g
 dt = args.t
+replay = args.r
 
 # Test input
 if m < 1:
     print 'Error: m must be positive'
     sys.exit(1)
+if n < 0:
+    print 'Error: n must be non-negative'
+    sys.exit(1)
+if N < 2:
+    print 'Error: g must be greater than one'
+    sys.exit(1)
 if dt <= 0.:
     print 'Error: t must be positive'
     sys.exit(1)
 
-# Function to capture mouse clicks
-pause = 0
-def onClick(event):
-    global pause
-
-    if pause == 0:
-        pause = 1
-    else:
-        pause = 0
-        
 # Setup plotting space
 fig = plt.figure(figsize=(7,7))
 ax1 = fig.add_subplot(1,1,1)
 
-# Produce animation
-counter = 0.
-
-def animate(i):
-    global counter, pause
-    ax1.clear()
-
-    # Generate animation plot
-    plt.xlim(-1., 1.)
-    plt.ylim(-1., 1.)
-    plt.xlabel(r"$x/a$", size='large')
-    plt.ylabel(r"$y/a$", size='large')
-    plt.title(r"$m$ = %3d" %m, size='large')
-
-    zero = sp.jn_zeros(0,10)
-    zr   = zero[m-1]
-    
-    N = 200
-    x = np.linspace(-1., 1., N)
-    y = np.linspace(-1., 1., N)
- 
-    X, Y = np.meshgrid(x, y)
-
-    Z = np.zeros_like(X)
-
-    for i in range(N):
-        for j in range(N):
-            r = np.sqrt(X[i,j]*X[i,j]+Y[i,j]*Y[i,j])
-            if r < 1.:
-                Z[i,j] = sp.j0(zr*r)*np.cos(counter)
- 
-    levels = np.arange(-1.02,1.02,0.01)
-    
-    cs = plt.contourf(X, Y, Z, levels, cmap=cm.bwr)
-
-    theta = np.arange(0.,2.*np.pi,0.01)
-    x = np.cos(theta)
-    y = np.sin(theta)
-    plt.plot (x, y, lw=4, color="black")
- 
-    if not pause:
-        counter += dt
-
-fig.canvas.mpl_connect('button_press_event', onClick)        
-ani = animation.FuncAnimation(fig,animate,interval=1)
+# Generate plot
+plt.xlim(-1., 1.)
+plt.ylim(-1., 1.)
+plt.xlabel(r"$x/a$", size='large')
+plt.ylabel(r"$y/a$", size='large')
+plt.title(r"$m$ = %3d  $n$ = %3d" %(m, n), size='large')
+
+# Mode shape is computed once: each frame only rescales it. Points
+# outside sheet are NaN, so they stay blank when frames are stored.
+X, Y, Z = circular_mode(m, n, N)
+Z = Z.filled(np.nan)
+im = plt.imshow(Z, origin='lower', extent=(-1., 1., -1., 1.),
+                cmap=cm.bwr, vmin=-1.02, vmax=1.02)
+
+theta = np.arange(0.,2.*np.pi,0.01)
+x = np.cos(theta)
+y = np.sin(theta)
+rim, = plt.plot (x, y, lw=4, color="black")
+
+# Function to return displacement of sheet at time t
+def state(t):
+    return [Z*np.cos(t)]
+
+# Produce animation (rim is redrawn over sheet every frame)
+ani = PeriodicPlayer(fig, [im, rim], state, dt, 2.*np.pi, interval=1,
+                     replay=replay, key=cache_key(__file__, vars(args)))
 
 plt.show()
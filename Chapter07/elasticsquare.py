@@ -11,26 +11,33 @@ Input parameters:
 m - x mode number
 n - y mode number
 t - time step
+c - draw filled contours while paused
 """
 
 import numpy as np
 import matplotlib.pyplot as plt
-import matplotlib.animation as animation
 from matplotlib import colors, cm
 import argparse
 import sys
+import os
+
+# Make shared phy315 package importable
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from phy315.fields import Field, FieldPlayer, SeparableField
 
 # Set up command line options
 parser = argparse.ArgumentParser()
 parser.add_argument('-m', type=int,    default=1,    help='x mode number')
 parser.add_argument('-n', type=int,    default=2,    help='y mode number')
 parser.add_argument('-t', type=float,  default=0.01, help='time step')
+parser.add_argument('-c', action='store_true',       help='contours when paused')
 
 # Read command line options
 args = parser.parse_args()
 m  = args.m
 n  = args.n
 dt = args.t
+contours = args.c
 
 # Test input
 if m < 1:
@@ -43,51 +50,34 @@ if dt <= 0.:
     print 'Error: t must be positive'
     sys.exit(1)
 
-# Function to capture mouse clicks
-pause = 0
-def onClick(event):
-    global pause
-
-    if pause == 0:
-        pause = 1
-    else:
-        pause = 0
-        
 # Setup plotting space
 fig = plt.figure(figsize=(7,7))
 ax1 = fig.add_subplot(1,1,1)
 
-# Produce animation
-counter = 0.
+# Generate animation plot
+plt.xlim(0., 1.)
+plt.ylim(0., 1.)
+plt.xlabel(r"$x/a$", size='large')
+plt.ylabel(r"$y/a$", size='large')
+plt.title(r"$m$ = %3d  $n$ = %3d" %(m,n), size='large')
 
-def animate(i):
-    global counter, pause
-    ax1.clear()
+N = 500
+x = np.linspace(0., 1., N)
+y = np.linspace(0., 1., N)
+w = np.pi*np.sqrt(1.*(m*m+n*n))
 
-    # Generate animation plot
-    plt.xlim(0., 1.)
-    plt.ylim(0., 1.)
-    plt.xlabel(r"$x/a$", size='large')
-    plt.ylabel(r"$y/a$", size='large')
-    plt.title(r"$m$ = %3d  $n$ = %3d" %(m,n), size='large')
+X, Y = np.meshgrid(x, y)
 
-    N = 500
-    x = np.linspace(0., 1., N)
-    y = np.linspace(0., 1., N)
-    w = np.pi*np.sqrt(1.*(m*m+n*n))
+levels = np.arange(-1.1,1.1,0.1)
 
-    X, Y = np.meshgrid(x, y)
+field = Field(ax1, x, y, levels, cm.bwr)
+z     = SeparableField([np.sin(m*np.pi*X)*np.sin(n*np.pi*Y)], [w])
 
-    z = np.sin(m*np.pi*X)*np.sin(n*np.pi*Y)*np.cos(w*counter)
+# Function to return displacement of sheet at time t
+def state(t):
+    return [z(t)]
 
-    levels = np.arange(-1.1,1.1,0.1)
-    
-    cs = plt.contourf(X, Y, z, levels, cmap=cm.bwr)
- 
-    if not pause:
-        counter += dt
-
-fig.canvas.mpl_connect('button_press_event', onClick)        
-ani = animation.FuncAnimation(fig,animate,interval=2)
+# Produce animation
+ani = FieldPlayer(fig, [field], state, dt, contours=contours)
 
 plt.show()
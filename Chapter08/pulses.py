@@ -9,58 +9,37 @@ Pauses on mouse click.
 
 import numpy as np
 import matplotlib.pyplot as plt
-import matplotlib.animation as animation
+import sys
+import os
 
-# Function to capture mouse clicks
-pause = 0
-def onClick(event):
-    global pause
+# Make shared phy315 package importable
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from phy315.animation import Player
+from phy315.pulses import Pulses
 
-    if pause == 0:
-        pause = 1
-    else:
-        pause = 0
-        
 # Setup plotting space
 fig = plt.figure(figsize=(7,3.5))
 ax1 = fig.add_subplot(1,1,1)
 
-# Produce animation
-counter = -10.
-
-def animate(i):
-    global counter, pause
-    ax1.clear()
-
-    # Generate animation plot
-    A = 8.
-    plt.xlim(-10, 10)
-    plt.ylim(0., 2.)
-    plt.xlabel(r"$x$", size='large')
+plt.xlim(-10, 10)
+plt.ylim(0., 2.)
+plt.xlabel(r"$x$", size='large')
 
-    xx = np.arange(-10.,10.,0.01)
-    yy = []
+# Triangular pulse traveling to right and top-hat pulse traveling to
+# left, both reentering at x = -12 (or +12) after leaving at x = +12 (or -12)
+xx     = np.arange(-10.,10.,0.01)
+pulses = Pulses(xx, span=(-12., 12.))
+pulses.add('triangle', 0.,  1.)
+pulses.add('tophat',   0., -1.)
 
-    for x in xx:
-        if np.abs(x-counter) < 0.5 and np.abs(x+counter) < 0.5:
-            yy.append(1. - 2.*np.abs(counter-x) + 1.)
-        elif np.abs(x-counter) < 0.5:  
-            yy.append(1. - 2.*np.abs(counter-x))
-        elif np.abs(x+counter) < 0.5:
-            yy.append(1.)
-        else:
-            yy.append(0.)
-            
-    plt.plot(xx, yy, color="blue", lw=3)    
+line, = plt.plot([], [], color="blue", lw=3)
 
-    dt = 0.1
-    if not pause:
-        counter += dt
+# Function to return wavepulses at time t
+def state(t):
+    return [(xx, pulses(t))]
 
-    if counter > 12.:
-        counter = -12.
-
-fig.canvas.mpl_connect('button_press_event', onClick)        
-ani = animation.FuncAnimation(fig,animate,interval=2)
+# Produce animation
+dt  = 0.1
+ani = Player(fig, [line], state, dt, t0=-10.)
 
 plt.show()
@@ -16,6 +16,11 @@ import matplotlib.pyplot as plt
 import matplotlib.animation as animation
 import argparse
 import sys
+import os
+
+# Make shared phy315 package importable
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from phy315.fourier import inverse
 
 # Set up command line options
 parser = argparse.ArgumentParser()
@@ -79,13 +84,7 @@ plt.xlabel("$x/l$", size="large")
 plt.title(R"Inverse Fourier Transform", size="large")
 
 xx = np.arange (-xmax, xmax, dx)
-ff = []
-for x in xx:
-    sum = 0.;
-    for k, C in zip(kk, CC):
-        sum += C*np.cos(k*x)*dk
-
-    ff.append(sum)
+ff = inverse(kk, CC, xx).real
 
 plt.plot(xx, ff, lw=3, color="black")
 plt.axvline(x=0.,  lw=1, color='black', ls='dotted')
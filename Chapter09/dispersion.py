@@ -5,23 +5,39 @@
 """
 Animation to illustrate propagation of dispersive waves
 Pauses on mouse click.
+
+Input parameters:
+
+v - group velocity
+d - rate of change of group velocity with wavenumber
+t - time step
+n - number of wavenumbers in packet
 """
 
 import numpy as np
 import matplotlib.pyplot as plt
-import matplotlib.animation as animation
 import argparse
 import sys
+import os
+
+# Make shared phy315 package importable
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from phy315.animation import Player
+from phy315.packets import WavePacket, gaussian_spectrum
 
 # Set up command line options
 parser = argparse.ArgumentParser()
 parser.add_argument('-v', type=float,  default=1.,   help='group velocity')
+parser.add_argument('-d', type=float,  default=0.,   help='group velocity dispersion')
 parser.add_argument('-t', type=float,  default=0.2,  help='time step')
+parser.add_argument('-n', type=int,    default=200,  help='number of wavenumbers')
 
 # Read command line options
 args = parser.parse_args()
 vg = args.v
+dv = args.d
 dt = args.t
+nk = args.n
 
 # Test input
 if vg < 0.:
@@ -30,58 +46,44 @@ if vg < 0.:
 if dt <= 0.:
     print 'Error: t must be positive'
     sys.exit(1)
+if nk < 1:
+    print 'Error: n must be positive'
+    sys.exit(1)
 
-# Wave data    
+# Wave data
 xmax = 10.;
 dx   = 0.05;
 k0   = 10.;
 kmax = 10.;
-dk   = 0.1
-   
-# Function to capture mouse clicks
-pause = 0
-def onClick(event):
-    global pause
-
-    if pause == 0:
-        pause = 1
-    else:
-        pause = 0
-        
-# Setup plotting space
-fig = plt.figure(figsize=(7,7))
-ax1 = fig.add_subplot(1,1,1)
+dk   = 2.*kmax/nk
 
-# Produce animation
-counter = -int(xmax/vg)
+# Function to return angular frequency at wavenumber k. Phase velocity
+# at k0 is unity.
+def omega(k):
+    return k0 + vg*(k-k0) + 0.5*dv*(k-k0)*(k-k0)
 
-def animate(i):
-    global counter, pause
-    ax1.clear()
+# Set up wave packet made up of Gaussian spectrum of wavenumbers
+xx = np.arange(-xmax,xmax,dx)
+kk = k0 - kmax + dk*np.arange(nk)
 
-    # Generate animation plot
-    plt.xlim(-10, 10)
-    plt.ylim(-1.5, 1.5)
-    plt.xlabel(r"$x$", size='large')
+packet = WavePacket(kk, gaussian_spectrum(kk, k0, 1., dk), omega, xx)
 
-    xx = np.arange(-xmax,xmax,dx)
-    kk = np.arange(-kmax+k0,kmax+k0,dk)
-    yy = []
+# Setup plotting space
+fig = plt.figure(figsize=(7,7))
+ax1 = fig.add_subplot(1,1,1)
 
-    for x in xx:
-        sum = 0.
-        for k in kk:
-            sum += np.cos(k0*(counter-x))*np.exp(-(k-k0)*(k-k0)/2.)*np.cos((k-k0)*(vg*counter-x))*dk
+plt.xlim(-10, 10)
+plt.ylim(-1.5, 1.5)
+plt.xlabel(r"$x$", size='large')
 
-        yy.append(sum/np.sqrt(2.*np.pi))
-  
-            
-    plt.plot(xx, yy, color="blue", lw=3)    
+line, = plt.plot([], [], color="blue", lw=3)
 
-    if not pause:
-        counter += dt
+# Function to return wave packet at time t
+def state(t):
+    return [(xx, packet(t))]
 
-fig.canvas.mpl_connect('button_press_event', onClick)        
-ani = animation.FuncAnimation(fig,animate,interval=2)
+# Produce animation
+t0  = -int(xmax/vg) if vg > 0. else 0.
+ani = Player(fig, [line], state, dt, t0)
 
 plt.show()
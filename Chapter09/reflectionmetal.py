@@ -5,6 +5,7 @@
 """
 Animation to illustrate reflection of sinusoidal traveling wave 
 at vacuum metal boundary. Animation plots electric field.
+Optionally plots R and T against impedance ratio.
 Pauses on mouse click.
 
 Input parameters:
@@ -12,19 +13,27 @@ Input parameters:
 a - ratio of impedance in metal to that in free space
 z - plot from -z to +z
 t - time step
+s - plot R and T against a beneath animation
 """
 
 import numpy as np
 import matplotlib.pyplot as plt
-import matplotlib.animation as animation
 import argparse
 import sys
+import os
+
+# Make shared phy315 package importable
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from phy315.animation import Player
+from phy315.fields import SeparableField
+from phy315.reflection import metal_index, power, phasors, sweep, plot_power
 
 # Set up command line options
 parser = argparse.ArgumentParser()
 parser.add_argument('-a', type=float,  default=0.2,  help='impedance ratio')
 parser.add_argument('-z', type=float,  default=10.,  help='plot from -z to +z')
 parser.add_argument('-t', type=float,  default=0.02, help='time step')
+parser.add_argument('-s', action='store_true',       help='plot R and T against a')
 
 # Read command line options
 args = parser.parse_args()
@@ -42,58 +51,44 @@ if z <= 0.:
 if dt <= 0.:
     print 'Error: t must be positive'
     sys.exit(1)
-   
-# Function to capture mouse clicks
-pause = 0
-def onClick(event):
-    global pause
-
-    if pause == 0:
-        pause = 1
-    else:
-        pause = 0
-        
+
+# Generate wave data: electric field at time t is Re[E exp(2 pi i t)]
+n    = metal_index(a)
+R, T = power(n)
+zz   = np.concatenate((np.arange(-z, 0., z*0.01), np.arange(0., z, z*0.01)))
+E, H = phasors(n, zz)
+efield = SeparableField([E.real, -E.imag], [2.*np.pi, 2.*np.pi], [0., np.pi/2.])
+
 # Setup plotting space
 fig = plt.figure(figsize=(7,7))
-ax1 = fig.add_subplot(1,1,1)
+if args.s:
+    fig.subplots_adjust(hspace=.45)
+    ax1 = fig.add_subplot(2,1,1)
+else:
+    ax1 = fig.add_subplot(1,1,1)
+
+# Generate animation plot
+plt.xlim(-z, z)
+plt.ylim(-2.25, 2.25)
+plt.xlabel("$z/\lambda_0$",    size='large')
+plt.ylabel(r"$E_x$", size='large')
+plt.title(r"$Z/Z_0$ = %4.2f  $R$ = %4.2f  $T$ = %4.2f" %(a,R,T), size='large')
+
+line1, = plt.plot([], [], color="blue", ls="solid", lw=2)
+axis   = plt.axhline(y=0., lw=2, color='black', ls='dotted')
+wall   = plt.axvline(x=0., lw=4, color='black')
+
+# R and T against impedance ratio
+if args.s:
+    plot_power(fig.add_subplot(2,1,2), *sweep('metal', 1e-3, 1e3, log=True),
+               value=a, label="$Z/Z_0$", log=True)
+
+# Function to return electric field at time t (other artists are
+# animated, but unchanged, so that they are drawn over it)
+def state(t):
+    return [(zz, efield(t)), None, None]
 
 # Produce animation
-counter = 0.
-
-def animate(i):
-    global counter, pause
-    ax1.clear()
-
-    # Generate wave data
-    Er = - np.sqrt(1.+a**4)/(1.+np.sqrt(2.)*a+a*a)
-    pr = np.arctan2(-np.sqrt(2.)*a,1.-a*a)
-    Et = np.sqrt(2.)*a*np.sqrt((1.+np.sqrt(2.)*a)**2+1.)/(1.+np.sqrt(2.)*a+a*a)
-    pt = np.arctan2(1.,1.+np.sqrt(2.)*a)
-    R  = (1.+a**4)/(1.+np.sqrt(2.)*a+a*a)**2
-    T  = 1.-R
-
-    # Generate animation plot
-    plt.xlim(-z, z)
-    plt.ylim(-2.25, 2.25)
-    plt.xlabel("$z/\lambda_0$",    size='large')
-    plt.ylabel(r"$E_x$", size='large')
-    plt.title(r"$Z/Z_0$ = %4.2f  $R$ = %4.2f  $T$ = %4.2f" %(a,R,T), size='large')
-    
-    zl = np.arange(-z, 0., z*0.01)
-    zr = np.arange(0.,  z, z*0.01)
-
-    el = np.cos(2.*np.pi*(counter-zl)) +  Er*np.cos(2.*np.pi*(counter+zl)+pr)
-    er = Et*np.exp(-2.*np.pi*zr/np.sqrt(2.)/a)*np.cos(2.*np.pi*(counter-zr/np.sqrt(2.)/a)+pt)
-
-    plt.plot(zl, el, color="blue", ls="solid", lw=2)
-    plt.plot(zr, er, color="blue", ls="solid", lw=2)
-    plt.axhline(y=0., lw=2, color='black', ls='dotted')
-    plt.axvline(x=0., lw=4, color='black')
-
-    if not pause:
-        counter += dt
-
-fig.canvas.mpl_connect('button_press_event', onClick)        
-ani = animation.FuncAnimation(fig,animate,interval=2)
+ani = Player(fig, [line1, axis, wall], state, dt)
 
 plt.show()
@@ -5,6 +5,7 @@
 """
 Animation to illustrate reflection of sinusoidal traveling wave 
 at vacuum plasma boundary. Animation plots energy flux.
+Optionally plots R and T against frequency ratio.
 Pauses on mouse click.
 
 Input parameters:
@@ -12,19 +13,27 @@ Input parameters:
 w - ratio of wave frequency to plasma frequency
 z - plot from -z to +z
 t - time step
+s - plot R and T against w beneath animation
 """
 
 import numpy as np
 import matplotlib.pyplot as plt
-import matplotlib.animation as animation
 import argparse
 import sys
+import os
+
+# Make shared phy315 package importable
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from phy315.animation import Player
+from phy315.fields import SeparableField
+from phy315.reflection import plasma_index, power, phasors, sweep, plot_power
 
 # Set up command line options
 parser = argparse.ArgumentParser()
-parser.add_argument('-w', type=float,  default=0.8,   help='frequency ratio')
-parser.add_argument('-z', type=float,  default=10.,   help='frequency ratio')
+parser.add_argument('-w', type=float,  default=0.8,  help='frequency ratio')
+parser.add_argument('-z', type=float,  default=10.,  help='plot from -z to +z')
 parser.add_argument('-t', type=float,  default=0.02, help='time step')
+parser.add_argument('-s', action='store_true',       help='plot R and T against w')
 
 # Read command line options
 args = parser.parse_args()
@@ -33,6 +42,9 @@ z  = args.z
 dt = args.t
 
 # Test input
+if w <= 0.:
+    print 'Error: w must be positive'
+    sys.exit(1)
 if w >= 1.:
     print 'Error: w must be less than unity'
     sys.exit(1)
@@ -42,62 +54,50 @@ if z <= 0.:
 if dt <= 0.:
     print 'Error: t must be positive'
     sys.exit(1)
-   
-# Function to capture mouse clicks
-pause = 0
-def onClick(event):
-    global pause
-
-    if pause == 0:
-        pause = 1
-    else:
-        pause = 0
-        
+
+# Generate wave data: fields at time t are Re[E exp(2 pi i t)] and
+# Re[H exp(2 pi i t)]
+n    = plasma_index(w)
+R, T = power(n)
+zz   = np.concatenate((np.arange(-z, 0., 0.01*z), np.arange(0., z, 0.01*z)))
+E, H = phasors(n, zz)
+efield = SeparableField([E.real, -E.imag], [2.*np.pi, 2.*np.pi], [0., np.pi/2.])
+hfield = SeparableField([H.real, -H.imag], [2.*np.pi, 2.*np.pi], [0., np.pi/2.])
+flux   = np.empty_like(zz)
+
 # Setup plotting space
 fig = plt.figure(figsize=(7,7))
-ax1 = fig.add_subplot(1,1,1)
+if args.s:
+    fig.subplots_adjust(hspace=.45)
+    ax1 = fig.add_subplot(2,1,1)
+else:
+    ax1 = fig.add_subplot(1,1,1)
+
+# Generate animation plot
+plt.xlim(-z, z)
+plt.ylim(-2.25, 2.25)
+plt.xlabel("$z/\lambda_0$",    size='large')
+plt.ylabel(r"${\cal I}_z/{\cal I}_{i\,z}$", size='large')
+plt.title(r"$\omega/\omega_p$ = %4.2f  $R$ = %4.2f  $T$ = %4.2f" %(w, R, T), size='large')
+
+# Energy flux and boundary
+line1, = plt.plot([], [], color="blue", ls="solid", lw=2)
+axis   = plt.axhline(y=0., lw=2, color='black', ls='dotted')
+wall   = plt.axvline(x=0., lw=4, color='black')
+
+# R and T against frequency ratio
+if args.s:
+    plot_power(fig.add_subplot(2,1,2), *sweep('plasma', 1e-3, 3.),
+               value=w, label=r"$\omega/\omega_p$")
+
+# Function to return energy flux at time t (other artists are animated,
+# but unchanged, so that they are drawn over it)
+def state(t):
+    np.multiply(efield(t), hfield(t), out=flux)
+    np.multiply(flux, 2., out=flux)
+    return [(zz, flux), None, None]
 
 # Produce animation
-counter = 0.
-
-def animate(i):
-    global counter, pause
-    ax1.clear()
-
-    # Generate wave data
-    alpha = np.sqrt(1./w/w-1.)
-    pr    = np.arctan(2.*alpha/(1.-alpha*alpha))
-    pt    = np.arctan(alpha)
-    Et    = 2./np.sqrt(1.+alpha*alpha)
-    R     = 1.
-    T     = 0.
-
-    # Generate animation plot
-    plt.xlim(-z, z)
-    plt.ylim(-2.25, 2.25)
-    plt.xlabel("$z/\lambda_0$",    size='large')
-    plt.ylabel(r"${\cal I}_z/{\cal I}_{i\,z}$", size='large')
-    plt.title(r"$\omega/\omega_p$ = %4.2f  $R$ = %4.2f  $T$ = %4.2f" %(w, R, T), size='large')
-    
-    zl = np.arange(-z, 0., 0.01*z)
-    zr = np.arange(0.,  z, 0.01*z)
-
-    el = np.cos(2.*np.pi*(counter-zl)) +  np.cos(2.*np.pi*(counter+zl)+pr)
-    hl = np.cos(2.*np.pi*(counter-zl)) -  np.cos(2.*np.pi*(counter+zl)+pr)
-    er = Et*np.exp(-2.*np.pi*alpha*zr)*np.cos(2.*np.pi*counter+pt)
-    hr = alpha*Et*np.exp(-2.*np.pi*alpha*zr)*np.sin(2.*np.pi*counter+pt)
-    il = 2.*el*hl
-    ir = 2.*er*hr
-
-    plt.plot(zl, il, color="blue", ls="solid", lw=2)
-    plt.plot(zr, ir, color="blue", ls="solid", lw=2)
-    plt.axhline(y=0., lw=2, color='black', ls='dotted')
-    plt.axvline(x=0., lw=4, color='black')
-
-    if not pause:
-        counter += dt
-
-fig.canvas.mpl_connect('button_press_event', onClick)        
-ani = animation.FuncAnimation(fig,animate,interval=2)
+ani = Player(fig, [line1, axis, wall], state, dt)
 
 plt.show()
@@ -7,31 +7,41 @@ Widget to illustrate Rayleigh criterion for resolving
 power of telescope. Plots intensity versus angle in two
 dimensions. Saves output as png image. 
 
-Input parameter:
+Input parameters:
 
 d - angular separation between stars
+n - number of grid points in each direction
 """
 
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.widgets import Slider, Button
 from matplotlib import colors, cm
-import scipy.special as sp
 import argparse
 import sys
+import os
+
+# Make shared phy315 package importable
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from phy315.diffraction import airy_grid
 
 # Set up command line options
 parser = argparse.ArgumentParser()
 parser.add_argument('-d', type=float, default=1.22, help='angular spacing')
+parser.add_argument('-n', type=int,   default=1000, help='grid points')
 
 # Read command line options
 args = parser.parse_args()
 d  = args.d
+N  = args.n
 
 # Test input
 if d < 0.:
     print 'Error: d must be positive'
     sys.exit(1)
+if N < 2:
+    print 'Error: n must be greater than one'
+    sys.exit(1)
 
 # Setup plotting space
 fig = plt.figure(figsize=(7,7))
@@ -44,20 +54,7 @@ plt.xlabel(r"$\theta_x\,D/\lambda$", size='large')
 plt.ylabel(r"$\theta_y\,D/\lambda$", size='large')
 plt.title (r"$\Delta\theta\,D/\lambda$ = %4.2f" %(d))
 
-N = 1000
-x = np.linspace(-8., 8., N)
-y = np.linspace(-8., 8., N)
-
-X, Y = np.meshgrid(x, y)
-
-Z = np.zeros_like(X)
-
-for i in range(N):
-        for j in range(N):
-            r1 = np.sqrt(Y[i,j]*Y[i,j]+(X[i,j]-d/2.)*(X[i,j]-d/2.))
-            r2 = np.sqrt(Y[i,j]*Y[i,j]+(X[i,j]+d/2.)*(X[i,j]+d/2.))
-            Z[i,j]  = (sp.j0(np.pi*r1) + sp.jn(2,np.pi*r1))**2
-            Z[i,j] += (sp.j0(np.pi*r2) + sp.jn(2,np.pi*r2))**2
+X, Y, Z = airy_grid(N, d, 8.)
 
 max = np.amax(Z) + 0.01            
 levels = np.arange(0.,max,0.01)
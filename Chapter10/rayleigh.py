@@ -7,21 +7,40 @@ Widget to illustrate Rayleigh criterion for resolving
 power of telescope. Plots intensity versus angle in
 one dimension as a function of Delta_theta where Delta_theta is
 angular distance between two neighboring stars.
+
+Input parameters:
+
+n - number of sample angles
 """
 
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.widgets import Slider, Button
-import scipy.special as sp
+import argparse
+import sys
+import os
+
+# Make shared phy315 package importable
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from phy315.diffraction import two_star_profile
+
+# Set up command line options
+parser = argparse.ArgumentParser()
+parser.add_argument('-n', type=int, default=1600, help='sample angles')
+
+# Read command line options
+args = parser.parse_args()
+N    = args.n
+
+# Test input
+if N < 2:
+    print 'Error: n must be greater than one'
+    sys.exit(1)
 
 # Generate initial plot
 dd0 = 1.22
-tt  = np.arange(-8.,8.,0.01)
-I   = []
-for t in tt:
-    F1 = sp.j0(np.pi*(t-dd0/2.)) + sp.jn(2,np.pi*(t-dd0/2.))
-    F2 = sp.j0(np.pi*(t+dd0/2.)) + sp.jn(2,np.pi*(t+dd0/2.))
-    I.append(F1*F1+F2*F2)
+tt  = -8. + 16.*np.arange(N)/N
+I   = two_star_profile(tt, dd0)
 
 fig, ax = plt.subplots()
 plt.subplots_adjust(left=0.20, bottom=0.30)
@@ -38,12 +57,7 @@ sdd     = Slider(axd, r'$D\,\Delta\theta/\lambda$', 0., 8., valinit=dd0)
 # Update plot using slider data
 def update(val):
     dd = sdd.val
-    II  = []
-    for t in tt:
-        F1 =  sp.j0(np.pi*(t-dd/2.)) + sp.jn(2,np.pi*(t-dd/2.))
-        F2 = sp.j0(np.pi*(t+dd/2.)) + sp.jn(2,np.pi*(t+dd/2.))
-        II.append(F1*F1+F2*F2)
-    l.set_ydata(II)
+    l.set_ydata(two_star_profile(tt, dd))
     fig.canvas.draw_idle()
 sdd.on_changed(update)
 
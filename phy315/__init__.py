@@ -0,0 +1,7 @@
+"""
+Shared numerical and plotting support for the Physics 315L demos.
+
+The demo scripts in the Chapter directories remain standalone programs;
+this package collects the array-level physics they have in common so
+that each script only has to set up its own figure.
+"""
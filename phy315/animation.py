@@ -0,0 +1,231 @@
+"""
+Blitted animations with persistent artists.
+
+A demo script sets up its axes, labels and static decorations once,
+creates the artists that move (usually with empty data), and supplies a
+function returning the state of the system at time t: one value per
+animated artist. On each tick the Player evaluates that function at the
+current time and pushes the values into the existing artists, so that
+nothing is rebuilt and only the animated artists are redrawn (blit=True).
+
+Values are pushed into artists according to artist type:
+
+    Line2D          - (x, y) pair, passed to set_data
+    AxesImage       - 2-D array, passed to set_data
+    LineCollection  - list of segments, passed to set_segments (see
+                      below), or tuple (segments, linewidths) to set
+                      linewidth of each segment as well
+    Polygon         - N x 2 array of vertices, passed to set_xy
+    Text            - string, passed to set_text
+    other artists   - array, passed to set_array
+
+A value of None leaves the corresponding artist unchanged.
+
+Passing N segments to set_segments builds N new paths, which dominates
+the frame time of collections of thousands of segments. When segments
+are given as one array of equal-length segments, with the same shape as
+in the previous frame, they are instead copied into a buffer whose rows
+are the vertices of the collection's existing paths.
+
+Panels plotting scrolling time histories (see phy315.trace) are passed
+to the Player as traces: whenever one of them scrolls, the whole figure
+is redrawn once so that the new axis limits and tick labels appear.
+
+Frame times of the compute and update phases are recorded when a
+FrameTimer (see phy315.timing) is assigned to the Player's timer.
+
+A PeriodicPlayer animates a state function periodic in time. It can
+evaluate the function over the first period only, storing the values
+(see phy315.framestore), and replay them ever after.
+
+Because only the axes areas are redrawn, animated artists must lie
+inside their axes: titles and axis labels should not change with time.
+"""
+
+import numpy as np
+import weakref
+import matplotlib.animation as animation
+from matplotlib.lines import Line2D
+from matplotlib.image import AxesImage
+from matplotlib.collections import LineCollection
+from matplotlib.patches import Polygon
+from matplotlib.text import Text
+
+from phy315.framestore import FrameStore
+
+# Buffers shared by paths of line collections
+_segments = weakref.WeakKeyDictionary()
+
+# Function to set segments of line collection, reusing its paths when
+# segments form array of same shape as before
+def set_segments(collection, segments):
+    buf = _segments.get(collection)
+    if isinstance(segments, np.ndarray) and segments.ndim == 3:
+        if buf is not None and buf.shape == segments.shape:
+            buf[...] = segments
+            collection.stale = True
+            return
+        buf = np.array(segments, dtype=float)
+        collection.set_segments(buf)
+        paths = collection.get_paths()
+        if len(buf) and len(paths) == len(buf) and np.may_share_memory(paths[0].vertices, buf):
+            _segments[collection] = buf
+        else:
+            _segments.pop(collection, None)
+    else:
+        collection.set_segments(segments)
+        _segments.pop(collection, None)
+
+# Function to push value into artist
+def set_artist(artist, value):
+    if value is None:
+        return
+    if isinstance(artist, Line2D):
+        artist.set_data(value[0], value[1])
+    elif isinstance(artist, AxesImage):
+        artist.set_data(value)
+    elif isinstance(artist, LineCollection):
+        if isinstance(value, tuple):
+            set_segments(artist, value[0])
+            artist.set_linewidths(value[1])
+        else:
+            set_segments(artist, value)
+    elif isinstance(artist, Polygon):
+        artist.set_xy(value)
+    elif isinstance(artist, Text):
+        artist.set_text(value)
+    else:
+        artist.set_array(value)
+
+class _Untimed(object):
+    """
+    Context manager standing in for phase of FrameTimer when not timing.
+    """
+
+    def __enter__(self):
+        pass
+
+    def __exit__(self, *args):
+        pass
+
+_untimed = _Untimed()
+
+class Player(object):
+    """
+    Drive FuncAnimation from pure state function.
+
+    fig      - figure to animate
+    artists  - sequence of animated artists
+    state    - function returning sequence of values, one per artist,
+               at given time
+    dt       - time step per frame
+    t0       - initial time
+    interval - delay between frames (ms)
+    traces   - sequence of scrolling Trace panels updated by state
+
+    Animation pauses and resumes on mouse clicks. Subclasses can change
+    this by overriding onClick() and advance().
+    """
+
+    def __init__(self, fig, artists, state, dt, t0=0., interval=2, traces=()):
+        self.fig     = fig
+        self.artists = list(artists)
+        self.state   = state
+        self.dt      = dt
+        self.counter = t0
+        self.pause   = 0
+        self.traces  = list(traces)
+        self.timer   = None
+
+        for trace in self.traces:
+            trace.scroll()
+
+        fig.canvas.mpl_connect('button_press_event', self.onClick)
+        self.ani = animation.FuncAnimation(fig, self.animate, init_func=self.init,
+                                           interval=interval, blit=True)
+
+    # Function to capture mouse clicks
+    def onClick(self, event):
+        if self.pause == 0:
+            self.pause = 1
+        else:
+            self.pause = 0
+
+    # Function to return time of frame following frame at time t
+    def advance(self, t):
+        if not self.pause:
+            t += self.dt
+        return t
+
+    # Function to redraw whole figure, and background used for blitting
+    def redraw(self):
+        self.fig.canvas.draw()
+        self.ani._blit_cache.clear()
+
+    # Function to return context manager timing named phase of frame
+    def timing(self, name):
+        if self.timer is None:
+            return _untimed
+        return self.timer.phase(name)
+
+    # Function to return values of artists at time t
+    def evaluate(self, t):
+        return self.state(t)
+
+    # Function to set artists to state at time t
+    def seek(self, t):
+        with self.timing('compute'):
+            values = self.evaluate(t)
+        with self.timing('update'):
+            for artist, value in zip(self.artists, values):
+                set_artist(artist, value)
+        if [trace for trace in self.traces if trace.scroll()]:
+            self.redraw()
+        return self.artists
+
+    # Function to initialise blitting
+    def init(self):
+        return self.seek(self.counter)
+
+    # Animation function
+    def animate(self, i):
+        artists = self.seek(self.counter)
+        self.counter = self.advance(self.counter)
+        return artists
+
+class PeriodicPlayer(Player):
+    """
+    Player of state function periodic in time, optionally replaying frames.
+
+    period - period of state function
+    replay - if True, evaluate state function over first period only,
+             storing values of each frame, and replay them thereafter
+    key    - key identifying state function and its parameters (see
+             phy315.framestore.cache_key), under which frames of large
+             animations are kept on disk for later runs
+
+    When replaying, time step is adjusted so that a whole number of
+    frames spans exactly one period. Other arguments are as for Player.
+    """
+
+    def __init__(self, fig, artists, state, dt, period, t0=0., interval=2, traces=(),
+                 replay=False, key=None):
+        self.period = period
+        self.t0     = t0
+        self.store  = None
+        if replay:
+            frames     = max(1, int(round(period/dt)))
+            dt         = period/frames
+            self.store = FrameStore(frames, key)
+        Player.__init__(self, fig, artists, state, dt, t0, interval, traces)
+
+    # Function to return values of artists at time t, from store if
+    # replaying
+    def evaluate(self, t):
+        if self.store is None:
+            return self.state(t)
+        i = int(round((t - self.t0)/self.dt)) % self.store.frames
+        values = self.store.get(i)
+        if values is None:
+            values = self.store.put(i, self.state(self.t0 + i*self.dt))
+        return values
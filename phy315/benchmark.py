@@ -0,0 +1,239 @@
+"""
+Headless frame-time benchmarks of the demo scripts.
+
+Runs each demo script with the non-interactive Agg backend (see
+phy315.export), and times a fixed number of frames of every animation
+it creates, sweeps every slider it creates through its range in the
+same number of steps, and redraws every remaining static figure the
+same number of times. Every frame is rendered in full into an RGBA
+buffer, as when writing a movie, so draw times are those of the whole
+figure rather than of the blitted artists alone. The time taken to run
+the script itself (setup) is recorded as well.
+
+Frame times are split into phases as described in phy315.timing, and
+summarised by their mean and 50th, 95th and 99th percentiles, in
+milliseconds. A table is printed, and the results are optionally
+written to a JSON or CSV report for comparison with later runs.
+
+Usage:
+
+    python -m phy315.benchmark [options] [script ...] [-- script options]
+
+A directory in place of a script benchmarks every script in it. With no
+scripts, every chapter is benchmarked, unless only solvers are timed.
+
+Optionally, numerical routines whose cost grows quickly with problem
+size are timed as well, on problems as large as the demos allow. Each
+has a time limit, generous on any current machine, and exceeding it
+counts as a failure, so that a slow code path cannot go unnoticed.
+
+Input parameters:
+
+o - report file (.json or .csv)
+f - number of frames per animation, slider or figure
+d - resolution (dots per inch)
+s - time numerical solvers as well
+"""
+
+from __future__ import print_function
+
+# Selects Agg backend, so must come before pyplot
+from phy315.export import run
+
+import matplotlib
+import matplotlib.pyplot as plt
+from matplotlib.widgets import Slider
+from itertools import islice
+import numpy as np
+import platform
+import argparse
+import json
+import glob
+import csv
+import io
+import sys
+import os
+
+from phy315.timing import FrameTimer, clock, timer_for, instrument, instrument_slider, format_summary
+
+# Function to render figure fig into buffer, as movie writer would
+def grab(fig, buf, dpi):
+    buf.seek(0)
+    fig.savefig(buf, format='rgba', dpi=dpi)
+
+# Function to benchmark demo script with command line options argv over
+# given number of frames. Returns list of results, one per animation,
+# slider, or static figure.
+def benchmark(script, argv=(), frames=100, dpi=None):
+    plt.close('all')
+    start = clock()
+    namespace, animations = run(script, argv)
+    setup = 1e3*(clock() - start)
+
+    results = []
+    buf     = io.BytesIO()
+    def record(kind, timer, first):
+        result = timer.summary(first)
+        result['script'] = script
+        result['kind']   = kind
+        result['setup']  = setup
+        results.append(result)
+
+    for ani in animations:
+        timer = instrument(ani)
+        first = timer.count
+        for framedata in islice(ani.new_frame_seq(), frames):
+            timer.begin()
+            ani._draw_frame(framedata)
+            grab(ani._fig, buf, dpi)
+            timer.end()
+        record('animation', timer, first)
+
+    sliders = [value for value in namespace.values() if isinstance(value, Slider)]
+    for slider in sliders:
+        timer = instrument_slider(slider)
+        first = timer.count
+        for val in np.linspace(slider.valmin, slider.valmax, frames):
+            slider.set_val(val)
+            grab(slider.ax.figure, buf, dpi)
+            timer.end()
+        slider.reset()
+        record('slider', timer, first)
+
+    busy    = set(ani._fig for ani in animations) | set(slider.ax.figure for slider in sliders)
+    figures = [plt.figure(i) for i in plt.get_fignums()]
+    for fig in figures:
+        if fig in busy:
+            continue
+        timer = timer_for(fig)
+        first = timer.count
+        for i in range(frames):
+            timer.begin()
+            grab(fig, buf, dpi)
+            timer.end()
+        record('figure', timer, first)
+
+    plt.close('all')
+    return results
+
+# Function to return numerical routines timed by solvers(), as list of
+# (name, function of no arguments, time limit in seconds)
+def _solvers():
+    from phy315.oscillators import chain_modes
+
+    rng = np.random.RandomState(0)
+    m1  = 1. + 0.3*rng.uniform(-1., 1., 8000)
+    m2  = 1. + 0.3*rng.uniform(-1., 1., 10**5)
+    return [
+        ('chain_modes: all 8000 frequencies', lambda: chain_modes(m1, np.ones(8001), vectors=False), 10.),
+        ('chain_modes: 1 mode of 10^5 masses', lambda: chain_modes(m2, np.ones(10**5+1), 10, 10), 5.),
+    ]
+
+# Function to time numerical routines. Returns list of results.
+def solvers():
+    results = []
+    for name, func, limit in _solvers():
+        start = clock()
+        func()
+        elapsed = clock() - start
+        results.append({'name': name, 'time': 1e3*elapsed, 'limit': 1e3*limit,
+                        'ok': elapsed <= limit})
+    return results
+
+# Function to write results to report file, as CSV if path ends in .csv,
+# otherwise as JSON
+def write_report(path, results, info):
+    if path.endswith('.csv'):
+        keys = ['script', 'kind', 'setup', 'frames']
+        keys = keys + ['%s_%s' % (name, stat) for name in FrameTimer.columns
+                       for stat in ('mean', 'p50', 'p95', 'p99')]
+        with open(path, 'w') as f:
+            writer = csv.writer(f)
+            writer.writerow(keys)
+            for result in results:
+                writer.writerow([result[key] for key in keys])
+    else:
+        report = dict(info)
+        report['results'] = results
+        with open(path, 'w') as f:
+            json.dump(report, f, indent=1)
+
+def main(args=None):
+    if args is None:
+        args = sys.argv[1:]
+    argv = []
+    if '--' in args:
+        i    = args.index('--')
+        argv = args[i+1:]
+        args = args[:i]
+
+    # Set up command line options
+    parser = argparse.ArgumentParser(prog='python -m phy315.benchmark')
+    parser.add_argument('scripts', nargs='*',                    help='demo scripts or directories')
+    parser.add_argument('-o', type=str,   default=None,          help='report file (.json or .csv)')
+    parser.add_argument('-f', type=int,   default=100,           help='number of frames')
+    parser.add_argument('-d', type=float, default=None,          help='resolution (dpi)')
+    parser.add_argument('-s', action='store_true',               help='time numerical solvers')
+
+    # Read command line options
+    opts = parser.parse_args(args)
+
+    # Test input
+    if opts.f < 1:
+        parser.error('f must be positive')
+
+    paths = opts.scripts
+    if not paths and not opts.s:
+        root  = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)
+        paths = sorted(glob.glob(os.path.join(os.path.relpath(root), 'Chapter*')))
+
+    scripts = []
+    for path in paths:
+        if os.path.isdir(path):
+            scripts.extend(sorted(glob.glob(os.path.join(path, '*.py'))))
+        else:
+            scripts.append(path)
+
+    results = []
+    failed  = 0
+    for script in scripts:
+        try:
+            found = benchmark(script, argv, opts.f, opts.d)
+        except SystemExit:
+            print('%s: exited during setup' % script, file=sys.stderr)
+            failed += 1
+        except Exception as e:
+            print('%s: %s: %s' % (script, type(e).__name__, e), file=sys.stderr)
+            failed += 1
+        else:
+            for result in found:
+                print('%s: %s: %d frames, setup %.1f ms' % (script, result['kind'],
+                                                           result['frames'], result['setup']))
+                print(format_summary(result))
+            results.extend(found)
+
+    timings = []
+    if opts.s:
+        for result in solvers():
+            print('%-40s %9.1f ms (limit %.0f ms)%s' % (result['name'], result['time'], result['limit'],
+                                                      '' if result['ok'] else ' TOO SLOW'))
+            if not result['ok']:
+                failed += 1
+            timings.append(result)
+
+    if opts.o:
+        info = {'frames':     opts.f,
+                'dpi':        opts.d,
+                'argv':       argv,
+                'python':     platform.python_version(),
+                'numpy':      np.__version__,
+                'matplotlib': matplotlib.__version__,
+                'machine':    platform.machine(),
+                'processor':  platform.processor(),
+                'solvers':    timings}
+        write_report(opts.o, results, info)
+
+    return 1 if failed else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
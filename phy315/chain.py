@@ -0,0 +1,69 @@
+"""
+Chains of blocks joined by springs.
+
+A MassChain draws N blocks, and the springs joining neighbouring blocks
+to one another and to the walls at either end, as two line collections:
+one artist for all blocks and one for all springs, however long the
+chain. Given the positions of the centres of the blocks, as one array,
+it returns the outlines of the blocks and the springs as arrays, ready
+to be passed to a Player (see phy315.animation), which updates both
+collections in place.
+"""
+
+import numpy as np
+from matplotlib.collections import LineCollection
+
+class MassChain(object):
+    """
+    Chain of blocks joined by horizontal springs, drawn in axes.
+
+    ax     - axes in which chain is drawn
+    N      - number of blocks
+    left   - x coordinate of wall at left end, or None if end is free
+    right  - x coordinate of wall at right end, or None if end is free
+    width  - width of blocks
+    height - height of blocks
+
+    Blocks and springs are the chain's artists, in that order. Calling
+    chain with positions of block centres returns their values, written
+    into same arrays on every call.
+    """
+
+    def __init__(self, ax, N, left=None, right=None, width=0.3, height=0.5):
+        self.N     = N
+        self.left  = left
+        self.right = right
+        self.dx    = 0.5*width*np.array([-1., 1., 1., -1., -1.])
+
+        self.masses  = LineCollection([], linewidths=3, colors="blue")
+        self.springs = LineCollection([], linewidths=5, colors="red", linestyles="dotted")
+        ax.add_collection(self.springs)
+        ax.add_collection(self.masses)
+        self.artists = [self.masses, self.springs]
+
+        self.corners = np.empty((N, 5, 2))
+        self.corners[:, :, 1] = 0.5*height*np.array([-1., -1., 1., 1., -1.])
+        nsprings = N - 1 + (left is not None) + (right is not None)
+        self.lines = np.zeros((max(nsprings, 0), 2, 2))
+
+    # Function to return outlines of blocks, and springs, given positions
+    # of block centres
+    def __call__(self, x):
+        np.add(x[:, np.newaxis], self.dx, out=self.corners[:, :, 0])
+
+        # Springs run from right edge of each block (or left wall) to
+        # left edge of next block (or right wall)
+        starts = self.corners[:, 1, 0]
+        ends   = self.corners[:, 0, 0]
+        if self.left is None:
+            ends = ends[1:]
+        else:
+            starts = np.concatenate(([self.left], starts))
+        if self.right is None:
+            starts = starts[:-1]
+        else:
+            ends = np.concatenate((ends, [self.right]))
+        self.lines[:, 0, 0] = starts
+        self.lines[:, 1, 0] = ends
+
+        return [self.corners, self.lines]
@@ -0,0 +1,74 @@
+"""
+Far-field diffraction patterns of circular apertures.
+
+All functions operate on whole arrays, so that a complete meshgrid is
+evaluated with one pass through each Bessel-function ufunc rather than
+one scalar call per pixel. Angles are measured in units of lambda/D.
+
+One-dimensional profiles, redrawn whenever a slider moves, avoid Bessel
+functions altogether: the single-star intensity is tabulated once on a
+fine grid of angular distances and cached, and each star's contribution
+is then a linear interpolation in that table, shifted to the star's
+position (see phy315.kernels).
+"""
+
+import numpy as np
+import scipy.special as sp
+
+from phy315.kernels import shifted_interp
+
+# Cache of single-star intensity tables
+_tables = {}
+
+# Function to return Airy amplitude J0(pi r) + J2(pi r) at angular
+# distance r from star. Uses identity J0(x) + J2(x) = 2 J1(x)/x, since
+# J1 is much cheaper to evaluate than integer-order jn.
+def airy(r):
+    x = np.pi*np.asarray(r, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        F = 2.*sp.j1(x)/x
+    return np.where(x == 0., 1., F)
+
+# Function to return grid and two-star intensity on N x N grid spanning
+# [-extent, extent] in both directions.
+#
+# Grid is symmetric in x, so amplitude due to star at -d/2 is mirror image
+# of amplitude due to star at +d/2: radial distances and Bessel functions
+# only need to be evaluated once. Rows are processed in blocks of at most
+# chunk points to bound size of temporary arrays on very large grids.
+def airy_grid(N, d, extent=8., chunk=2**20):
+    x = np.linspace(-extent, extent, N)
+    y = np.linspace(-extent, extent, N)
+    X, Y = np.meshgrid(x, y)
+
+    Z   = np.empty_like(X)
+    X1  = (x - d/2.)**2
+    dn  = max(1, chunk//N)
+    for i in range(0, N, dn):
+        y2 = y[i:i+dn, np.newaxis]**2
+        F  = airy(np.sqrt(y2 + X1))
+        F *= F
+        np.add(F, F[:, ::-1], out=Z[i:i+dn])
+
+    return X, Y, Z
+
+# Function to return lookup table (r, I) of single-star intensity
+# airy(r)^2 on [0, rmax], with spacing at most step. Tables are cached,
+# with rmax rounded up to a power of two so that few are ever built.
+def intensity_table(rmax, step=1e-3):
+    size = 1.
+    while size < rmax:
+        size *= 2.
+    key = (size, step)
+    if key not in _tables:
+        r = np.linspace(0., size, int(np.ceil(size/step)) + 1)
+        F = airy(r)
+        _tables[key] = (r, F*F)
+    return _tables[key]
+
+# Function to return intensity due to two equal stars at -d/2 and d/2
+# at angles t, by interpolation in cached single-star table
+def two_star_profile(t, d, step=1e-3):
+    t    = np.asarray(t, dtype=float)
+    r, I = intensity_table(np.amax(np.abs(t)) + abs(d)/2., step)
+    return shifted_interp(t, (d/2., -d/2.), r, I)
@@ -0,0 +1,337 @@
+"""
+Headless batch rendering of the demo scripts.
+
+Runs one or more demo scripts with the non-interactive Agg backend in
+place of the GUI, then writes every animation they create to a video
+or PNG sequence, and every static figure to a PNG image. Animations
+are driven by their own animation functions, so frames are the same
+ones the interactive demo would show. They are streamed to the writer
+as they are produced: either an ffmpeg pipe (when ffmpeg is installed)
+or one PNG file per frame.
+
+Frames of demos whose state depends only on time can instead be
+rendered in parallel by a pool of worker processes. Each worker runs
+the script once, then jumps straight to the time of every frame it is
+given and saves that frame as a PNG file. The frames are reassembled in
+order into a video afterwards, if ffmpeg is available. Time-driven
+demos qualify if they either animate through a Player without trace
+panels, or keep their time in a global variable counter which advances
+by dt every frame and record no history.
+
+Usage:
+
+    python -m phy315.export [options] script [script ...] [-- script options]
+
+A directory in place of a script renders every script in it. Options
+following -- are passed to every script.
+
+Input parameters:
+
+o - output directory
+f - number of frames per animation
+r - frame rate (frames per second)
+d - resolution (dots per inch)
+w - writer: png, ffmpeg, or auto (ffmpeg if available, otherwise png)
+p - number of worker processes
+"""
+
+from __future__ import print_function
+
+import matplotlib
+matplotlib.use('Agg')
+
+import matplotlib.pyplot as plt
+import matplotlib.animation as animation
+from contextlib import contextmanager
+import multiprocessing
+import subprocess
+import argparse
+import glob
+import sys
+import os
+
+from phy315.animation import Player
+from phy315.trace import Trace
+from phy315.timing import execute
+
+class PNGWriter(object):
+    """
+    Streaming movie writer saving each frame as numbered PNG file.
+
+    Frames of movie outfile are written to directory outfile, as
+    frame_00000.png, frame_00001.png, and so on.
+    """
+
+    def __init__(self, fps=30.):
+        self.fps = fps
+
+    def setup(self, fig, outfile, dpi=None):
+        self.fig    = fig
+        self.outdir = outfile
+        self.dpi    = dpi
+        self.frame  = 0
+        if not os.path.isdir(outfile):
+            os.makedirs(outfile)
+
+    def grab_frame(self, **savefig_kwargs):
+        path = os.path.join(self.outdir, 'frame_%05d.png' % self.frame)
+        self.fig.savefig(path, dpi=self.dpi, format='png', **savefig_kwargs)
+        self.frame += 1
+
+    def finish(self):
+        pass
+
+    @contextmanager
+    def saving(self, fig, outfile, dpi, *args, **kwargs):
+        self.setup(fig, outfile, dpi)
+        try:
+            yield self
+        finally:
+            self.finish()
+
+# Function to return writer instance and output file suffix
+def get_writer(name, fps):
+    if name == 'auto':
+        if animation.writers.is_available('ffmpeg'):
+            name = 'ffmpeg'
+        else:
+            name = 'png'
+    if name == 'ffmpeg':
+        return animation.FFMpegWriter(fps=fps), '.mp4'
+    elif name == 'png':
+        return PNGWriter(fps=fps), ''
+    else:
+        raise ValueError('Unknown writer: %s' % name)
+
+@contextmanager
+def capture():
+    """
+    Context manager within which plt.show() does nothing, and every
+    FuncAnimation created is appended to list yielded.
+    """
+    animations = []
+    FuncAnimation = animation.FuncAnimation
+
+    class RecordedAnimation(FuncAnimation):
+        def __init__(self, fig, func, *args, **kwargs):
+            FuncAnimation.__init__(self, fig, func, *args, **kwargs)
+            self.animate = func
+            animations.append(self)
+
+    show = plt.show
+    animation.FuncAnimation = RecordedAnimation
+    plt.show = lambda *args, **kwargs: None
+    try:
+        yield animations
+    finally:
+        animation.FuncAnimation = FuncAnimation
+        plt.show = show
+
+# Function to run demo script with command line options argv, capturing
+# figures and animations instead of showing them. Returns script namespace
+# and animations.
+def run(script, argv=()):
+    with capture() as animations:
+        namespace = execute(script, argv)
+    return namespace, animations
+
+# Function to render demo script with command line options argv into
+# directory outdir. Returns list of files or directories written. (Files
+# that scripts save themselves, such as airy.png, are still written to
+# current directory.)
+def render(script, argv=(), outdir='renders', frames=300, fps=30., dpi=None,
+           writer='auto'):
+    name = os.path.splitext(os.path.basename(script))[0]
+    if not os.path.isdir(outdir):
+        os.makedirs(outdir)
+
+    plt.close('all')
+    namespace, animations = run(script, argv)
+    written = []
+
+    for n, ani in enumerate(animations):
+        movie, suffix = get_writer(writer, fps)
+        stem = name if len(animations) == 1 else '%s_%d' % (name, n)
+        path = os.path.join(outdir, stem + suffix)
+        ani.save_count = frames
+        ani.save(path, writer=movie, dpi=dpi)
+        written.append(path)
+
+    animated = set(ani._fig for ani in animations)
+    figures  = [plt.figure(i) for i in plt.get_fignums()]
+    figures  = [fig for fig in figures if fig not in animated]
+    for n, fig in enumerate(figures):
+        stem = name if len(figures) == 1 else '%s_%d' % (name, n)
+        path = os.path.join(outdir, stem + '.png')
+        fig.savefig(path, dpi=dpi)
+        written.append(path)
+
+    plt.close('all')
+    return written
+
+# Function to return function drawing frame i of animation ani created by
+# script with given namespace, by jumping directly to time of frame, or
+# None if frames of animation are not pure functions of time. A Player
+# knows its own trace panels; other animations are taken to record a
+# history if the script holds a Trace in a global variable.
+def seeker(namespace, ani):
+    player = getattr(ani.animate, '__self__', None)
+    if isinstance(player, Player):
+        if player.traces:
+            return None
+        t0 = player.counter
+        def seek(i):
+            player.seek(t0 + i*player.dt)
+        return seek
+
+    for value in namespace.values():
+        if isinstance(value, Trace):
+            return None
+
+    if 'counter' in namespace and 'dt' in namespace:
+        c0 = namespace['counter']
+        dt = namespace['dt']
+        def seek(i):
+            namespace['counter'] = c0 + i*dt
+            ani.animate(i)
+            namespace['counter'] = c0
+        return seek
+
+    return None
+
+# State of worker process: animation figure, and function drawing frame
+_worker = {}
+
+# Function to initialise worker process by running script
+def _init_worker(script, argv, n):
+    namespace, animations = run(script, argv)
+    ani = animations[n]
+    _worker['fig']  = ani._fig
+    _worker['seek'] = seeker(namespace, ani)
+
+# Function to render frames in range(start, stop) into directory outdir
+def _render_frames(job):
+    start, stop, outdir, dpi = job
+    for i in range(start, stop):
+        _worker['seek'](i)
+        path = os.path.join(outdir, 'frame_%05d.png' % i)
+        _worker['fig'].savefig(path, dpi=dpi, format='png')
+    return stop - start
+
+# Function to render demo script with command line options argv into
+# directory outdir using pool of processes. Animations whose frames are
+# not pure functions of time are rendered serially. Returns list of files
+# or directories written.
+def render_parallel(script, argv=(), outdir='renders', frames=300, fps=30.,
+                    dpi=None, writer='auto', processes=None):
+    if processes is None:
+        processes = multiprocessing.cpu_count()
+    name = os.path.splitext(os.path.basename(script))[0]
+    if not os.path.isdir(outdir):
+        os.makedirs(outdir)
+
+    plt.close('all')
+    namespace, animations = run(script, argv)
+    seekers = [seeker(namespace, ani) for ani in animations]
+    plt.close('all')
+    if not animations or None in seekers:
+        return render(script, argv, outdir, frames, fps, dpi, writer)
+
+    if writer == 'auto':
+        if animation.writers.is_available('ffmpeg'):
+            writer = 'ffmpeg'
+        else:
+            writer = 'png'
+
+    written = []
+    for n in range(len(animations)):
+        stem = name if len(animations) == 1 else '%s_%d' % (name, n)
+        path = os.path.join(outdir, stem)
+        if not os.path.isdir(path):
+            os.makedirs(path)
+
+        # Split frames into contiguous chunks, several per process so
+        # that faster workers pick up the slack
+        size = max(1, frames//(4*processes))
+        jobs = [(i, min(i+size, frames), path, dpi) for i in range(0, frames, size)]
+
+        pool = multiprocessing.Pool(processes, _init_worker, (script, list(argv), n))
+        try:
+            for count in pool.imap_unordered(_render_frames, jobs):
+                pass
+        finally:
+            pool.terminate()
+            pool.join()
+
+        if writer == 'ffmpeg':
+            movie = path + '.mp4'
+            subprocess.check_call(['ffmpeg', '-y', '-loglevel', 'error',
+                                   '-framerate', str(fps),
+                                   '-i', os.path.join(path, 'frame_%05d.png'),
+                                   '-pix_fmt', 'yuv420p', movie])
+            written.append(movie)
+        else:
+            written.append(path)
+
+    return written
+
+def main(args=None):
+    if args is None:
+        args = sys.argv[1:]
+    argv = []
+    if '--' in args:
+        i    = args.index('--')
+        argv = args[i+1:]
+        args = args[:i]
+
+    # Set up command line options
+    parser = argparse.ArgumentParser(prog='python -m phy315.export')
+    parser.add_argument('scripts', nargs='+',                    help='demo scripts or directories')
+    parser.add_argument('-o', type=str,   default='renders',     help='output directory')
+    parser.add_argument('-f', type=int,   default=300,           help='number of frames')
+    parser.add_argument('-r', type=float, default=30.,           help='frame rate')
+    parser.add_argument('-d', type=float, default=None,          help='resolution (dpi)')
+    parser.add_argument('-w', type=str,   default='auto',        help='writer: png, ffmpeg, or auto',
+                        choices=['png', 'ffmpeg', 'auto'])
+    parser.add_argument('-p', type=int,   default=1,             help='number of processes')
+
+    # Read command line options
+    opts = parser.parse_args(args)
+
+    # Test input
+    if opts.f < 1:
+        parser.error('f must be positive')
+    if opts.r <= 0.:
+        parser.error('r must be positive')
+    if opts.p < 1:
+        parser.error('p must be positive')
+
+    scripts = []
+    for path in opts.scripts:
+        if os.path.isdir(path):
+            scripts.extend(sorted(glob.glob(os.path.join(path, '*.py'))))
+        else:
+            scripts.append(path)
+
+    failed = 0
+    for script in scripts:
+        try:
+            if opts.p > 1:
+                written = render_parallel(script, argv, opts.o, opts.f, opts.r,
+                                          opts.d, opts.w, opts.p)
+            else:
+                written = render(script, argv, opts.o, opts.f, opts.r, opts.d, opts.w)
+        except SystemExit:
+            print('%s: exited during setup' % script, file=sys.stderr)
+            failed += 1
+        except Exception as e:
+            print('%s: %s: %s' % (script, type(e).__name__, e), file=sys.stderr)
+            failed += 1
+        else:
+            for path in written:
+                print('%s -> %s' % (script, path))
+
+    return 1 if failed else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
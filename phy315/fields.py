@@ -0,0 +1,130 @@
+"""
+Animated 2-D fields drawn as images.
+
+Redrawing a field with contourf on every frame means tessellating a new
+set of filled contours each time, which on a 500 x 500 grid costs far
+more than computing the field itself. A Field is instead drawn once, as
+an image, and each frame only replaces the image's array. The image is
+coloured in the same bands as the filled contour plot it replaces, so
+the two look alike.
+
+A FieldPlayer animates fields as a Player does artists. Lines drawn in
+the axes of a field (boundaries, nodes and so on) are redrawn over the
+field on every frame. Optionally, whenever the animation is paused, the
+image is replaced by a true filled contour plot of the current field,
+for publication-quality stills; it returns when the animation resumes.
+
+Most of these fields are separable: sums of a few fixed spatial patterns,
+each multiplied by a factor depending on time alone. A SeparableField
+evaluates the patterns once, when the demo starts, after which each
+frame costs one scaled addition per pattern into a preallocated array,
+rather than fresh trigonometric functions over the whole grid.
+"""
+
+import numpy as np
+import math
+from matplotlib.colors import BoundaryNorm
+
+from phy315.animation import Player
+
+class Field(object):
+    """
+    Scalar field on regular grid, drawn in axes as banded image.
+
+    ax     - axes in which field is drawn
+    x, y   - 1-D coordinates of grid columns and rows
+    levels - boundaries of colour bands, as for contourf
+    cmap   - colour map
+    """
+
+    def __init__(self, ax, x, y, levels, cmap):
+        self.ax       = ax
+        self.x        = x
+        self.y        = y
+        self.levels   = levels
+        self.cmap     = cmap
+        self.contours = None
+        self.image    = ax.imshow(np.zeros((len(y), len(x))), origin='lower',
+                                  extent=(x[0], x[-1], y[0], y[-1]), aspect='auto',
+                                  interpolation='bilinear', cmap=cmap,
+                                  norm=BoundaryNorm(levels, cmap.N))
+
+    # Function to replace image by filled contours of field currently shown
+    def contour(self):
+        if self.contours is None:
+            self.contours = self.ax.contourf(self.x, self.y, self.image.get_array(),
+                                             self.levels, cmap=self.cmap)
+            self.image.set_visible(False)
+
+    # Function to restore image in place of filled contours
+    def uncontour(self):
+        if self.contours is not None:
+            for collection in self.contours.collections:
+                collection.remove()
+            self.contours = None
+            self.image.set_visible(True)
+
+class SeparableField(object):
+    """
+    Field made up of fixed spatial patterns, each oscillating in time.
+
+    patterns    - sequence of arrays of same shape
+    frequencies - angular frequency of each pattern
+    phases      - phase of each pattern (default zero)
+
+    Field at time t is sum of pattern*cos(frequency*t - phase) over
+    patterns. Calling field with time t returns field at that time,
+    written into same array on every call.
+    """
+
+    def __init__(self, patterns, frequencies, phases=None):
+        if phases is None:
+            phases = [0.]*len(patterns)
+        self.patterns    = [np.ascontiguousarray(pattern, dtype=float) for pattern in patterns]
+        self.frequencies = [float(w) for w in frequencies]
+        self.phases      = [float(phi) for phi in phases]
+        self.out         = np.empty_like(self.patterns[0])
+        self.scratch     = np.empty_like(self.patterns[0])
+
+    # Function to return field at time t
+    def __call__(self, t):
+        for k, (pattern, w, phi) in enumerate(zip(self.patterns, self.frequencies, self.phases)):
+            if k == 0:
+                np.multiply(pattern, math.cos(w*t - phi), out=self.out)
+            else:
+                np.multiply(pattern, math.cos(w*t - phi), out=self.scratch)
+                self.out += self.scratch
+        return self.out
+
+class FieldPlayer(Player):
+    """
+    Player of fields, given state function returning one array per field.
+
+    contours - if True, draw filled contours while animation is paused
+    artists  - other animated artists, drawn over fields, whose values
+               follow those of fields
+
+    Other arguments are as for Player. Lines already drawn in axes of
+    fields are also redrawn over them, unchanged.
+    """
+
+    def __init__(self, fig, fields, state, dt, t0=0., interval=2, contours=False,
+                 artists=()):
+        self.fields   = list(fields)
+        self.contours = contours
+
+        animated = [field.image for field in self.fields] + list(artists)
+        for field in self.fields:
+            animated.extend(line for line in field.ax.lines if line not in animated)
+        Player.__init__(self, fig, animated, state, dt, t0, interval)
+
+    # Function to capture mouse clicks
+    def onClick(self, event):
+        Player.onClick(self, event)
+        if self.contours:
+            for field in self.fields:
+                if self.pause:
+                    field.contour()
+                else:
+                    field.uncontour()
+            self.redraw()
@@ -0,0 +1,87 @@
+"""
+Fourier transforms of sampled functions.
+
+With the convention used throughout the course,
+
+    f(x) = int F(k) exp(+i k x) dk,
+    F(k) = 1/(2 pi) int f(x) exp(-i k x) dx,
+
+forward() and inverse() evaluate these integrals as sums over samples
+of the function being transformed, each weighted by the width of the
+cell it occupies (dk or dx on a uniform grid), at any set of output
+points.
+
+When both grids are uniform, the sums are evaluated by the chirp-z
+transform: writing
+
+    n j = (n^2 + j^2 - (j - n)^2)/2
+
+turns the sum over n of g_n exp(i a n j) into a convolution, which is
+done with NumPy FFTs, so that the cost is of order (N + M) log(N + M)
+for N input and M output points, whatever the product of the grid
+spacings. Otherwise, the sums are evaluated directly (see
+phy315.kernels), at a cost of order N M.
+"""
+
+import numpy as np
+
+from phy315.kernels import exp_sum
+
+# Function to return True if points are uniformly spaced
+def is_uniform(x):
+    if len(x) < 3:
+        return True
+    d = np.diff(x)
+    return np.allclose(d, d[0], rtol=1e-6, atol=0.)
+
+# Function to return width of cell occupied by each point, cells being
+# bounded by midpoints between neighbouring points
+def weights(x):
+    x = np.asarray(x, dtype=float)
+    if len(x) < 2:
+        return np.ones_like(x)
+    w = np.empty_like(x)
+    w[1:-1] = 0.5*(x[2:] - x[:-2])
+    w[0]    = x[1] - x[0]
+    w[-1]   = x[-1] - x[-2]
+    return w
+
+# Function to return sum over n of g_n exp(i sign a_n b_j) at points b_j,
+# for points a_n and b_j uniformly spaced, by chirp-z transform
+def _chirp_sum(a, g, b, sign):
+    N, M   = len(a), len(b)
+    da, db = (a[-1] - a[0])/(N-1) if N > 1 else 0., (b[-1] - b[0])/(M-1) if M > 1 else 0.
+    a0, b0 = a[0], b[0]
+    c      = sign*da*db
+
+    n = np.arange(N)
+    j = np.arange(M)
+    m = np.arange(-(N-1), M)
+
+    u = g*np.exp(1j*(sign*n*da*b0 + 0.5*c*n*n))
+    v = np.exp(-0.5j*c*m*m)
+
+    L = 1
+    while L < N + M - 1:
+        L *= 2
+    conv = np.fft.ifft(np.fft.fft(u, L)*np.fft.fft(v, L))[N-1:N-1+M]
+
+    return np.exp(1j*(sign*a0*b + 0.5*c*j*j))*conv
+
+# Function to return sum over n of g_n exp(i sign a_n b_j) at points b_j
+def _sum(a, g, b, sign):
+    a = np.asarray(a, dtype=float)
+    b = np.asarray(b, dtype=float)
+    if len(a) > 1 and len(b) > 1 and is_uniform(a) and is_uniform(b):
+        return _chirp_sum(a, g, b, sign)
+    return exp_sum(a, g, b, sign)
+
+# Function to return Fourier transform F(k) at points k of function with
+# values f at points x. Result is complex.
+def forward(x, f, k):
+    return _sum(x, np.asarray(f)*weights(x), k, -1.)/(2.*np.pi)
+
+# Function to return inverse Fourier transform f(x) at points x of
+# transform with values F at points k. Result is complex.
+def inverse(k, F, x):
+    return _sum(k, np.asarray(F)*weights(k), x, 1.)
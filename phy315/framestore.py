@@ -0,0 +1,204 @@
+"""
+Stores of precomputed animation frames.
+
+A FrameStore holds the values returned by a state function (see
+phy315.animation) at each of a fixed number of frames, typically the
+frames making up one period of a periodic animation. Values are kept as
+one array per animated artist, with one row per frame, so replaying a
+stored frame only takes views of these arrays.
+
+Stores smaller than MEMORY bytes are kept in memory. Larger ones, such
+as the frames of a field on a fine grid, are memory-mapped .npy files
+in the cache directory (environment variable PHY315_CACHE, by default
+~/.cache/phy315). When the state function is identified by a key, a
+completed store on disk is reused by every later run with the same key,
+so that such runs need not evaluate the state function at all. Keys
+cover the sources of the demo script and of the phy315 package, so
+editing either never replays stale frames. The
+least recently used stores are deleted whenever the cache grows beyond
+BUDGET bytes. Deleting the cache directory is always safe.
+"""
+
+from __future__ import print_function
+
+import numpy as np
+import hashlib
+import atexit
+import glob
+import json
+import os
+
+# Size of largest store kept in memory (bytes)
+MEMORY = 32*2**20
+
+# Maximum total size of stores kept on disk (bytes)
+BUDGET = 2**30
+
+# Function to return cache directory
+def cache_dir():
+    return os.environ.get('PHY315_CACHE',
+                          os.path.join(os.path.expanduser('~'), '.cache', 'phy315'))
+
+# Digest of sources of phy315 package, computed on first use
+_package = []
+
+# Function to return digest of sources of every module of phy315 package,
+# which compute the frames of demos as much as the scripts themselves do
+def package_digest():
+    if not _package:
+        digest  = hashlib.sha1()
+        package = os.path.dirname(os.path.abspath(__file__))
+        for path in sorted(glob.glob(os.path.join(package, '*.py'))):
+            digest.update(os.path.basename(path).encode('utf-8'))
+            with open(path, 'rb') as f:
+                digest.update(f.read())
+        _package.append(digest.hexdigest())
+    return _package[0]
+
+# Function to return key identifying state function defined by script,
+# evaluated with given parameters (such as dictionary of command line
+# options). Key changes whenever script or phy315 package is edited.
+def cache_key(script, params):
+    digest = hashlib.sha1()
+    with open(script, 'rb') as f:
+        digest.update(f.read())
+    digest.update(package_digest().encode('utf-8'))
+    if isinstance(params, dict):
+        params = sorted(params.items())
+    digest.update(repr(params).encode('utf-8'))
+    return digest.hexdigest()
+
+# Function to delete least recently used stores on disk until their
+# total size is within budget
+def evict(budget=None):
+    if budget is None:
+        budget = BUDGET
+    entries = []
+    for meta in glob.glob(os.path.join(cache_dir(), '*.json')):
+        stem  = meta[:-len('.json')]
+        files = [meta] + glob.glob(stem + '.[0-9]*.npy')
+        try:
+            size = sum(os.path.getsize(path) for path in files)
+            used = os.path.getmtime(meta)
+        except OSError:
+            continue
+        entries.append((used, size, files))
+
+    entries.sort()
+    total = sum(size for used, size, files in entries)
+    for used, size, files in entries:
+        if total <= budget:
+            break
+        for path in files:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        total -= size
+
+class FrameStore(object):
+    """
+    Values of state function at given number of frames.
+
+    frames - number of frames
+    key    - string identifying state function, or None
+
+    Values of each frame are sequences with one entry per artist: either
+    None (artist unchanged), or array-like of same shape in every frame.
+    """
+
+    def __init__(self, frames, key=None, memory=None):
+        self.frames = frames
+        self.key    = key
+        self.memory = MEMORY if memory is None else memory
+        self.arrays = None
+        self.filled = np.zeros(frames, dtype=bool)
+        self.temp   = []
+        if key is not None:
+            self.load()
+
+    # Function to return path of file holding array of kth artist
+    def path(self, k, temp=False):
+        stem = os.path.join(cache_dir(), self.key)
+        if temp:
+            stem += '.tmp%d' % os.getpid()
+        return '%s.%d.npy' % (stem, k)
+
+    # Function to open completed store on disk, if any
+    def load(self):
+        meta = os.path.join(cache_dir(), self.key + '.json')
+        try:
+            with open(meta) as f:
+                shapes = json.load(f)
+            arrays = [None if shape is None else np.load(self.path(k), mmap_mode='r')
+                      for k, shape in enumerate(shapes)]
+            os.utime(meta, None)
+        except (IOError, OSError, ValueError):
+            return
+        if all(array is None or len(array) == self.frames for array in arrays):
+            self.arrays = arrays
+            self.filled[:] = True
+
+    # Function to allocate arrays for values like those given
+    def allocate(self, values):
+        values = [None if value is None else np.asarray(value, dtype=float) for value in values]
+        size   = sum(value.nbytes for value in values if value is not None)*self.frames
+        ondisk = size > self.memory and self.key is not None
+        if ondisk and not os.path.isdir(cache_dir()):
+            os.makedirs(cache_dir())
+
+        self.arrays = []
+        for k, value in enumerate(values):
+            if value is None:
+                self.arrays.append(None)
+            elif ondisk:
+                path = self.path(k, temp=True)
+                self.temp.append(path)
+                self.arrays.append(np.lib.format.open_memmap(path, mode='w+', dtype=float,
+                                                             shape=(self.frames,) + value.shape))
+            else:
+                self.arrays.append(np.empty((self.frames,) + value.shape))
+        if self.temp:
+            atexit.register(self.discard)
+
+    # Function to return values of frame i, or None if not stored
+    def get(self, i):
+        if not self.filled[i]:
+            return None
+        return [None if array is None else array[i] for array in self.arrays]
+
+    # Function to store values of frame i. Returns stored values.
+    def put(self, i, values):
+        if self.arrays is None:
+            self.allocate(values)
+        for array, value in zip(self.arrays, values):
+            if array is not None:
+                array[i] = value
+        self.filled[i] = True
+        if self.temp and self.filled.all():
+            self.save()
+        return self.get(i)
+
+    # Function to move completed store on disk into cache, under its key
+    def save(self):
+        shapes = []
+        for k, array in enumerate(self.arrays):
+            if array is None:
+                shapes.append(None)
+            else:
+                array.flush()
+                os.rename(self.path(k, temp=True), self.path(k))
+                shapes.append(list(array.shape[1:]))
+        self.temp = []
+        with open(os.path.join(cache_dir(), self.key + '.json'), 'w') as f:
+            json.dump(shapes, f)
+        evict()
+
+    # Function to delete files of incomplete store
+    def discard(self):
+        for path in self.temp:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        self.temp = []
@@ -0,0 +1,70 @@
+"""
+Interference of waves from coherent sources.
+
+M sources at points (x_m, y_m) in the plane, oscillating at the same
+frequency with amplitudes a_m and phases phi_m, emit waves falling off
+as 1/r (point sources, spherical waves) or 1/sqrt(r) (line sources,
+cylindrical waves). With lengths in wavelengths and times in periods,
+the total wave is
+
+    z(x, y, t) = sum over m of a_m cos(2 pi (r_m - t) - phi_m)/r_m^p
+               = Re[U(x, y) exp(-2 pi i t)],
+
+where r_m is the distance from source m, p is 1 or 1/2, and
+
+    U = sum over m of a_m exp(i (2 pi r_m - phi_m))/r_m^p
+
+is the complex amplitude of the wave. SourceField evaluates U once, on
+the whole grid (see phy315.kernels): by broadcasting over all sources
+at once, a block of grid rows at a time, so that temporary arrays never
+hold more than BLOCK elements however large the product of the number
+of sources and the number of grid points, or, if Numba is installed, in
+a compiled parallel loop over grid points. Time stepping is then a rotation of the
+phase of U, and each frame costs one scaled addition of its real and
+imaginary parts into a preallocated array (see phy315.fields).
+
+The wave is taken to vanish within rmin of any source, where it is not
+meaningful.
+"""
+
+import numpy as np
+
+from phy315.fields import SeparableField
+from phy315.kernels import source_sum
+
+# Fall-off exponents of waves from point and line sources
+DECAY = {'point': 1., 'line': 0.5}
+
+class SourceField(SeparableField):
+    """
+    Wave from coherent sources on regular grid.
+
+    x, y       - 1-D coordinates of grid columns and rows
+    sources    - M x 2 array of source positions
+    amplitudes - amplitude of each source (default one)
+    phases     - phase of each source (default zero)
+    kind       - 'point' or 'line' sources
+    rmin       - distance from sources within which wave vanishes
+
+    Calling field with time t returns wave at that time, written into
+    same array on every call.
+    """
+
+    def __init__(self, x, y, sources, amplitudes=1., phases=0., kind='point', rmin=0.4):
+        if kind not in DECAY:
+            raise ValueError('unknown source kind %r' % (kind,))
+        xm = np.asarray(sources, dtype=float).reshape(-1, 2)
+        re, im = source_sum(x, y, xm[:, 0], xm[:, 1], amplitudes, phases, DECAY[kind], rmin)
+
+        SeparableField.__init__(self, [re, im], [2.*np.pi, 2.*np.pi], [0., 0.5*np.pi])
+
+    # Function to return complex amplitude of wave
+    def amplitude(self):
+        return self.patterns[0] + 1j*self.patterns[1]
+
+# Function to return positions of M sources equally spaced along y-axis,
+# a distance d apart, centred on origin, as M x 2 array
+def line_array(M, d):
+    xm = np.zeros((M, 2))
+    xm[:, 1] = d*(np.arange(M) - 0.5*(M-1))
+    return xm
@@ -0,0 +1,281 @@
+"""
+Inner loops of the demos, compiled when possible.
+
+The heaviest computations in the demos are a few loops over every output
+point of a sum or lookup:
+
+    radial_interp  - interpolation of a radial table f(r) onto a grid,
+                     at r = sqrt(x^2 + y^2) (membrane modes)
+    shifted_interp - sum of copies of a table f(|t|), shifted by each
+                     of several offsets (two-star profiles)
+    exp_sum        - sum over n of g_n exp(i sign a_n b_j) at every b_j,
+                     for arbitrary points a_n and b_j (Fourier sums)
+    source_sum     - complex amplitude of waves from many sources at
+                     every point of a grid (interference patterns)
+
+If Numba is installed, each of these is compiled on first use into a
+parallel loop over output points, which neither forms the intermediate
+arrays of radii or phases nor, in the case of exp_sum, the matrix of
+exponentials. Otherwise, the same computations are done with vectorised
+NumPy operations. Both give the same results, to rounding, so callers
+need not know which is in use. Setting the environment variable
+PHY315_NOJIT forces the NumPy versions.
+
+Bessel functions, which Numba cannot call, remain SciPy ufuncs, and
+sums with a fixed matrix (wave packets, modal sums) remain BLAS
+matrix-vector products, which no compiled loop improves upon.
+
+Running
+
+    python -m phy315.kernels
+
+checks every compiled kernel against its NumPy version, and times both.
+"""
+
+from __future__ import print_function
+
+import numpy as np
+import math
+import os
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# Compiled kernels are used if Numba is installed and not disabled
+JIT = numba is not None and not os.environ.get('PHY315_NOJIT')
+
+# Maximum number of elements of temporary arrays in NumPy versions
+BLOCK = 2**22
+
+# Function to return f(r) at r = sqrt(x^2 + y^2) on grid with columns x
+# and rows y, by linear interpolation in table (r, f)
+def _radial_interp_numpy(x, y, r, f, out):
+    x2   = x*x
+    rows = max(1, BLOCK//max(1, len(x)))
+    for i in range(0, len(y), rows):
+        R = np.sqrt(y[i:i+rows, np.newaxis]**2 + x2)
+        out[i:i+rows] = np.interp(R, r, f)
+    return out
+
+# Function to return sum over shifts s of f(|t - s|), by linear
+# interpolation in table (r, f)
+def _shifted_interp_numpy(t, shifts, r, f, out):
+    out.fill(0.)
+    for s in shifts:
+        out += np.interp(np.abs(t - s), r, f)
+    return out
+
+# Function to return sum over n of g_n exp(i sign a_n b_j) at points b_j,
+# by matrix-vector products over blocks of points b_j
+def _exp_sum_numpy(a, g, b, sign, out):
+    rows = max(1, BLOCK//max(1, len(a)))
+    for i in range(0, len(b), rows):
+        phase = sign*np.outer(b[i:i+rows], a)
+        out[i:i+rows] = np.dot(np.exp(1j*phase), g)
+    return out
+
+# Function to return real and imaginary parts of sum over sources m of
+# a_m exp(i (2 pi r_m - phi_m))/r_m^p on grid with columns x and rows y,
+# r_m being distance from source at (sx_m, sy_m), and zero within rmin of
+# any source. Broadcasts over all sources, in blocks of rows.
+def _source_sum_numpy(x, y, sx, sy, a, phi, p, rmin, re, im):
+    dx2  = (x[:, np.newaxis] - sx)**2
+    rows = max(1, BLOCK//max(1, len(x)*len(sx)))
+    for i in range(0, len(y), rows):
+        dy2  = (y[i:i+rows, np.newaxis] - sy)**2
+        r    = np.sqrt(dy2[:, np.newaxis, :] + dx2)
+        near = np.any(r <= rmin, axis=-1)
+        A    = a/np.maximum(r, rmin)**p
+        r   *= 2.*np.pi
+        r   -= phi
+        re[i:i+rows] = np.sum(A*np.cos(r), axis=-1)
+        im[i:i+rows] = np.sum(A*np.sin(r), axis=-1)
+        re[i:i+rows][near] = 0.
+        im[i:i+rows][near] = 0.
+    return re, im
+
+if numba is not None:
+
+    # Function to return f(u) by linear interpolation in table (r, f),
+    # with r increasing, taking end values beyond table (as np.interp)
+    @numba.njit(cache=True)
+    def _interp(u, r, f):
+        n = len(r)
+        if u <= r[0]:
+            return f[0]
+        if u >= r[n-1]:
+            return f[n-1]
+        lo, hi = 0, n-1
+        while hi - lo > 1:
+            mid = (lo + hi)//2
+            if r[mid] <= u:
+                lo = mid
+            else:
+                hi = mid
+        return f[lo] + (u - r[lo])*(f[hi] - f[lo])/(r[hi] - r[lo])
+
+    @numba.njit(parallel=True, cache=True)
+    def _radial_interp_jit(x, y, r, f, out):
+        for i in numba.prange(len(y)):
+            y2 = y[i]*y[i]
+            for j in range(len(x)):
+                out[i, j] = _interp(math.sqrt(x[j]*x[j] + y2), r, f)
+        return out
+
+    @numba.njit(parallel=True, cache=True)
+    def _shifted_interp_jit(t, shifts, r, f, out):
+        for j in numba.prange(len(t)):
+            total = 0.
+            for s in shifts:
+                total += _interp(abs(t[j] - s), r, f)
+            out[j] = total
+        return out
+
+    @numba.njit(parallel=True, cache=True)
+    def _exp_sum_jit(a, g, b, sign, out):
+        for j in numba.prange(len(b)):
+            total = 0j
+            for n in range(len(a)):
+                p = sign*a[n]*b[j]
+                total += g[n]*complex(math.cos(p), math.sin(p))
+            out[j] = total
+        return out
+
+    @numba.njit(parallel=True, cache=True)
+    def _source_sum_jit(x, y, sx, sy, a, phi, p, rmin, re, im):
+        for i in numba.prange(len(y)):
+            for j in range(len(x)):
+                sr = 0.
+                si = 0.
+                near = False
+                for m in range(len(sx)):
+                    r = math.sqrt((x[j] - sx[m])**2 + (y[i] - sy[m])**2)
+                    if r <= rmin:
+                        near = True
+                        break
+                    A  = a[m]/r**p
+                    ph = 2.*math.pi*r - phi[m]
+                    sr += A*math.cos(ph)
+                    si += A*math.sin(ph)
+                if near:
+                    sr = 0.
+                    si = 0.
+                re[i, j] = sr
+                im[i, j] = si
+        return re, im
+
+    _compiled = {
+        'radial_interp':  _radial_interp_jit,
+        'shifted_interp': _shifted_interp_jit,
+        'exp_sum':        _exp_sum_jit,
+        'source_sum':     _source_sum_jit,
+    }
+else:
+    _compiled = {}
+
+_numpy = {
+    'radial_interp':  _radial_interp_numpy,
+    'shifted_interp': _shifted_interp_numpy,
+    'exp_sum':        _exp_sum_numpy,
+    'source_sum':     _source_sum_numpy,
+}
+
+# Function to return implementation of named kernel: compiled if
+# available and jit is True, NumPy otherwise
+def kernel(name, jit=None):
+    if jit is None:
+        jit = JIT
+    if jit and name in _compiled:
+        return _compiled[name]
+    return _numpy[name]
+
+# Function to return f(sqrt(x^2 + y^2)) on grid with columns x and rows
+# y, by linear interpolation in table (r, f), r increasing
+def radial_interp(x, y, r, f, jit=None):
+    x = np.ascontiguousarray(x, dtype=float)
+    y = np.ascontiguousarray(y, dtype=float)
+    out = np.empty((len(y), len(x)))
+    return kernel('radial_interp', jit)(x, y, np.ascontiguousarray(r, dtype=float),
+                                        np.ascontiguousarray(f, dtype=float), out)
+
+# Function to return sum over shifts s of f(|t - s|) at points t, by
+# linear interpolation in table (r, f), r increasing
+def shifted_interp(t, shifts, r, f, jit=None):
+    t = np.ascontiguousarray(t, dtype=float)
+    out = np.empty(len(t))
+    return kernel('shifted_interp', jit)(t, np.ascontiguousarray(shifts, dtype=float),
+                                         np.ascontiguousarray(r, dtype=float),
+                                         np.ascontiguousarray(f, dtype=float), out)
+
+# Function to return sum over n of g_n exp(i sign a_n b_j) at points b_j.
+# Result is complex.
+def exp_sum(a, g, b, sign, jit=None):
+    a = np.ascontiguousarray(a, dtype=float)
+    b = np.ascontiguousarray(b, dtype=float)
+    g = np.ascontiguousarray(g, dtype=complex)*np.ones(len(a))
+    out = np.empty(len(b), dtype=complex)
+    return kernel('exp_sum', jit)(a, g, b, float(sign), out)
+
+# Function to return real and imaginary parts of sum over sources m at
+# (sx_m, sy_m) of a_m exp(i (2 pi r_m - phi_m))/r_m^p on grid with columns
+# x and rows y, zero within rmin of any source
+def source_sum(x, y, sx, sy, a, phi, p, rmin, jit=None):
+    x  = np.ascontiguousarray(x, dtype=float)
+    y  = np.ascontiguousarray(y, dtype=float)
+    sx = np.ascontiguousarray(sx, dtype=float)
+    sy = np.ascontiguousarray(sy, dtype=float)
+    M  = len(sx)
+    a   = np.ascontiguousarray(a, dtype=float)*np.ones(M)
+    phi = np.ascontiguousarray(phi, dtype=float)*np.ones(M)
+    re = np.empty((len(y), len(x)))
+    im = np.empty((len(y), len(x)))
+    return kernel('source_sum', jit)(x, y, sx, sy, a, phi, float(p), float(rmin), re, im)
+
+# Function to return arguments of each kernel for self-check, sized as
+# in demos
+def _examples():
+    rng = np.random.RandomState(0)
+    r   = np.linspace(0., 2., 4096)
+    f   = np.cos(7.*r)*np.exp(-r)
+    x   = np.linspace(-1.5, 1.5, 600)
+    t   = np.linspace(-8., 8., 1600)
+    a   = np.sort(rng.uniform(-20., 20., 1000))
+    g   = rng.normal(size=1000) + 1j*rng.normal(size=1000)
+    return [
+        ('radial_interp',  radial_interp,  (x, x, r, f)),
+        ('shifted_interp', shifted_interp, (t/4., [-0.5, 0.5], r, f)),
+        ('exp_sum',        exp_sum,        (a, g, t, 1.)),
+        ('source_sum',     source_sum,     (x, x, np.zeros(16), np.linspace(-2., 2., 16),
+                                            1./16, np.arange(16), 1., 0.05)),
+    ]
+
+# Function to check compiled kernels against NumPy versions, and time
+# both. Returns True if all agree.
+def check(repeat=5):
+    from phy315.timing import clock
+
+    print('Numba:', 'not installed' if numba is None else numba.__version__)
+    ok = True
+    for name, func, args in _examples():
+        results = []
+        for jit in ((False, True) if name in _compiled else (False,)):
+            value = func(*args, jit=jit)
+            start = clock()
+            for i in range(repeat):
+                func(*args, jit=jit)
+            elapsed = (clock() - start)/repeat
+            results.append(np.asarray(value))
+            print('%-15s %-6s %9.2f ms' % (name, 'numba' if jit else 'numpy', 1e3*elapsed))
+        if len(results) == 2:
+            scale = max(1., np.amax(np.abs(results[0])))
+            error = np.amax(np.abs(results[1] - results[0]))/scale
+            agree = error < 1e-9
+            ok = ok and agree
+            print('%-15s max difference %.1e (%s)' % (name, error, 'ok' if agree else 'FAILED'))
+    return ok
+
+if __name__ == '__main__':
+    import sys
+    sys.exit(0 if check() else 1)
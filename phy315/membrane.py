@@ -0,0 +1,52 @@
+"""
+Normal modes of circular elastic sheet of unit radius.
+
+Mode (m, n) has n nodal diameters and m nodal circles (counting the
+fixed edge), with shape
+
+    J_n(z_nm r) cos(n theta),
+
+where z_nm is the m-th zero of J_n. The radial Bessel function is
+evaluated once on a fine lookup table and interpolated onto the grid
+(see phy315.kernels), and finished mode shapes are cached, so an animation frame only has to
+scale a precomputed array by its time factor.
+"""
+
+import numpy as np
+import scipy.special as sp
+
+from phy315.kernels import radial_interp
+
+# Caches of radial lookup tables and mode shapes
+_tables = {}
+_modes  = {}
+
+# Function to return lookup table (r, J_n(z_nm r)) on [0, 1], normalised
+# to unit maximum amplitude
+def radial_table(m, n, points=4096):
+    key = (m, n, points)
+    if key not in _tables:
+        zr = sp.jn_zeros(n, m)[m-1]
+        r  = np.linspace(0., 1., points)
+        J  = sp.jn(n, zr*r)
+        J /= np.amax(np.abs(J))
+        _tables[key] = (r, J)
+    return _tables[key]
+
+# Function to return grid and shape of mode (m, n) on N x N grid spanning
+# [-1, 1] in both directions. Shape is masked outside sheet.
+def circular_mode(m, n, N, points=4096):
+    key = (m, n, N, points)
+    if key not in _modes:
+        x = np.linspace(-1., 1., N)
+        y = np.linspace(-1., 1., N)
+        X, Y = np.meshgrid(x, y)
+        R = np.sqrt(X*X + Y*Y)
+
+        r, J = radial_table(m, n, points)
+        Z = radial_interp(x, y, r, J)
+        if n > 0:
+            Z *= np.cos(n*np.arctan2(Y, X))
+
+        _modes[key] = (X, Y, np.ma.masked_where(R >= 1., Z))
+    return _modes[key]
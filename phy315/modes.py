@@ -0,0 +1,60 @@
+"""
+Modal synthesis of one-dimensional standing waves.
+
+The displacement of a string or rod is a sum over normal modes,
+
+    y(x, t) = sum over k of a_k exp(-g_k t) cos(w_k t - phi_k) s_k(x),
+
+in which only the time factors change from frame to frame. A ModalSum
+evaluates the mode shapes s_k once, as a K x N matrix (one row per mode,
+one column per point), after which the displacement at any time is a
+single matrix-vector product of the vector of K time factors with that
+matrix, written into a preallocated array. Time histories at a few
+points are likewise one matrix product, of a (times x K) matrix of time
+factors with the mode shapes at those points.
+"""
+
+import numpy as np
+
+class ModalSum(object):
+    """
+    Superposition of damped normal modes at fixed points.
+
+    shapes      - K x N array: shape of each of K modes at N points
+    amplitudes  - amplitude of each mode
+    frequencies - angular frequency of each mode
+    phases      - phase of each mode (default zero)
+    damping     - damping rate of each mode (default zero)
+
+    Calling sum with time t returns displacement at that time, written
+    into same array on every call.
+    """
+
+    def __init__(self, shapes, amplitudes, frequencies, phases=None, damping=None):
+        self.shapes = np.ascontiguousarray(shapes, dtype=float)
+        K = self.shapes.shape[0]
+        self.a   = np.asarray(amplitudes, dtype=float)*np.ones(K)
+        self.w   = np.asarray(frequencies, dtype=float)*np.ones(K)
+        self.phi = np.zeros(K) if phases is None else np.asarray(phases, dtype=float)*np.ones(K)
+        self.g   = None if damping is None else np.asarray(damping, dtype=float)*np.ones(K)
+        self.coef = np.empty(K)
+        self.out  = np.empty(self.shapes.shape[1])
+
+    # Function to return time factor of each mode at times t (one row
+    # per time)
+    def factors(self, t):
+        t = np.asarray(t, dtype=float)[..., np.newaxis]
+        c = self.a*np.cos(self.w*t - self.phi)
+        if self.g is not None:
+            c *= np.exp(-self.g*t)
+        return c
+
+    # Function to return displacement at time t
+    def __call__(self, t):
+        self.coef[:] = self.factors(t)
+        np.dot(self.coef, self.shapes, out=self.out)
+        return self.out
+
+    # Function to return displacement at times t (one row per time)
+    def history(self, t):
+        return np.dot(self.factors(t), self.shapes)
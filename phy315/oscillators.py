@@ -0,0 +1,244 @@
+"""
+Normal modes of coupled oscillators.
+
+Small oscillations of N coupled masses, with mass matrix M and stiffness
+matrix K, are superpositions of normal modes v_k of angular frequencies
+w_k, the solutions of the generalised eigenvalue problem
+
+    K v = w^2 M v.
+
+A CoupledOscillators diagonalises K and M once (scipy.linalg.eigh), and
+then evaluates the normal coordinates
+
+    eta_k(t) = a_k cos(w_k t - phi_k)
+
+and the displacements x(t) = sum over k of eta_k(t) v_k for a whole
+array of times in one matrix product, which remains cheap for hundreds
+of masses. Displacements can likewise be projected back onto normal
+coordinates.
+
+Each mode vector has unit length and its first nonzero component
+positive, unless scale gives it another length, or (when negative) the
+opposite sign, to suit the convention of a particular demo.
+
+For long chains of masses joined in line by springs, K is tridiagonal
+and M diagonal, so chain_modes() solves the equivalent symmetric
+tridiagonal problem instead, computing only the modes asked for. Masses
+and springs may all differ, as in studies of disordered chains, and a
+few modes of a chain of 10^5 masses take a fraction of a second. The
+whole spectrum costs of order N^2 operations however it is computed
+(about a second for 8000 masses).
+
+animate_chain() builds the standard animation of a chain of masses in
+motion, with scrolling traces of chosen coordinates beneath it.
+"""
+
+import numpy as np
+import scipy.linalg as la
+import matplotlib.pyplot as plt
+
+try:
+    from scipy.linalg import eigh_tridiagonal, eigvalsh_tridiagonal
+except ImportError:
+    # SciPy < 1.0: fall back on banded solver, which is slower for long
+    # chains
+    eigh_tridiagonal = eigvalsh_tridiagonal = None
+
+from phy315.animation import Player
+from phy315.chain import MassChain
+from phy315.trace import Trace
+
+class CoupledOscillators(object):
+    """
+    Coupled oscillators executing superposition of normal modes.
+
+    M          - mass matrix (or sequence of masses)
+    K          - stiffness matrix
+    amplitudes - amplitude of each normal coordinate (default zero)
+    phases     - phase of each normal coordinate (default zero)
+    scale      - signed length of each mode vector (default one)
+
+    Modes are in order of increasing frequency.
+    """
+
+    def __init__(self, M, K, amplitudes=None, phases=None, scale=None):
+        K = np.asarray(K, dtype=float)
+        M = np.asarray(M, dtype=float)
+        if M.ndim == 1:
+            M = np.diag(M)
+        N = len(K)
+
+        w2, V = la.eigh(K, M)
+        self.w = np.sqrt(np.clip(w2, 0., None))
+
+        # Normalise mode vectors
+        V /= np.sqrt(np.sum(V*V, axis=0))
+        for k in range(N):
+            first = V[np.nonzero(np.abs(V[:, k]) > 1e-12)[0][0], k]
+            if first < 0.:
+                V[:, k] = -V[:, k]
+        if scale is not None:
+            V *= np.asarray(scale, dtype=float)
+        self.modes = V
+
+        # Modes are M-orthogonal, so projection onto mode k is
+        # v_k^T M x/(v_k^T M v_k)
+        MV = np.dot(M, V)
+        self.projection = (MV/np.sum(V*MV, axis=0)).T
+
+        self.a   = np.zeros(N) if amplitudes is None else np.asarray(amplitudes, dtype=float)*np.ones(N)
+        self.phi = np.zeros(N) if phases is None else np.asarray(phases, dtype=float)*np.ones(N)
+
+    # Function to return normal coordinates at time(s) t (last axis
+    # indexes modes)
+    def normal(self, t):
+        t = np.asarray(t, dtype=float)[..., np.newaxis]
+        return self.a*np.cos(self.w*t - self.phi)
+
+    # Function to return displacements at time(s) t (last axis indexes
+    # masses)
+    def displacement(self, t):
+        return np.dot(self.normal(t), self.modes.T)
+
+    # Function to return normal coordinates of displacements x (last axis
+    # indexes masses)
+    def coordinates(self, x):
+        return np.dot(x, self.projection.T)
+
+# Function to return mass and stiffness matrices of N equal masses m in
+# line, joined by equal springs of spring constant k, with left and right
+# ends of chain attached by same springs to fixed walls, or free
+def spring_chain(N, m, k, left=True, right=True):
+    M = m*np.identity(N)
+    K = 2.*k*np.identity(N) - k*np.eye(N, k=1) - k*np.eye(N, k=-1)
+    if not left:
+        K[0, 0] -= k
+    if not right:
+        K[-1, -1] -= k
+    return M, K
+
+# Function to return angular frequencies of modes first to last of chain
+# of N masses joined in line by N+1 springs, together with their shapes
+# if vectors is True.
+#
+#   masses  - N masses
+#   springs - N+1 spring constants: spring i joins masses i-1 and i,
+#             spring 0 joins first mass to left wall, and spring N last
+#             mass to right wall (zero leaves end free)
+#   first   - first mode, counting from 1 in order of increasing frequency
+#   last    - last mode (default N)
+#
+# Shapes are columns of N x (last-first+1) array, each normalised to same
+# sum of squares as sin(pi n i/(N+1)) over i = 1, ..., N, namely (N+1)/2,
+# with first significant component positive. For uniform chain, shapes
+# are then exactly these sines.
+def chain_modes(masses, springs, first=1, last=None, vectors=True):
+    m = np.asarray(masses, dtype=float)
+    k = np.asarray(springs, dtype=float)
+    N = len(m)
+    if last is None:
+        last = N
+    if len(k) != N+1:
+        raise ValueError('need one more spring than masses')
+    if not 1 <= first <= last <= N:
+        raise ValueError('modes must lie between 1 and number of masses')
+
+    # Symmetric tridiagonal matrix M^(-1/2) K M^(-1/2)
+    s = 1./np.sqrt(m)
+    d = (k[:-1] + k[1:])*s*s
+    e = -k[1:-1]*s[:-1]*s[1:]
+
+    # Whole spectrum by QR (frequencies alone) or MRRR; selected modes by
+    # bisection, which is many times slower when asked for all of them
+    if first == 1 and last == N:
+        kind, select = 'a', None
+    else:
+        kind, select = 'i', (first-1, last-1)
+
+    if N == 1:
+        # LAPACK's tridiagonal solvers reject empty off-diagonal
+        w2, U = d, np.ones((1, 1))
+    elif eigh_tridiagonal is not None:
+        if not vectors and kind == 'a':
+            w2 = eigvalsh_tridiagonal(d, e, lapack_driver='sterf')
+        elif not vectors:
+            w2 = eigvalsh_tridiagonal(d, e, select=kind, select_range=select)
+        else:
+            w2, U = eigh_tridiagonal(d, e, select=kind, select_range=select)
+    else:
+        band = np.vstack((np.concatenate(([0.], e)), d))
+        if not vectors:
+            w2 = la.eigvals_banded(band, select=kind, select_range=select)
+        else:
+            w2, U = la.eig_banded(band, select=kind, select_range=select)
+
+    w = np.sqrt(np.clip(w2, 0., None))
+    if not vectors:
+        return w
+
+    # Mode shapes are M^(-1/2) times eigenvectors
+    V  = U*s[:, np.newaxis]
+    V *= np.sqrt(0.5*(N+1.)/np.sum(V*V, axis=0))
+    for j in range(V.shape[1]):
+        big = np.abs(V[:, j]) > 1e-8*np.amax(np.abs(V[:, j]))
+        if V[np.argmax(big), j] < 0.:
+            V[:, j] = -V[:, j]
+    return w, V
+
+# Function to animate chain of masses, with walls at x = 0 and x = N+1,
+# whose centres are at x = 1, 2, ..., N in equilibrium.
+#
+#   osc    - coupled oscillators
+#   dt     - time step
+#   title  - title of mass-spring plot
+#   panels - sequence of (ylabel, ylim, value) of trace panels plotted
+#            beneath, value being function of displacements and normal
+#            coordinates
+#   tmax   - time window of trace panels
+#
+# Returns animation.
+def animate_chain(osc, dt, title, panels, tmax=15., left=True, right=True):
+    N = len(osc.w)
+
+    # Setup plotting space
+    fig = plt.figure(figsize=(7,7))
+    fig.subplots_adjust(hspace=.45)
+    rows = len(panels) + 1
+
+    # Mass-spring animation plot
+    ax1 = plt.subplot(rows, 1, 1)
+    plt.xlim(0., N+1.)
+    plt.ylim(-1., 1.)
+    plt.xlabel("Position (m)")
+    plt.title(title, size="large")
+
+    chain = MassChain(ax1, N, left=0. if left else None, right=N+1. if right else None)
+    centres, = plt.plot([], [], 'o', color="black")
+
+    # Trace plots
+    lines  = []
+    traces = []
+    for i, (label, ylim, value) in enumerate(panels):
+        ax = plt.subplot(rows, 1, i+2)
+        plt.ylabel(label)
+        plt.xlabel("Time (s)")
+        plt.ylim(*ylim)
+        plt.axhline(y=0., lw=0.5, color="black")
+
+        line, = plt.plot([], [], lw=1, color="green")
+        lines.append(line)
+        traces.append(Trace(ax, tmax, dt))
+
+    x0 = np.arange(1., N+1.)
+    y0 = np.zeros(N)
+
+    # Function to return masses, springs, centres of masses, and traces
+    # at time t
+    def state(t):
+        x   = osc.displacement(t)
+        eta = osc.normal(t)
+        for trace, (label, ylim, value) in zip(traces, panels):
+            trace.append(t, value(x, eta))
+        return chain(x0 + x) + [(x0 + x, y0)] + [trace.data() for trace in traces]
+
+    return Player(fig, chain.artists + [centres] + lines, state, dt, traces=traces)
@@ -0,0 +1,58 @@
+"""
+Wave packets synthesised from plane waves.
+
+A packet is the superposition
+
+    y(x, t) = sum over k of a(k) cos(omega(k) t - k x),
+
+for a fixed set of wavenumbers k, amplitudes a(k) (which include any
+quadrature weights), and an arbitrary dispersion relation omega(k).
+Since
+
+    cos(omega t - k x) = cos(omega t) cos(k x) + sin(omega t) sin(k x),
+
+the spatial factors cos(k x) and sin(k x) are evaluated once, as a
+single matrix, and the packet at any time is then one matrix-vector
+product with the vector of time factors a cos(omega t), a sin(omega t),
+written into a preallocated array.
+"""
+
+import numpy as np
+
+# Function to return Gaussian spectrum exp(-(k-k0)^2/(2 sigma^2)) at
+# points k, weighted by spacing dk and normalised as in continuous limit
+def gaussian_spectrum(k, k0, sigma, dk):
+    return np.exp(-(k-k0)*(k-k0)/2./sigma/sigma)*dk/np.sqrt(2.*np.pi)/sigma
+
+class WavePacket(object):
+    """
+    Superposition of plane waves evaluated at fixed points.
+
+    k     - wavenumbers
+    a     - amplitudes
+    omega - dispersion relation: function returning angular frequency
+            at array of wavenumbers
+    x     - points at which packet is evaluated
+
+    Calling packet with time t returns packet at that time, written into
+    same array on every call.
+    """
+
+    def __init__(self, k, a, omega, x):
+        k = np.asarray(k, dtype=float)
+        x = np.asarray(x, dtype=float)
+        self.k     = k
+        self.a     = np.asarray(a, dtype=float)*np.ones_like(k)
+        self.w     = np.asarray(omega(k), dtype=float)*np.ones_like(k)
+        self.x     = x
+        self.basis = np.concatenate((np.cos(np.outer(k, x)), np.sin(np.outer(k, x))))
+        self.coef  = np.empty(2*len(k))
+        self.out   = np.empty(len(x))
+
+    # Function to return packet at time t
+    def __call__(self, t):
+        K = len(self.k)
+        np.multiply(self.a, np.cos(self.w*t), out=self.coef[:K])
+        np.multiply(self.a, np.sin(self.w*t), out=self.coef[K:])
+        np.dot(self.coef, self.basis, out=self.out)
+        return self.out
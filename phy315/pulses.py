@@ -0,0 +1,79 @@
+"""
+Superpositions of travelling pulses.
+
+A pulse has a fixed shape, centred at x0 + v t at time t:
+
+    triangle - height*(1 - |x - c|/width) for |x - c| < width
+    tophat   - height                     for |x - c| < width
+    gaussian - height*exp(-(x - c)^2/(2 width^2)), cut off beyond
+               REACH widths, where it is below 1e-13 of its height
+
+and is zero elsewhere. Pulses are evaluated at a fixed, sorted set of
+points. Since each pulse is nonzero over a single run of those points,
+located by binary search, each frame costs a few array operations per
+pulse over that run alone, however fine the grid.
+"""
+
+import numpy as np
+
+# Gaussian pulses are cut off beyond this many widths from their centres
+REACH = 8.
+
+SHAPES = ('triangle', 'tophat', 'gaussian')
+
+class Pulses(object):
+    """
+    Superposition of pulses evaluated at fixed points.
+
+    x    - sorted points at which pulses are evaluated
+    span - if given, interval (a, b) around which pulse centres wrap,
+           so that pulse leaving one end reenters at other
+
+    Calling pulses with time t returns superposition at that time,
+    written into same array on every call.
+    """
+
+    def __init__(self, x, span=None):
+        self.x      = np.ascontiguousarray(x, dtype=float)
+        self.span   = span
+        self.pulses = []
+        self.out    = np.zeros(len(self.x))
+
+    # Function to add pulse of given shape, position x0 at time zero,
+    # velocity v, half-width (standard deviation if Gaussian) and height
+    def add(self, shape, x0, v, width=0.5, height=1.):
+        if shape not in SHAPES:
+            raise ValueError('unknown pulse shape %r' % (shape,))
+        if width <= 0.:
+            raise ValueError('pulse width must be positive')
+        self.pulses.append((shape, float(x0), float(v), float(width), float(height)))
+
+    # Function to return centre of pulse at time t
+    def centre(self, x0, v, t):
+        c = x0 + v*t
+        if self.span is not None:
+            a, b = self.span
+            c = (c - a) % (b - a) + a
+        return c
+
+    # Function to return superposition of pulses at time t
+    def __call__(self, t):
+        x   = self.x
+        out = self.out
+        out.fill(0.)
+        for shape, x0, v, width, height in self.pulses:
+            c     = self.centre(x0, v, t)
+            reach = REACH*width if shape == 'gaussian' else width
+            lo    = np.searchsorted(x, c - reach, side='right')
+            hi    = np.searchsorted(x, c + reach, side='left')
+            if lo >= hi:
+                continue
+            seg = out[lo:hi]
+            if shape == 'tophat':
+                seg += height
+            elif shape == 'triangle':
+                seg += height*(1. - np.abs(x[lo:hi] - c)/width)
+            else:
+                u = (x[lo:hi] - c)/width
+                seg += height*np.exp(-0.5*u*u)
+        return out
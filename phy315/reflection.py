@@ -0,0 +1,100 @@
+"""
+Reflection of electromagnetic waves at the boundary of a conductor or plasma.
+
+A plane wave of unit amplitude, incident normally from vacuum (z < 0) on
+a medium of complex refractive index n filling z > 0, has electric field
+
+    E(z, t) = Re[(exp(-2 pi i z) + r exp(2 pi i z)) exp(2 pi i t)],  z < 0,
+            = Re[t exp(-2 pi i n z) exp(2 pi i t)],                 z > 0,
+
+with lengths in vacuum wavelengths and times in periods, where
+
+    r = (1 - n)/(1 + n),    t = 2/(1 + n),
+
+and magnetic field (in units of E/Z_0) given by the same expressions
+with r replaced by -r and t by n t. The fractions of the incident power
+reflected and transmitted are
+
+    R = |r|^2,    T = Re(n) |t|^2 = 1 - R.
+
+For a good conductor of impedance Z = a Z_0 exp(i pi/4), n = exp(-i pi/4)/a,
+and for a collisionless plasma at frequency w (in units of the plasma
+frequency), n = sqrt(1 - 1/w^2), which is negative imaginary (evanescent
+wave, total reflection) below the plasma frequency.
+
+All of these are array functions, so a demo can compute its coefficients
+once, when it starts, and sweep() can tabulate R and T over 10^6 values
+of a or w at once. Sweeps are cached, so that each range is only ever
+computed once per session, and are thinned out for plotting.
+"""
+
+import numpy as np
+
+# Cache of sweeps
+_sweeps = {}
+
+# Function to return complex refractive index of good conductor of
+# impedance ratio |Z/Z_0| = a
+def metal_index(a):
+    return np.exp(-0.25j*np.pi)/np.asarray(a, dtype=float)
+
+# Function to return complex refractive index of plasma at ratio w of wave
+# frequency to plasma frequency
+def plasma_index(w):
+    w = np.asarray(w, dtype=float)
+    return np.conj(np.sqrt((1. - 1./(w*w)).astype(complex)))
+
+# Media, by name
+INDEX = {'metal': metal_index, 'plasma': plasma_index}
+
+# Function to return amplitude reflection and transmission coefficients
+# of electric field for refractive index n
+def coefficients(n):
+    n = np.asarray(n, dtype=complex)
+    return (1. - n)/(1. + n), 2./(1. + n)
+
+# Function to return fractions R and T of incident power reflected and
+# transmitted for refractive index n
+def power(n):
+    n    = np.asarray(n, dtype=complex)
+    r, t = coefficients(n)
+    return np.abs(r)**2, n.real*np.abs(t)**2
+
+# Function to return complex phasors of electric and magnetic fields at
+# sorted points z, for refractive index n
+def phasors(n, z):
+    z    = np.asarray(z, dtype=float)
+    r, t = coefficients(complex(n))
+    j    = np.searchsorted(z, 0.)
+    f    = np.exp(-2j*np.pi*z[:j])
+    b    = r*np.exp(2j*np.pi*z[:j])
+    e    = t*np.exp(-2j*np.pi*n*z[j:])
+    return np.concatenate((f + b, e)), np.concatenate((f - b, n*e))
+
+# Function to return parameter values p from lo to hi (logarithmically
+# spaced if log is True) in medium (see INDEX), with R and T at each
+def sweep(medium, lo, hi, points=10**6, log=False):
+    key = (medium, float(lo), float(hi), int(points), bool(log))
+    if key not in _sweeps:
+        if log:
+            p = np.logspace(np.log10(lo), np.log10(hi), points)
+        else:
+            p = np.linspace(lo, hi, points)
+        R, T = power(INDEX[medium](p))
+        _sweeps[key] = (p, R, T)
+    return _sweeps[key]
+
+# Function to plot R and T against parameter values p in axes ax, marking
+# value of parameter in animation. At most points values are drawn, since
+# no more can be told apart on screen.
+def plot_power(ax, p, R, T, value, label, log=False, points=4096):
+    k = max(1, len(p)//points)
+    ax.plot(p[::k], R[::k], color="blue", ls="solid", lw=2, label="$R$")
+    ax.plot(p[::k], T[::k], color="red", ls="dashed", lw=2, label="$T$")
+    ax.axvline(x=value, lw=1, color="black", ls="dotted")
+    if log:
+        ax.set_xscale("log")
+    ax.set_xlim(p[0], p[-1])
+    ax.set_ylim(-0.05, 1.05)
+    ax.set_xlabel(label, size="large")
+    ax.legend(loc="best")
@@ -0,0 +1,67 @@
+"""
+Partial sums of Fourier series, updated incrementally.
+
+A widget showing the sum of the first N terms of a series at fixed
+points is redrawn whenever N changes, usually by a small step. Rather
+than summing all N terms afresh, PartialSums keeps the sum it returned
+last and adds (or subtracts) only the terms between the old N and the
+new one. Sums up to every multiple of STRIDE terms are also kept once
+reached, so that a long jump starts from the nearest of these instead.
+Moving from N to N +/- k thus costs at most min(k, STRIDE/2) term
+evaluations once the neighbourhood has been visited, and rounding errors
+from adding and subtracting terms cannot accumulate over long drags.
+"""
+
+import numpy as np
+
+# Spacing (in terms) of stored partial sums
+STRIDE = 64
+
+class PartialSums(object):
+    """
+    Partial sums of series at fixed points.
+
+    t     - points at which series is evaluated
+    term  - function returning nth term (n >= 1) at array of points
+    const - constant term
+
+    Calling sums with N returns constant term plus first N terms, written
+    into same array on every call.
+    """
+
+    def __init__(self, t, term, const=0.):
+        self.t      = np.asarray(t, dtype=float)
+        self.term   = term
+        self.n      = 0
+        self.out    = np.empty(len(self.t))
+        self.out.fill(const)
+        self.stored = {0: self.out.copy()}
+
+    # Function to return sum of constant term and first N terms
+    def __call__(self, N):
+        N = int(N)
+        if N < 0:
+            raise ValueError('number of terms must be non-negative')
+
+        # Start from nearest of current sum and stored sums
+        below = (N//STRIDE)*STRIDE
+        above = below + STRIDE
+        start = self.n
+        for m in (below, above):
+            if m in self.stored and abs(N - m) < abs(N - start):
+                start = m
+        if start != self.n:
+            self.out[:] = self.stored[start]
+            self.n = start
+
+        # Step through intervening terms
+        while self.n < N:
+            self.n += 1
+            self.out += self.term(self.n, self.t)
+            if self.n % STRIDE == 0 and self.n not in self.stored:
+                self.stored[self.n] = self.out.copy()
+        while self.n > N:
+            self.out -= self.term(self.n, self.t)
+            self.n -= 1
+
+        return self.out
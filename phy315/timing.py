@@ -0,0 +1,285 @@
+"""
+Per-frame timing of demos.
+
+A FrameTimer attached to a figure records, for every frame, the time
+spent computing the new state of the system (compute), pushing it into
+the artists (update), and drawing (draw), together with the total time
+of the frame. Animations and sliders are instrumented from the outside,
+so the demo scripts themselves need no changes:
+
+    - animations driven by a Player report compute and update
+      separately; for other animation functions, and for slider
+      callbacks, the whole function counts as compute
+    - every redraw of the figure, and every blit, counts as draw
+
+Phases may be nested: time spent in an inner phase is not counted
+towards the outer one. Timing is opt-in; run a demo with
+
+    python -m phy315.timing [options] script [-- script options]
+
+to print a summary of its frame times when its windows are closed.
+Headless benchmarks of many demos are run by phy315.benchmark.
+
+Input parameters:
+
+s - show frame rate and frame times in first axes of animated figures
+"""
+
+from __future__ import print_function
+
+import matplotlib.animation as animation
+import matplotlib.widgets as widgets
+from contextlib import contextmanager
+from collections import OrderedDict
+import numpy as np
+import argparse
+import weakref
+import time
+import sys
+import os
+
+from phy315.animation import Player
+
+# Wall clock with best available resolution
+clock = getattr(time, 'perf_counter', time.time)
+
+class FrameTimer(object):
+    """
+    Record time spent in each phase of every frame.
+
+    Frames are delimited by begin() and end(). begin() also ends the
+    previous frame if it is still open, so that drawing which a GUI
+    defers until after the animation step is counted towards the frame
+    that requested it.
+    """
+
+    columns = ('total', 'compute', 'update', 'draw')
+
+    def __init__(self, capacity=1024):
+        self.data    = np.zeros((capacity, len(self.columns)))
+        self.count   = 0
+        self.current = None
+        self.start   = None
+        self.stack   = []
+
+    # Function to start new frame
+    def begin(self):
+        now = clock()
+        self.end(now)
+        self.current = [0.]*len(self.columns)
+        self.start   = now
+
+    # Function to end current frame, if any
+    def end(self, now=None):
+        if self.current is None:
+            return
+        if now is None:
+            now = clock()
+        self.current[0] = now - self.start
+        if self.count == len(self.data):
+            self.data = np.concatenate((self.data, np.zeros_like(self.data)))
+        self.data[self.count] = self.current
+        self.count  += 1
+        self.current = None
+
+    # Context manager timing named phase of current frame
+    @contextmanager
+    def phase(self, name):
+        start = clock()
+        self.stack.append(0.)
+        try:
+            yield
+        finally:
+            elapsed = clock() - start
+            inner   = self.stack.pop()
+            if self.stack:
+                self.stack[-1] += elapsed
+            if self.current is not None:
+                self.current[self.columns.index(name)] += elapsed - inner
+
+    # Function to return frame times (s) of frames first onwards, one
+    # column per phase
+    def samples(self, first=0):
+        return self.data[first:self.count]
+
+    # Function to return summary statistics (ms) of frames first onwards
+    def summary(self, first=0, percentiles=(50, 95, 99)):
+        data   = 1e3*self.samples(first)
+        result = OrderedDict([('frames', len(data))])
+        for k, name in enumerate(self.columns):
+            if len(data):
+                values = [data[:, k].mean()] + list(np.percentile(data[:, k], percentiles))
+            else:
+                values = [np.nan]*(len(percentiles) + 1)
+            result[name + '_mean'] = round(values[0], 3)
+            for p, value in zip(percentiles, values[1:]):
+                result['%s_p%d' % (name, p)] = round(value, 3)
+        return result
+
+    # Function to return frame rate and frame times averaged over recent
+    # frames, as text
+    def status(self, frames=30):
+        data = self.data[max(0, self.count-frames):self.count]
+        if len(data) == 0:
+            return ''
+        total, compute, update, draw = 1e3*data.mean(axis=0)
+        return '%.1f fps\ncompute %.1f ms\nupdate %.1f ms\ndraw %.1f ms' % \
+            (1e3/total, compute, update, draw)
+
+# Function to return wrapper of func timing each call as named phase
+def timed(timer, name, func):
+    def wrapper(*args, **kwargs):
+        with timer.phase(name):
+            return func(*args, **kwargs)
+    return wrapper
+
+# Timers attached to figures
+_timers = weakref.WeakKeyDictionary()
+
+# Function to return timer of figure, attaching new one (which times
+# every redraw of figure) if necessary
+def timer_for(fig):
+    if fig not in _timers:
+        timer = FrameTimer()
+        fig.draw = timed(timer, 'draw', fig.draw)
+        _timers[fig] = timer
+    return _timers[fig]
+
+# Function to time every frame of animation ani, optionally showing frame
+# rate in first axes of its figure. Returns timer.
+def instrument(ani, overlay=False):
+    fig   = ani._fig
+    timer = timer_for(fig)
+
+    func   = ani._func
+    player = getattr(func, '__self__', None)
+    if isinstance(player, Player):
+        player.timer = timer
+    else:
+        func = timed(timer, 'compute', func)
+
+    text = None
+    if overlay and fig.axes:
+        ax   = fig.axes[0]
+        text = ax.text(0.01, 0.99, '', transform=ax.transAxes, ha='left', va='top',
+                       size='small', zorder=10, animated=ani._blit,
+                       bbox=dict(facecolor='white', edgecolor='none', alpha=0.8))
+
+    def animate(*args):
+        artists = func(*args)
+        if text is not None:
+            text.set_text(timer.status())
+            if ani._blit:
+                artists = list(artists) + [text]
+        return artists
+
+    draw_next_frame = ani._draw_next_frame
+    def step(*args, **kwargs):
+        timer.begin()
+        return draw_next_frame(*args, **kwargs)
+
+    ani._func            = animate
+    ani._draw_next_frame = step
+    ani._post_draw       = timed(timer, 'draw', ani._post_draw)
+    return timer
+
+# Function to time every change of value of slider. Returns timer.
+def instrument_slider(slider):
+    timer   = timer_for(slider.ax.figure)
+    set_val = slider.set_val
+    def timed_set_val(val):
+        timer.begin()
+        with timer.phase('compute'):
+            set_val(val)
+    slider.set_val = timed_set_val
+    return timer
+
+@contextmanager
+def instrumented(overlay=False):
+    """
+    Context manager within which every FuncAnimation and Slider created
+    is timed. Yields list of timers, one per figure.
+    """
+    timers = []
+    FuncAnimation = animation.FuncAnimation
+    Slider        = widgets.Slider
+
+    def add(timer):
+        if timer not in timers:
+            timers.append(timer)
+
+    class TimedAnimation(FuncAnimation):
+        def __init__(self, *args, **kwargs):
+            FuncAnimation.__init__(self, *args, **kwargs)
+            add(instrument(self, overlay))
+
+    class TimedSlider(Slider):
+        def __init__(self, *args, **kwargs):
+            Slider.__init__(self, *args, **kwargs)
+            add(instrument_slider(self))
+
+    animation.FuncAnimation = TimedAnimation
+    widgets.Slider          = TimedSlider
+    try:
+        yield timers
+    finally:
+        animation.FuncAnimation = FuncAnimation
+        widgets.Slider          = Slider
+
+# Function to run demo script with command line options argv as main
+# program. Returns script namespace.
+def execute(script, argv=()):
+    script = os.path.abspath(script)
+    with open(script) as f:
+        code = compile(f.read(), script, 'exec', 0, True)
+
+    # Script namespace must outlive the run, since the animation functions
+    # refer to it
+    namespace = {'__name__': '__main__', '__file__': script}
+
+    sys_argv = sys.argv
+    sys.argv = [script] + list(argv)
+    try:
+        exec(code, namespace)
+    finally:
+        sys.argv = sys_argv
+    return namespace
+
+# Function to format summary statistics as table
+def format_summary(summary, percentiles=(50, 95, 99)):
+    lines = ['    %-8s %8s' % ('(ms)', 'mean') + ''.join(' %8s' % ('p%d' % p) for p in percentiles)]
+    for name in FrameTimer.columns:
+        keys   = [name + '_mean'] + ['%s_p%d' % (name, p) for p in percentiles]
+        lines.append('    %-8s' % name + ''.join(' %8.2f' % summary[key] for key in keys))
+    return '\n'.join(lines)
+
+def main(args=None):
+    if args is None:
+        args = sys.argv[1:]
+    argv = []
+    if '--' in args:
+        i    = args.index('--')
+        argv = args[i+1:]
+        args = args[:i]
+
+    # Set up command line options
+    parser = argparse.ArgumentParser(prog='python -m phy315.timing')
+    parser.add_argument('script',                      help='demo script')
+    parser.add_argument('-s', action='store_true',     help='show frame rate')
+
+    # Read command line options
+    opts = parser.parse_args(args)
+
+    with instrumented(opts.s) as timers:
+        execute(opts.script, argv)
+
+    for n, timer in enumerate(timers):
+        timer.end()
+        summary = timer.summary()
+        print('%s: figure %d: %d frames' % (opts.script, n, summary['frames']))
+        if summary['frames']:
+            print(format_summary(summary))
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
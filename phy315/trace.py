@@ -0,0 +1,86 @@
+"""
+Bounded time histories for scrolling trace panels.
+
+A Trace records one or more quantities against time in a fixed-size
+NumPy ring buffer holding just enough samples to fill a time window of
+given width. Every sample is written twice, at positions i and
+i + capacity of a buffer of length 2*capacity, so the samples currently
+held are always available, oldest first, as a contiguous view: neither
+appending a sample nor reading back the history allocates memory, and
+the cost of both is independent of how long the animation has run.
+
+The panel's time axis scrolls in steps of half a window, so a blitted
+animation only has to redraw the whole figure once every half window.
+"""
+
+import numpy as np
+
+class Trace(object):
+    """
+    Scrolling history of channels quantities versus time.
+
+    ax       - axes on which history is plotted
+    window   - width of time window shown
+    dt       - time interval between samples
+    channels - number of quantities recorded
+    """
+
+    def __init__(self, ax, window, dt, channels=1):
+        self.ax       = ax
+        self.window   = window
+        self.capacity = int(np.ceil(window/dt)) + 2
+        self.buffer   = np.zeros((channels+1, 2*self.capacity))
+        self.start    = 0
+        self.size     = 0
+        self.lower    = None
+
+    # Function to discard history
+    def clear(self):
+        self.start = 0
+        self.size  = 0
+
+    # Function to record values of all channels at time t
+    def append(self, t, *values):
+        if self.size > 0:
+            tlast = self.buffer[0, self.start+self.size-1]
+            if t == tlast:
+                return
+            elif t < tlast:
+                self.clear()
+
+        i = (self.start + self.size) % self.capacity
+        self.buffer[0, i] = t
+        self.buffer[1:, i] = values
+        self.buffer[:, i+self.capacity] = self.buffer[:, i]
+
+        if self.size < self.capacity:
+            self.size += 1
+        else:
+            self.start = (self.start + 1) % self.capacity
+
+    # Function to return times and values of channel k, oldest first
+    def data(self, k=0):
+        samples = self.buffer[:, self.start:self.start+self.size]
+        return samples[0], samples[k+1]
+
+    # Function to return time axis limits for latest sample
+    def limits(self):
+        if self.size == 0:
+            return 0., self.window
+        t    = self.buffer[0, self.start+self.size-1]
+        page = 0.5*self.window
+        if t <= self.window:
+            lower = 0.
+        else:
+            lower = page*np.ceil((t - self.window)/page)
+        return lower, lower + self.window
+
+    # Function to scroll time axis to show latest sample. Returns True if
+    # axis limits changed.
+    def scroll(self):
+        lower, upper = self.limits()
+        if lower == self.lower:
+            return False
+        self.lower = lower
+        self.ax.set_xlim(lower, upper)
+        return True
@@ -0,0 +1,156 @@
+"""
+Waves on transmission lines made up of sections of different impedance.
+
+A line is divided at N+1 interfaces into a semi-infinite section on the
+left, N layers of given lengths, and a semi-infinite section on the
+right, each of its own impedance Z and wave speed v. A wave of angular
+frequency w, incident from the left with unit amplitude, has voltage
+and current
+
+    V(x, t) = Im[(A exp(-i k x) + B exp(+i k x)) exp(i w t)],
+    I(x, t) = Im[(A exp(-i k x) - B exp(+i k x)) exp(i w t)]/Z
+
+in each section, with k = w/v, where the amplitudes A and B of the
+forward and backward waves are such that V and I are continuous at
+every interface, and there is no backward wave on the right.
+
+Across a layer of phase thickness delta = k d, the voltage and current
+phasors at its ends are related by the layer's transfer (ABCD) matrix
+
+    V_left = V_right cos(delta) + i Z I_right sin(delta),
+    I_left = I_right cos(delta) + i V_right sin(delta)/Z.
+
+Starting from the transmitted wave on the right, and applying these
+relations layer by layer, gives V and I at every interface, and hence
+all amplitudes, in order N operations. The same recursion, keeping only
+the current V and I, gives the reflection and transmission coefficients
+at many frequencies at once, as arrays. Sines and cosines are evaluated
+once for each distinct phase thickness, rather than once per layer, so
+that stacks of a few materials (quarter-wave stacks, for instance) with
+hundreds of layers are swept over 10^5 frequencies in a fraction of a
+second.
+"""
+
+import numpy as np
+
+# Number of frequencies swept at once
+CHUNK = 16384
+
+class TransmissionLine(object):
+    """
+    Transmission line made up of uniform sections.
+
+    Z  - impedance of each of N+2 sections, from left to right, first
+         and last being semi-infinite
+    d  - length of each of N layers between them
+    v  - wave speed in each section (default one)
+    x0 - position of left end of first layer
+
+    Impedances are real (lossless line).
+    """
+
+    def __init__(self, Z, d, v=1., x0=0.):
+        self.Z = np.asarray(Z, dtype=float)
+        self.d = np.asarray(d, dtype=float).reshape(-1)
+        N = len(self.d)
+        if len(self.Z) != N+2:
+            raise ValueError('need two more impedances than layers')
+        if np.any(self.Z <= 0.) or np.any(self.d < 0.):
+            raise ValueError('impedances must be positive, and lengths non-negative')
+        self.v = np.asarray(v, dtype=float)*np.ones(N+2)
+
+        # Positions of interfaces, and reference point of each section
+        # (its left end, or first interface for first section)
+        self.edges = x0 + np.concatenate(([0.], np.cumsum(self.d)))
+        self.ref   = np.concatenate((self.edges[:1], self.edges))
+
+        # Layers grouped by phase thickness per unit frequency
+        self.tau, self.group = np.unique(self.d/self.v[1:-1], return_inverse=True)
+
+    # Function to return phasors V and I at every interface, working
+    # leftwards from transmitted wave of unit amplitude, at frequency w
+    def _interfaces(self, w):
+        Z  = self.Z
+        N  = len(self.d)
+        Vs = np.empty(N+1, dtype=complex)
+        Is = np.empty(N+1, dtype=complex)
+        Vs[N] = 1.
+        Is[N] = 1./Z[-1]
+        for j in range(N, 0, -1):
+            c = np.cos(w*self.tau[self.group[j-1]])
+            s = np.sin(w*self.tau[self.group[j-1]])
+            Vs[j-1] = Vs[j]*c + 1j*Z[j]*s*Is[j]
+            Is[j-1] = Is[j]*c + 1j*s/Z[j]*Vs[j]
+        return Vs, Is
+
+    # Function to return amplitude reflection and transmission
+    # coefficients (complex) at frequencies w.
+    #
+    # Frequencies are taken CHUNK at a time. Since impedances are real and
+    # transmitted wave has V = 1, I = 1/Z, recursion couples only real part
+    # of V with imaginary part of I, and imaginary part of V with real part
+    # of I, so it is carried out on four real arrays, in place.
+    def coefficients(self, w):
+        w     = np.asarray(w, dtype=float)
+        flat  = w.reshape(-1)
+        out_r = np.empty(len(flat), dtype=complex)
+        out_t = np.empty(len(flat), dtype=complex)
+        Z     = self.Z
+        for i in range(0, len(flat), CHUNK):
+            wc = flat[i:i+CHUNK]
+            C  = np.cos(np.outer(self.tau, wc))
+            S  = np.sin(np.outer(self.tau, wc))
+            Vr = np.ones(len(wc))
+            Ii = np.zeros(len(wc))
+            Vi = np.zeros(len(wc))
+            Ir = np.empty(len(wc))
+            Ir.fill(1./Z[-1])
+            t1 = np.empty(len(wc))
+            t2 = np.empty(len(wc))
+            for j in range(len(self.d), 0, -1):
+                c = C[self.group[j-1]]
+                s = S[self.group[j-1]]
+                for (x, y, sign) in ((Vr, Ii, -1.), (Vi, Ir, 1.)):
+                    # x' = x c + sign Z s y,  y' = y c - sign (s/Z) x
+                    np.multiply(x, c, out=t1)
+                    np.multiply(y, sign*Z[j]*s, out=t2)
+                    t1 += t2
+                    np.multiply(y, c, out=y)
+                    np.multiply(x, sign/Z[j]*s, out=t2)
+                    y -= t2
+                    x[...] = t1
+            V = Vr + 1j*Vi
+            I = Ir + 1j*Ii
+            A = 0.5*(V + Z[0]*I)
+            out_r[i:i+CHUNK] = 0.5*(V - Z[0]*I)/A
+            out_t[i:i+CHUNK] = 1./A
+        return out_r.reshape(w.shape), out_t.reshape(w.shape)
+
+    # Function to return fractions R and T of incident power reflected and
+    # transmitted at frequencies w
+    def power(self, w):
+        r, t = self.coefficients(w)
+        return np.abs(r)**2, np.abs(t)**2*self.Z[0]/self.Z[-1]
+
+    # Function to return amplitudes A and B of forward and backward waves
+    # in each section, at frequency w, for incident wave of unit amplitude.
+    # Amplitudes are referred to left end of each section (first interface
+    # for first section).
+    def amplitudes(self, w=1.):
+        Vs, Is = self._interfaces(float(w))
+        V = np.concatenate((Vs[:1], Vs))
+        I = np.concatenate((Is[:1], Is))
+        A = 0.5*(V + self.Z*I)
+        B = 0.5*(V - self.Z*I)
+        return A/A[0], B/A[0]
+
+    # Function to return complex phasors of voltage and current at sorted
+    # points x, at frequency w
+    def phasors(self, x, w=1.):
+        x    = np.asarray(x, dtype=float)
+        A, B = self.amplitudes(w)
+        j    = np.searchsorted(self.edges, x, side='right')
+        kx   = (w/self.v[j])*(x - self.ref[j])
+        f    = A[j]*np.exp(-1j*kx)
+        b    = B[j]*np.exp(1j*kx)
+        return f + b, (f - b)/self.Z[j]
@@ -0,0 +1,186 @@
+"""
+Wavefronts of plane and circular waves.
+
+The crests of a plane wave travelling in direction theta through a
+medium of refractive index n (wavelength 1/n) are the lines
+
+    n (x cos(theta) + y sin(theta)) = m/f + t,    m = ..., -1, 0, 1, ...,
+
+with f crests drawn per wavelength. At any time, only a fixed number of
+consecutive crests cross a given rectangle, so PlaneWavefronts computes
+the endpoints of all of them at once: each crest is clipped against the
+four sides of the rectangle by intersecting the intervals of distance
+along the crest that lie between each pair of parallel sides
+(Liang-Barsky clipping). Crests that miss the rectangle become segments
+of NaNs, which are not drawn, so that the segments always form an array
+of the same shape, drawn as one line collection updated in place (see
+phy315.animation), however many crests there are.
+
+The crests of a circular (cylindrical or spherical) wave spreading from
+the origin are circles of radii m/f + t. CircularWavefronts scales one
+cached unit circle to the radii of all crests within the axes at once,
+and draws them as one line collection, with the linewidth of each crest
+indicating the amplitude of the wave at its radius.
+
+Alternatively, radial_wave() returns the wave amplitude(r) cos(2 pi (r -
+t)) on a grid as a SeparableField (see phy315.fields), made up of two
+patterns evaluated once on a cached grid of distances from the origin,
+for drawing as an image.
+"""
+
+import numpy as np
+from matplotlib.collections import LineCollection
+
+from phy315.fields import SeparableField
+
+# Caches of unit circles and of grids of radial distances
+_circles = {}
+_radii   = {}
+
+# Function to return points on unit circle at angles 0, step, 2 step, ...,
+# as P x 2 array
+def unit_circle(step=0.01):
+    if step not in _circles:
+        theta = np.arange(0., 2.*np.pi, step)
+        _circles[step] = np.column_stack((np.cos(theta), np.sin(theta)))
+    return _circles[step]
+
+# Function to return distances from origin on grid with columns x and rows y
+def radial_distance(x, y):
+    x = np.ascontiguousarray(x, dtype=float)
+    y = np.ascontiguousarray(y, dtype=float)
+    key = (x.tobytes(), y.tobytes())
+    if key not in _radii:
+        _radii[key] = np.sqrt(x[np.newaxis, :]**2 + y[:, np.newaxis]**2)
+    return _radii[key]
+
+# Function to return circular wave amplitude(r) cos(2 pi (r - t)) on grid
+# with columns x and rows y, zero within distance rmin of origin, as
+# separable field
+def radial_wave(x, y, amplitude, rmin=0.4):
+    R = radial_distance(x, y)
+    A = np.zeros_like(R)
+    outside = R > rmin
+    A[outside] = amplitude(R[outside])
+    return SeparableField([A*np.cos(2.*np.pi*R), A*np.sin(2.*np.pi*R)],
+                          [2.*np.pi, 2.*np.pi], [0., 0.5*np.pi])
+
+class PlaneWavefronts(object):
+    """
+    Crests of plane wave drawn in rectangular region of axes.
+
+    ax    - axes in which crests are drawn
+    theta - direction of propagation (radians anticlockwise from x-axis)
+    index - refractive index of medium
+    box   - region (xl, xh, yl, yh) in which crests are drawn
+    per   - crests per wavelength
+    Other keyword arguments are passed to line collection.
+
+    The line collection of crests is the artist. Calling wavefronts with
+    time t returns the crests as array of segments, written into same
+    array on every call.
+    """
+
+    def __init__(self, ax, theta, index, box, per=1., **kwargs):
+        self.c     = np.cos(theta)
+        self.s     = np.sin(theta)
+        self.index = float(index)
+        self.box   = [float(b) for b in box]
+        self.per   = float(per)
+
+        # Range of x cos(theta) + y sin(theta) over box, and largest
+        # number of crests within it
+        xl, xh, yl, yh = self.box
+        u = [x*self.c + y*self.s for x in (xl, xh) for y in (yl, yh)]
+        self.umin = min(u)
+        self.umax = max(u)
+        M = int(np.floor((self.umax - self.umin)*self.index*self.per)) + 2
+
+        kwargs.setdefault("capstyle", "projecting")
+        self.artist = LineCollection([], **kwargs)
+        ax.add_collection(self.artist)
+        self.out = np.empty((M, 2, 2))
+
+    # Function to return interval of distance along crests, measured from
+    # points p, within which coordinate p + s d lies between lo and hi
+    def _interval(self, p, d, lo, hi):
+        if d == 0.:
+            inside = (p >= lo) & (p <= hi)
+            return np.where(inside, -np.inf, np.inf), np.where(inside, np.inf, -np.inf)
+        s1 = (lo - p)/d
+        s2 = (hi - p)/d
+        return np.minimum(s1, s2), np.maximum(s1, s2)
+
+    # Function to return crests at time t
+    def __call__(self, t):
+        M = len(self.out)
+        m = np.ceil(self.per*(self.index*self.umin - t)) + np.arange(M)
+        u = (m/self.per + t)/self.index
+
+        # Points on crests nearest origin, and direction along crests
+        px, py = u*self.c, u*self.s
+        dx, dy = -self.s, self.c
+
+        xl, xh, yl, yh = self.box
+        lox, hix = self._interval(px, dx, xl, xh)
+        loy, hiy = self._interval(py, dy, yl, yh)
+        lo = np.maximum(lox, loy)
+        hi = np.minimum(hix, hiy)
+        missed = lo >= hi
+        lo[missed] = np.nan
+        hi[missed] = np.nan
+
+        out = self.out
+        out[:, 0, 0] = px + lo*dx
+        out[:, 0, 1] = py + lo*dy
+        out[:, 1, 0] = px + hi*dx
+        out[:, 1, 1] = py + hi*dy
+        return out
+
+class CircularWavefronts(object):
+    """
+    Crests of circular wave spreading from origin, drawn in axes.
+
+    ax    - axes in which crests are drawn
+    width - function returning linewidth of crests at array of radii
+    rmin  - radius within which crests are not drawn
+    per   - crests per wavelength
+    step  - angular spacing of points on crests (radians)
+    Other keyword arguments are passed to line collection.
+
+    The line collection of crests is the artist. Calling wavefronts with
+    time t returns the crests, as array of segments, and their widths,
+    written into same arrays on every call. Crests are drawn out to
+    farthest corner of axes, whose limits must be set beforehand.
+    """
+
+    def __init__(self, ax, width, rmin=0.4, per=1., step=0.01, **kwargs):
+        self.width  = width
+        self.rmin   = float(rmin)
+        self.per    = float(per)
+        self.circle = unit_circle(step)
+
+        xl, xh = ax.get_xlim()
+        yl, yh = ax.get_ylim()
+        self.rmax = np.sqrt(max(xl*xl, xh*xh) + max(yl*yl, yh*yh))
+        M = int(np.floor((self.rmax - self.rmin)*self.per)) + 2
+
+        kwargs.setdefault("capstyle", "projecting")
+        self.artist = LineCollection([], **kwargs)
+        ax.add_collection(self.artist)
+        self.out    = np.empty((M, len(self.circle), 2))
+        self.widths = np.zeros(M)
+
+    # Function to return crests, and their widths, at time t
+    def __call__(self, t):
+        M = len(self.out)
+        m = np.floor(self.per*(self.rmin - t)) + 1. + np.arange(M)
+        r = m/self.per + t
+
+        # Crests beyond farthest corner become NaNs
+        seen = r < self.rmax
+        r[~seen] = np.nan
+        np.multiply(r[:, np.newaxis, np.newaxis], self.circle, out=self.out)
+        self.widths.fill(0.)
+        self.widths[seen] = self.width(r[seen])
+        return self.out, self.widths
@@ -0,0 +1,147 @@
+"""
+Tests of the kernels of phy315.kernels.
+
+Each NumPy kernel is checked against a direct evaluation of the same
+sum or lookup, written as the demos computed it before the kernels were
+introduced. If Numba is installed, each compiled kernel is checked
+against the same reference. Run with
+
+    python -m unittest discover -s tests
+"""
+
+import numpy as np
+import unittest
+import sys
+import os
+
+# Make shared phy315 package importable
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from phy315 import kernels
+
+# Function to return f(sqrt(x^2 + y^2)) on grid, by interpolation of whole
+# grid of radii at once (as membrane.circular_mode did)
+def radial_interp_reference(x, y, r, f):
+    R = np.sqrt(x[np.newaxis, :]**2 + y[:, np.newaxis]**2)
+    return np.interp(R, r, f)
+
+# Function to return sum over shifts s of f(|t - s|) (as
+# diffraction.two_star_profile did)
+def shifted_interp_reference(t, shifts, r, f):
+    Z = np.zeros(len(t))
+    for s in shifts:
+        Z += np.interp(np.abs(t - s), r, f)
+    return Z
+
+# Function to return sum over n of g_n exp(i sign a_n b_j), by one
+# matrix-vector product (as fourier._matrix_sum did, in one block)
+def exp_sum_reference(a, g, b, sign):
+    return np.dot(np.exp(1j*sign*np.outer(b, a)), g)
+
+# Function to return real and imaginary parts of sum over sources of
+# a_m exp(i (2 pi r_m - phi_m))/r_m^p, zero within rmin of any source,
+# one source at a time
+def source_sum_reference(x, y, sx, sy, a, phi, p, rmin):
+    U    = np.zeros((len(y), len(x)), dtype=complex)
+    near = np.zeros((len(y), len(x)), dtype=bool)
+    for m in range(len(sx)):
+        r = np.sqrt((x[np.newaxis, :] - sx[m])**2 + (y[:, np.newaxis] - sy[m])**2)
+        near |= r <= rmin
+        r = np.maximum(r, rmin)
+        U += a[m]*np.exp(1j*(2.*np.pi*r - phi[m]))/r**p
+    U[near] = 0.
+    return U.real, U.imag
+
+# Function to return arguments of each kernel, after output arrays, and
+# reference result
+def examples():
+    rng = np.random.RandomState(1)
+    r   = np.linspace(0., 2., 1001)
+    f   = np.cos(7.*r)*np.exp(-r)
+    x   = np.linspace(-1.5, 1.5, 61)
+    y   = np.linspace(-1.2, 1.2, 49)
+    t   = np.linspace(-3., 3., 301)
+    a   = np.sort(rng.uniform(-20., 20., 200))
+    g   = rng.normal(size=200) + 1j*rng.normal(size=200)
+
+    # Sources on grid points, and between them, so that some grid points
+    # lie on a source, some within rmin of one, and some just outside
+    sx  = np.array([0., 0.025, -0.5, 1.])
+    sy  = np.array([0., 0., 0.35, -1.2])
+    amp = np.array([1., 0.5, -0.25, 2.])
+    phi = np.array([0., 1., 2., 3.])
+
+    shifts = np.array([-0.5, 0.5, 0.7])
+    return {
+        'radial_interp':  ((x, y, r, f), (np.empty((len(y), len(x))),),
+                           radial_interp_reference(x, y, r, f)),
+        'shifted_interp': ((t, shifts, r, f), (np.empty(len(t)),),
+                           shifted_interp_reference(t, shifts, r, f)),
+        'exp_sum':        ((a, g, t, -1.), (np.empty(len(t), dtype=complex),),
+                           exp_sum_reference(a, g, t, -1.)),
+        'source_sum':     ((x, y, sx, sy, amp, phi, 0.5, 0.05),
+                           (np.empty((len(y), len(x))), np.empty((len(y), len(x)))),
+                           source_sum_reference(x, y, sx, sy, amp, phi, 0.5, 0.05)),
+    }
+
+class KernelTest(object):
+    """
+    Checks of every kernel of one implementation against references.
+    """
+
+    # Function to return implementation of named kernel
+    def kernel(self, name):
+        raise NotImplementedError
+
+    # Function to check named kernel against reference
+    def check(self, name):
+        args, outs, expected = examples()[name]
+        result = self.kernel(name)(*(args + outs))
+        if isinstance(expected, tuple):
+            for value, reference in zip(result, expected):
+                np.testing.assert_allclose(value, reference, rtol=1e-10, atol=1e-12)
+        else:
+            np.testing.assert_allclose(result, expected, rtol=1e-10, atol=1e-12)
+
+    def test_radial_interp(self):
+        self.check('radial_interp')
+
+    def test_shifted_interp(self):
+        self.check('shifted_interp')
+
+    def test_exp_sum(self):
+        self.check('exp_sum')
+
+    def test_source_sum(self):
+        self.check('source_sum')
+
+class NumPyKernelTest(KernelTest, unittest.TestCase):
+
+    def kernel(self, name):
+        return kernels._numpy[name]
+
+    # Blocks of rows smaller than whole grid, so that block boundaries are
+    # exercised
+    def setUp(self):
+        self.block = kernels.BLOCK
+        kernels.BLOCK = 500
+
+    def tearDown(self):
+        kernels.BLOCK = self.block
+
+    # Public functions take NumPy kernels when asked to
+    def test_public(self):
+        args, outs, expected = examples()['radial_interp']
+        np.testing.assert_allclose(kernels.radial_interp(*args, jit=False), expected,
+                                   rtol=1e-10, atol=1e-12)
+        args, outs, expected = examples()['source_sum']
+        for value, reference in zip(kernels.source_sum(*args, jit=False), expected):
+            np.testing.assert_allclose(value, reference, rtol=1e-10, atol=1e-12)
+
+@unittest.skipIf(kernels.numba is None, 'Numba not installed')
+class CompiledKernelTest(KernelTest, unittest.TestCase):
+
+    def kernel(self, name):
+        return kernels._compiled[name]
+
+if __name__ == '__main__':
+    unittest.main()